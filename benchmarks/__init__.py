@@ -0,0 +1 @@
+"""Performance benchmarks for sidelines (see suite.py). Run: python -m benchmarks run"""
@@ -0,0 +1,5 @@
+from .suite import main
+
+# Guarded: the suite spawns a process per case, which re-imports this module
+if __name__ == "__main__":
+    main()
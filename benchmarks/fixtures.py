@@ -0,0 +1,233 @@
+"""
+Synthetic nflverse-shaped fixtures for the benchmarks (no network access).
+
+Plays carry the pbp_store.PLAY_COLUMNS with plausible values: a chronological
+game clock, running post-play score totals, expected points and possession.
+Schedules carry the fields the schedule index and team queries read. Both are
+generated with a seeded NumPy generator, so every run sees the same data, and
+can be written out as a data_source fixture directory.
+"""
+
+import os
+
+import numpy as np
+import polars as pl
+
+from src.data_source import FixtureDataSource
+from src.utils import FRANCHISES
+
+WEEKS_PER_SEASON = 17
+PLAYS_PER_GAME = 170
+LAST_SEASON = 2023
+
+# Fixture sizes: number of seasons, and a cap on the games taken from them
+SIZES = {
+    "game": (1, 1),
+    "season": (1, None),
+    "decade": (10, None),
+}
+# Full seven-round mocks ingested into the draft store at each size
+MOCKS = {"game": 0, "season": 100, "decade": 2000}
+DRAFT_PICKS = 257
+DRAFT_PROSPECTS = 450
+POSITIONS = ["QB", "RB", "WR", "TE", "OT", "G", "C", "EDGE", "DT", "LB", "CB", "S"]
+
+
+def make_schedule(seasons, seed=0):
+    """
+    Returns a regular-season schedule for the given seasons: every week pairs
+    all 32 franchises at random, with final scores filled in.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {
+        name: []
+        for name in ("game_id", "season", "game_type", "week", "away_team", "home_team")
+    }
+    for season in seasons:
+        for week in range(1, WEEKS_PER_SEASON + 1):
+            teams = rng.permutation(FRANCHISES)
+            for away_team, home_team in zip(teams[::2], teams[1::2]):
+                columns["game_id"].append(f"{season}_{week:02d}_{away_team}_{home_team}")
+                columns["season"].append(season)
+                columns["game_type"].append("REG")
+                columns["week"].append(week)
+                columns["away_team"].append(str(away_team))
+                columns["home_team"].append(str(home_team))
+
+    n_games = len(columns["game_id"])
+    scores = rng.choice([0, 3, 7, 10, 13, 14, 17, 20, 21, 24, 27, 28, 31, 35], size=(2, n_games))
+    return pl.DataFrame(columns).with_columns(
+        pl.Series("away_score", scores[0]), pl.Series("home_score", scores[1])
+    )
+
+
+def make_plays(schedule, plays_per_game=PLAYS_PER_GAME, seed=0):
+    """
+    Returns the plays of every game in the schedule, in feed (chronological)
+    order, with total_home_score/total_away_score ending at the final scores.
+    """
+    rng = np.random.default_rng(seed)
+    n_games = len(schedule)
+    shape = (n_games, plays_per_game)
+
+    # Evenly spread, strictly increasing game clock per game
+    elapsed = np.sort(rng.uniform(0, 3599, size=shape), axis=1).round()
+    qtr = np.minimum(elapsed // 900 + 1, 4)
+    quarter_remaining = qtr * 900 - elapsed
+
+    # Score on random plays so the running totals land on the final scores
+    def running_totals(final_scores):
+        points = np.zeros(shape)
+        scoring_plays = rng.integers(0, plays_per_game, size=n_games)
+        points[np.arange(n_games), scoring_plays] = final_scores
+        return np.cumsum(points, axis=1)
+
+    home_teams = np.repeat(schedule["home_team"].to_numpy(), plays_per_game)
+    away_teams = np.repeat(schedule["away_team"].to_numpy(), plays_per_game)
+    on_home = rng.random(n_games * plays_per_game) < 0.5
+    posteam = np.where(on_home, home_teams, away_teams).astype(object)
+    posteam[rng.random(len(posteam)) < 0.03] = None  # Timeouts and other no-possession rows
+
+    plays = pl.DataFrame(
+        {
+            "game_id": np.repeat(schedule["game_id"].to_numpy(), plays_per_game),
+            "play_id": np.tile(np.arange(1, plays_per_game + 1) * 25, n_games).astype(float),
+            "home_team": home_teams,
+            "away_team": away_teams,
+            "qtr": qtr.ravel(),
+            "game_seconds_remaining": 3600 - elapsed.ravel(),
+            "quarter_seconds_remaining": quarter_remaining.ravel(),
+            "ep": rng.normal(1.5, 2.0, size=n_games * plays_per_game),
+            "epa": rng.normal(0.0, 1.2, size=n_games * plays_per_game),
+            "posteam": pl.Series(posteam.tolist(), dtype=pl.String),
+            "down": rng.integers(1, 5, size=n_games * plays_per_game).astype(float),
+            "ydstogo": rng.integers(1, 16, size=n_games * plays_per_game).astype(float),
+            "yrdln": rng.integers(1, 50, size=n_games * plays_per_game).astype(str),
+            "total_home_score": running_totals(schedule["home_score"].to_numpy()).ravel(),
+            "total_away_score": running_totals(schedule["away_score"].to_numpy()).ravel(),
+        }
+    )
+    return plays.with_columns(
+        yrdln=pl.col("posteam").fill_null("MID") + pl.lit(" ") + pl.col("yrdln"),
+        desc=pl.lit("(") + pl.col("qtr").cast(pl.Int64).cast(pl.String) + pl.lit(") ")
+        + pl.col("posteam").fill_null("No team") + pl.lit(" play ")
+        + pl.col("play_id").cast(pl.Int64).cast(pl.String),
+    )
+
+
+def make_sim_plays(games=4, plays_per_game=130, seed=0):
+    """
+    Returns KC-DET plays with the columns the simulator's transition model is
+    built from (see simulation.build_transition_model).
+    """
+    rng = np.random.default_rng(seed)
+    n = games * plays_per_game
+    play_type = rng.choice(["run", "pass", "punt", "field_goal"], n, p=[0.45, 0.45, 0.06, 0.04])
+    return pl.DataFrame(
+        {
+            "game_id": np.repeat([f"2023_{g:02d}_DET_KC" for g in range(games)], plays_per_game),
+            "play_type": play_type,
+            "posteam": rng.choice(["KC", "DET"], n),
+            "down": rng.integers(1, 5, n).astype(float),
+            "yards_gained": rng.integers(-3, 13, n).astype(float),
+            "interception": (rng.random(n) < 0.02).astype(float),
+            "fumble_lost": (rng.random(n) < 0.01).astype(float),
+            "kick_distance": np.where(play_type == "punt", 45.0, np.where(play_type == "field_goal", 40.0, np.nan)),
+            "field_goal_result": np.where(play_type == "field_goal", "made", None),
+            "game_seconds_remaining": np.tile(np.linspace(3600, 0, plays_per_game), games),
+        }
+    )
+
+
+def make_mocks(n_mocks, picks=DRAFT_PICKS, seed=0):
+    """
+    Returns (registry, picks frame) for n_mocks synthetic full mocks: each
+    drafts the prospects in a noisy version of one shared ranking, and about
+    one pick in ten goes to a team other than its default owner.
+    """
+    rng = np.random.default_rng(seed)
+    source_ids = [f"SYN_{i:05d}" for i in range(n_mocks)]
+    registry = {
+        source_id: {
+            "source": "Synthetic",
+            "author": f"Expert {i}",
+            "version": "Mock 1.0",
+            "date": f"2026-{3 + i % 2:02d}-{1 + i % 28:02d}",
+            "context": "Benchmark",
+            "url": f"https://example.com/{source_id}",
+            "last_checked": "2026-04-01",
+        }
+        for i, source_id in enumerate(source_ids)
+    }
+
+    noisy_rank = np.arange(DRAFT_PROSPECTS) + rng.normal(0, 12, size=(n_mocks, DRAFT_PROSPECTS))
+    drafted = np.argsort(noisy_rank, axis=1)[:, :picks]
+    pick_numbers = np.tile(np.arange(1, picks + 1), n_mocks)
+    teams = np.array(FRANCHISES)[(pick_numbers - 1) % len(FRANCHISES)]
+    traded = rng.random(len(teams)) < 0.1
+    teams[traded] = rng.choice(FRANCHISES, size=traded.sum())
+
+    frame = pl.DataFrame(
+        {
+            "pick": pick_numbers,
+            "team": teams,
+            "player": np.char.add("Prospect ", drafted.ravel().astype(str)),
+            "source_id": np.repeat(source_ids, picks),
+            "position": np.array(POSITIONS)[drafted.ravel() % len(POSITIONS)],
+        }
+    )
+    return registry, frame
+
+
+def make_fixture(size, seed=0):
+    """
+    Returns the fixture of a size in SIZES as a dict: its seasons, schedule
+    (every game of those seasons), plays (only the selected games) and mocks
+    (registry and picks, see make_mocks).
+    """
+    n_seasons, max_games = SIZES[size]
+    seasons = list(range(LAST_SEASON - n_seasons + 1, LAST_SEASON + 1))
+    schedule = make_schedule(seasons, seed)
+    games = schedule.head(max_games) if max_games else schedule
+    return {
+        "size": size,
+        "seasons": seasons,
+        "schedule": schedule,
+        "plays": make_plays(games, seed=seed),
+        "mocks": make_mocks(MOCKS[size], seed=seed),
+    }
+
+
+def write_fixture_dir(fixture, root):
+    """
+    Writes a fixture in the data_source fixture layout under root and returns
+    a FixtureDataSource serving it.
+    """
+    source = FixtureDataSource(root)
+    for kind, frame in (("schedules", fixture["schedule"]), ("pbp", fixture["plays"])):
+        for season in fixture["seasons"]:
+            path = source._season_path(kind, season)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            frame.filter(pl.col("game_id").str.starts_with(f"{season}_")).write_parquet(path)
+
+    pl.DataFrame(
+        {"team_abbr": FRANCHISES, "team_name": FRANCHISES, "team_color": ["#000000"] * len(FRANCHISES)}
+    ).write_parquet(os.path.join(root, "teams.parquet"))
+    return source
+
+
+def read_fixture_dir(size, root):
+    """
+    Reads back a fixture written by write_fixture_dir: its seasons, schedule
+    and plays (mocks live in the draft store, not the fixture directory).
+    """
+    n_seasons, _ = SIZES[size]
+    seasons = list(range(LAST_SEASON - n_seasons + 1, LAST_SEASON + 1))
+    source = FixtureDataSource(root)
+    return {
+        "size": size,
+        "seasons": seasons,
+        "schedule": source.load_schedules(seasons),
+        "plays": source.load_pbp(seasons),
+        "mocks": None,
+    }
@@ -0,0 +1,439 @@
+"""
+Benchmarks of the data-load, transform and render hot paths.
+
+Each case runs against the synthetic fixtures (see fixtures.SIZES) in a fresh
+spawned process, and records wall time over several repeats plus how far one
+run raises the resident set size above its level after setup, sampled from
+/proc/self/statm while the case runs. Unlike tracemalloc, RSS includes the
+buffers Polars allocates natively. The peak is taken on the first run after
+setup, so it includes one-time costs such as lazily imported modules.
+
+Results are written as JSON, and two result files (e.g. from two commits) can
+be compared to flag regressions above a threshold. A few cases also carry an
+absolute wall-time and memory budget (see BUDGETS), checked with
+--check-budgets:
+
+    python -m benchmarks run --check-budgets -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json --threshold 0.10
+"""
+
+import argparse
+import contextlib
+import datetime
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import polars as pl
+
+from src import data_source, draft_consensus, schedule_index
+from src.expected_points import derive_expected_scores
+from src.game_analysis import analyze_games
+from src.mock_draft_data import add_mocks, get_draft_dataframe, load_draft_picks
+from src.play_by_play import display_play_by_play
+from src.plot_mocks import create_draft_heatmap
+from src.score_over_time import get_sorted_plays, to_plot_frame
+from src.simulation import HOME, build_transition_model, simulate_games
+from src.team_games import fetch_team_games
+from src.utils import CACHE_DIR_ENV
+
+from .fixtures import (
+    SIZES,
+    make_fixture,
+    make_mocks,
+    make_sim_plays,
+    read_fixture_dir,
+    write_fixture_dir,
+)
+
+DEFAULT_REPEAT = {"game": 20, "season": 5, "decade": 3}
+DEFAULT_THRESHOLD = 0.10
+# Differences below these are treated as noise when comparing
+MIN_SECONDS = 0.001
+MIN_BYTES = 64 * 1024
+RSS_SAMPLE_SECONDS = 0.001
+# Ceilings checked by `run --check-budgets`, per case and metric
+BUDGETS = {
+    # A season of plays derived as one frame (~46k rows)
+    "derive_expected_scores/season": {"wall_median_s": 1.0, "peak_rss_bytes": 16 * 2**20},
+    # A whole `sidelines find` process on a cached schedule, imports dominated by polars
+    "cli_find_import/game": {"wall_median_s": 1.5},
+    # `sidelines sim` with 10,000 iterations in one process
+    "simulate_games/season": {"wall_median_s": 5.0, "peak_rss_bytes": 32 * 2**20},
+}
+SIM_ITERATIONS = 10_000
+BENCHMARK_TEAM = "KC"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bench_sort_plays(fixture):
+    plays = fixture["plays"]
+    return lambda: get_sorted_plays(plays)
+
+
+def bench_expected_scores(fixture):
+    # plot_scores' path: pandas conversion, then the per-game derivation
+    plays = get_sorted_plays(fixture["plays"])
+    schedule_rows = {row["game_id"]: row for row in fixture["schedule"].to_dicts()}
+    return lambda: analyze_games(to_plot_frame(plays), schedule_rows)
+
+
+def bench_derive_expected_scores(fixture):
+    frame = to_plot_frame(get_sorted_plays(fixture["plays"]))
+    return lambda: derive_expected_scores(frame, BENCHMARK_TEAM, "DET")
+
+
+def bench_simulate_games(fixture):
+    model = build_transition_model(make_sim_plays(), BENCHMARK_TEAM, "DET")
+    return lambda: simulate_games(model, HOME, SIM_ITERATIONS, seed=1)
+
+
+def bench_display_play_by_play(fixture):
+    plays = fixture["plays"]
+
+    def run():
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                display_play_by_play(plays)
+
+    return run
+
+
+def bench_fetch_team_games(fixture):
+    seasons = fixture["seasons"]
+
+    def run():
+        # Measure a cold process: schedules come from the on-disk cache
+        schedule_index.clear_cache()
+        return fetch_team_games(seasons[0], BENCHMARK_TEAM, seasons[-1])
+
+    return run
+
+
+def bench_cli_find_import(fixture):
+    # CLI startup: the schedules are in the on-disk cache (CACHE_DIR_ENV is inherited).
+    # The child's memory is not part of this process's RSS, so only the time is budgeted.
+    command = [sys.executable, "-m", "src", "find", BENCHMARK_TEAM, str(fixture["seasons"][-1])]
+    return lambda: subprocess.run(command, cwd=REPO_ROOT, capture_output=True, check=True)
+
+
+def bench_draft_dataframe(fixture):
+    return get_draft_dataframe
+
+
+def bench_consensus_build(fixture):
+    return lambda: draft_consensus.ConsensusTable.from_picks(load_draft_picks())
+
+
+def bench_consensus_ingest(fixture):
+    # Draft-season path: one new mock lands on an already materialized table
+    registry, picks = make_mocks(1, seed=1)
+    registry = {"SYN_INGEST": registry.pop("SYN_00000")}
+    picks = picks.with_columns(source_id=pl.lit("SYN_INGEST"))
+    draft_consensus._CONSENSUS = None
+    draft_consensus.get_consensus_table()
+    return lambda: draft_consensus.ingest_mocks(registry, picks)
+
+
+def bench_draft_heatmap(fixture):
+    # Board rendering on the materialized table (built on first use, outside the timing)
+    draft_consensus._CONSENSUS = None
+    draft_consensus.get_consensus_table()
+    return create_draft_heatmap
+
+
+# name -> (factory returning the timed callable, sizes it runs at)
+CASES = {
+    "sort_plays": (bench_sort_plays, list(SIZES)),
+    "expected_scores": (bench_expected_scores, list(SIZES)),
+    "derive_expected_scores": (bench_derive_expected_scores, ["season"]),
+    "simulate_games": (bench_simulate_games, ["season"]),
+    "display_play_by_play": (bench_display_play_by_play, list(SIZES)),
+    "fetch_team_games": (bench_fetch_team_games, list(SIZES)),
+    "cli_find_import": (bench_cli_find_import, ["game"]),
+    "draft_dataframe": (bench_draft_dataframe, list(SIZES)),
+    "consensus_build": (bench_consensus_build, list(SIZES)),
+    "consensus_ingest": (bench_consensus_ingest, list(SIZES)),
+    "draft_heatmap": (bench_draft_heatmap, list(SIZES)),
+}
+
+
+def max_rss_bytes():
+    """Returns the peak resident set size of this process so far, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss_bytes():
+    """Returns the current resident set size of this process in bytes, or None without /proc."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def peak_rss_above_baseline(func):
+    """
+    Runs func once and returns how far the RSS rose above its level before the
+    call, sampled every RSS_SAMPLE_SECONDS in a background thread. ru_maxrss
+    alone cannot tell this apart from what setup (e.g. the fixture reads)
+    already used, so it is only the fallback where /proc is unavailable.
+    """
+    gc.collect()
+    baseline = current_rss_bytes()
+    if baseline is None:
+        baseline = max_rss_bytes()
+        func()
+        return max(max_rss_bytes() - baseline, 0)
+
+    peak = baseline
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(RSS_SAMPLE_SECONDS):
+            peak = max(peak, current_rss_bytes())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        func()
+    finally:
+        done.set()
+        sampler.join()
+    return max(peak, current_rss_bytes()) - baseline
+
+
+def measure(func, repeat):
+    """
+    Runs func once to measure how far it raises the RSS above the usage after
+    setup (see peak_rss_above_baseline), then times it over repeat runs.
+    Returns wall_min_s, wall_median_s and peak_rss_bytes.
+    """
+    peak = peak_rss_above_baseline(func)
+
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "repeat": repeat,
+        "wall_min_s": min(timings),
+        "wall_median_s": statistics.median(timings),
+        "peak_rss_bytes": peak,
+    }
+
+
+def run_case(name, size, fixture_dir, cache_dir, repeat):
+    """
+    Measures one case against a fixture directory and a populated cache
+    directory (see run_suite). Meant to run in its own process.
+    """
+    os.environ[CACHE_DIR_ENV] = cache_dir
+    data_source.set_data_source(data_source.FixtureDataSource(fixture_dir))
+    fixture = read_fixture_dir(size, fixture_dir)
+    factory, _ = CASES[name]
+    return measure(factory(fixture), repeat)
+
+
+def _run_case_in_subprocess(*args):
+    # Spawned, not forked: each case starts from a clean interpreter and Polars'
+    # thread pool does not survive fork
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(run_case, *args).result()
+
+
+def get_commit():
+    """Returns the current git commit (short hash), or None outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes=None, cases=None, repeat=None, quiet=False):
+    """
+    Runs the selected cases at the selected sizes (all by default) against a
+    temporary cache directory, with the synthetic fixtures served by the
+    fixture data source. Each case runs in its own spawned process so its peak
+    RSS is not masked by earlier cases. Returns the results document (see main).
+    """
+    sizes = sizes or list(SIZES)
+    cases = cases or list(CASES)
+    results = {}
+
+    previous_cache_dir = os.environ.get(CACHE_DIR_ENV)
+    previous_source = data_source.get_data_source()
+    with tempfile.TemporaryDirectory() as work_dir:
+        cache_dir = os.path.join(work_dir, "cache")
+        os.environ[CACHE_DIR_ENV] = cache_dir
+        try:
+            for size in sizes:
+                fixture = make_fixture(size)
+                fixture_dir = os.path.join(work_dir, "fixtures", size)
+                data_source.set_data_source(write_fixture_dir(fixture, fixture_dir))
+                # Populate the on-disk schedule cache and draft store the cases read from
+                schedule_index.load_seasons(fixture["seasons"])
+                if fixture["mocks"][0]:
+                    add_mocks(*fixture["mocks"])
+                for name in cases:
+                    _, case_sizes = CASES[name]
+                    if size not in case_sizes:
+                        continue
+                    result = _run_case_in_subprocess(
+                        name, size, fixture_dir, cache_dir, repeat or DEFAULT_REPEAT[size]
+                    )
+                    result.update(case=name, size=size, rows=len(fixture["plays"]))
+                    results[f"{name}/{size}"] = result
+                    if not quiet:
+                        print(format_result(f"{name}/{size}", result))
+        finally:
+            schedule_index.clear_cache()
+            data_source.set_data_source(previous_source)
+            if previous_cache_dir is None:
+                os.environ.pop(CACHE_DIR_ENV, None)
+            else:
+                os.environ[CACHE_DIR_ENV] = previous_cache_dir
+
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def format_result(key, result):
+    return (
+        f"{key:<30} median {result['wall_median_s'] * 1000:>10.2f} ms   "
+        f"min {result['wall_min_s'] * 1000:>10.2f} ms   "
+        f"peak RSS +{result['peak_rss_bytes'] / 2**20:>8.2f} MiB"
+    )
+
+
+def check_budgets(document, budgets=None):
+    """
+    Returns (key, metric, value, budget) for every metric of a result in
+    document that exceeds its budget (BUDGETS by default).
+    """
+    budgets = BUDGETS if budgets is None else budgets
+    return [
+        (key, metric, result[metric], budget)
+        for key, result in document["results"].items()
+        for metric, budget in budgets.get(key, {}).items()
+        if metric in result and result[metric] > budget
+    ]
+
+
+def compare_results(base, head, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares two results documents. Returns a list of (key, metric, base value,
+    head value, relative change) for every metric that grew by more than
+    threshold, ignoring differences below MIN_SECONDS / MIN_BYTES and metrics
+    missing from either document (e.g. results recorded before a metric existed).
+    """
+    regressions = []
+    for key, head_result in head["results"].items():
+        base_result = base["results"].get(key)
+        if base_result is None:
+            continue
+        for metric, noise in (("wall_median_s", MIN_SECONDS), ("peak_rss_bytes", MIN_BYTES)):
+            if metric not in base_result or metric not in head_result:
+                continue
+            before, after = base_result[metric], head_result[metric]
+            if after - before <= noise:
+                continue
+            change = (after - before) / before if before else float("inf")
+            if change > threshold:
+                regressions.append((key, metric, before, after, change))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Main function
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the sidelines hot paths."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "--sizes", nargs="+", choices=list(SIZES), help="Fixture sizes to run (default: all)."
+    )
+    run_parser.add_argument(
+        "--cases", nargs="+", choices=list(CASES), help="Cases to run (default: all)."
+    )
+    run_parser.add_argument(
+        "-r", "--repeat", type=int, help="Timed runs per case (default depends on the size)."
+    )
+    run_parser.add_argument("-o", "--output", help="Path to write the JSON results to.")
+    run_parser.add_argument(
+        "--check-budgets",
+        action="store_true",
+        help="Exit with status 1 if a case exceeds its time or memory budget in BUDGETS.",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two result files and flag regressions."
+    )
+    compare_parser.add_argument("base", help="Results of the baseline (e.g. the previous commit).")
+    compare_parser.add_argument("head", help="Results to check.")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative increase reported as a regression (default: 0.10).",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        document = run_suite(args.sizes, args.cases, args.repeat)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+            print(f"Results saved to {args.output}")
+        if args.check_budgets:
+            over = check_budgets(document)
+            for key, metric, value, budget in over:
+                print(f"OVER BUDGET {key} {metric}: {value:.6g} > {budget:.6g}")
+            if over:
+                sys.exit(1)
+        return
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.head, encoding="utf-8") as f:
+        head = json.load(f)
+
+    regressions = compare_results(base, head, args.threshold)
+    print(f"Comparing {base.get('commit') or args.base} -> {head.get('commit') or args.head}")
+    for key, metric, before, after, change in regressions:
+        print(f"REGRESSION {key} {metric}: {before:.6g} -> {after:.6g} (+{change:.0%})")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions above {args.threshold:.0%}.")
@@ -0,0 +1,249 @@
+"""
+Unified `sidelines` command line (see FUTURE_CLI.md): find, view and sim.
+
+Only argparse and the standard library are imported at startup. Each
+subcommand imports the modules it needs when it runs, so `sidelines find`
+never loads pandas, Matplotlib or nflreadpy (when the schedule is cached).
+
+Run as: python -m src <subcommand> ...
+"""
+
+import argparse
+import json
+import sys
+
+FORMATS = ["text", "plot", "json", "csv"]
+
+
+def _unsupported(command, output_format):
+    print(f"Format '{output_format}' is not supported by '{command}' yet.")
+    return False
+
+
+def _week_range(value):
+    """Parses a week filter: "5" or an inclusive range "1-9"."""
+    first, _, last = value.partition("-")
+    try:
+        return int(first), int(last or first)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"invalid week range: {value!r} (expected e.g. 1-9)") from err
+
+
+def positive_int(value):
+    """Parses a count that must be at least 1 (e.g. the number of simulations)."""
+    try:
+        number = int(value)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from err
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def run_find(args):
+    """Lists a team's (franchise's) games in a season or range of seasons."""
+    if args.format == "plot":
+        return _unsupported("find", args.format)
+
+    from .team_games import display_query_results, get_season_label, query_team_games
+
+    team_abbr = args.team.upper()
+    try:
+        results = query_team_games(
+            team_abbr,
+            range(args.season, (args.last_season or args.season) + 1),
+            weeks=args.weeks,
+            side=args.side,
+            result=args.result,
+            min_margin=args.min_margin,
+            max_margin=args.max_margin,
+            game_type=args.game_type.upper() if args.game_type else None,
+        )
+    except Exception as e:
+        print(f"Error fetching data: {e}")
+        return False
+
+    if args.format == "text":
+        display_query_results(results, get_season_label(args.season, args.last_season), team_abbr)
+    elif args.format == "json":
+        print(json.dumps(results.to_dicts()))
+    else:
+        results.write_csv(sys.stdout)
+    return True
+
+
+def run_view(args):
+    """
+    Shows what happened in a historical game: play-by-play text or CSV, the
+    graph, or the JSON analysis. A season in place of the game ID exports every
+    play of that season (text, JSON Lines or CSV).
+    """
+    if args.game_id.isdigit() or args.format in ("text", "csv"):
+        if args.format == "plot":
+            return _unsupported("view <season>", args.format)
+
+        from .play_by_play import export_play_by_play, get_play_by_play, get_season_play_by_play
+
+        # Progress messages would corrupt JSON/CSV written to stdout
+        quiet = args.format != "text" and args.output is None
+        if args.game_id.isdigit():
+            play_data = get_season_play_by_play(int(args.game_id))
+        else:
+            play_data = get_play_by_play(args.game_id, quiet=quiet)
+        if play_data is None:
+            return False
+        export_play_by_play(play_data, args.format, args.output)
+        return True
+
+    from .score_over_time import view_game
+
+    return view_game(args.game_id, args.format, args.output, args.debug)
+
+
+def run_sim(args):
+    """Simulates a historical game with the Monte Carlo engine."""
+    if args.format not in ("text", "json"):
+        return _unsupported("sim", args.format)
+
+    from .simulation import simulate_game
+
+    return simulate_game(
+        args.game_id,
+        iterations=args.iterations,
+        seed=args.seed,
+        workers=args.workers,
+        use_table=args.transition_table,
+        inspect=args.inspect,
+        output_format=args.format,
+    )
+
+
+def build_parser():
+    """Builds the argument parser of the sidelines command."""
+    # Global flags, accepted after any subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "-f", "--format", choices=FORMATS, default="text", help="Output format (default: text)."
+    )
+    common.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging to investigate data distribution, and print span "
+        + "timings of each stage as JSON lines on stderr.",
+    )
+    common.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write span timings to FILE (implies --debug timings): a Chrome trace if "
+        + "FILE ends in .json, JSON lines otherwise.",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="sidelines", description="NFL statistics and game simulation."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    find_parser = subparsers.add_parser(
+        "find", parents=[common], help="List the games of a team in a season."
+    )
+    find_parser.add_argument("team", type=str, help="The 3-letter team abbreviation (e.g., KC)")
+    find_parser.add_argument("season", type=int, help="The season year (e.g., 2023)")
+    find_parser.add_argument(
+        "last_season",
+        type=int,
+        nargs="?",
+        help="Optional last season, to list every season from season through it",
+    )
+    find_parser.add_argument(
+        "--weeks", type=_week_range, metavar="FIRST-LAST", help="Only these weeks (e.g., 1-9)."
+    )
+    find_parser.add_argument(
+        "--side", choices=["home", "away"], help="Only home or only away games."
+    )
+    find_parser.add_argument(
+        "--result", choices=["W", "L", "T"], help="Only wins, losses or ties."
+    )
+    find_parser.add_argument(
+        "--min-margin", type=int, help="Only games decided by at least this many points."
+    )
+    find_parser.add_argument(
+        "--max-margin",
+        type=int,
+        help="Only games decided by at most this many points (8 for one-score games).",
+    )
+    find_parser.add_argument(
+        "--game-type", type=str, help="Only games of this type (e.g., REG or POST)."
+    )
+    find_parser.set_defaults(handler=run_find)
+
+    view_parser = subparsers.add_parser(
+        "view", parents=[common], help="View what happened in a historical game."
+    )
+    view_parser.add_argument(
+        "game_id",
+        type=str,
+        help="The nflverse game ID (e.g., 2023_01_DET_KC), or a season (e.g., 2023) "
+        + "to export every play of it.",
+    )
+    view_parser.add_argument(
+        "-o",
+        "--output",
+        help="Path to save the output to (graph, JSON or play-by-play export).",
+    )
+    view_parser.set_defaults(handler=run_view)
+
+    sim_parser = subparsers.add_parser(
+        "sim", parents=[common], help="Simulate a historical game many times."
+    )
+    sim_parser.add_argument("game_id", type=str, help="The nflverse game ID (e.g., 2023_01_DET_KC).")
+    sim_parser.add_argument(
+        "-n", "--iterations", type=positive_int, default=100, help="Number of simulations to run."
+    )
+    sim_parser.add_argument("--seed", type=int, help="Random seed for reproducibility.")
+    sim_parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to run shards on (0 uses every core).",
+    )
+    sim_parser.add_argument(
+        "--transition-table",
+        action="store_true",
+        help="Sample run/pass outcomes from the prebuilt transition table.",
+    )
+    sim_parser.add_argument(
+        "--inspect",
+        type=int,
+        metavar="INDEX",
+        help="Replay and display the play-by-play of a single iteration.",
+    )
+    sim_parser.set_defaults(handler=run_sim)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Main function
+    """
+    args = build_parser().parse_args(argv)
+
+    if not (args.debug or args.trace):
+        succeeded = args.handler(args)
+    else:
+        from . import tracing
+
+        tracing.enable(args.trace)
+        try:
+            with tracing.span(args.command):
+                succeeded = args.handler(args)
+        finally:
+            tracing.disable()
+
+    if not succeeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Pluggable source of raw nflverse data: play-by-play, schedules and teams.
+
+The schedule index, the play-by-play store and the team registry fetch through
+get_data_source() instead of calling nflreadpy directly, so the backend can be
+swapped without touching the code that uses the data:
+
+- "nflreadpy" (the default) downloads from nflverse.
+- "fixtures" serves Parquet snapshots recorded from nflreadpy, with the same
+  schema, from a local directory. Tests, benchmarks and air-gapped batch jobs
+  then run deterministically and offline:
+
+    <fixture_dir>/pbp/season=2023.parquet
+    <fixture_dir>/schedules/season=2023.parquet
+    <fixture_dir>/teams.parquet
+
+Select the backend with SIDELINES_DATA_SOURCE=fixtures and
+SIDELINES_FIXTURE_DIR=<dir>, or with set_data_source(). Record fixtures with:
+
+    python -m src.data_source 2022 2023 -o fixtures/
+"""
+
+import argparse
+import os
+
+import polars as pl
+
+DATA_SOURCE_ENV = "SIDELINES_DATA_SOURCE"
+FIXTURE_DIR_ENV = "SIDELINES_FIXTURE_DIR"
+
+_DATA_SOURCE = None  # The configured backend; resolved from the environment on first use
+
+
+class NflreadpyDataSource:
+    """Loads data from nflverse through nflreadpy."""
+
+    name = "nflreadpy"
+
+    # nflreadpy is imported on every call rather than at import time: it is slow
+    # to import and only needed when local caches miss
+    def load_pbp(self, seasons):
+        import nflreadpy
+
+        return nflreadpy.load_pbp(seasons=list(seasons))
+
+    def load_schedules(self, seasons):
+        import nflreadpy
+
+        return nflreadpy.load_schedules(seasons=list(seasons))
+
+    def load_teams(self):
+        import nflreadpy
+
+        return nflreadpy.load_teams()
+
+
+class FixtureDataSource:
+    """Serves recorded Parquet snapshots from a local directory (see record_fixtures)."""
+
+    name = "fixtures"
+
+    def __init__(self, root):
+        self.root = root
+
+    def _season_path(self, kind, season):
+        return os.path.join(self.root, kind, f"season={int(season)}.parquet")
+
+    def _load_seasons(self, kind, seasons):
+        frames = []
+        for season in seasons:
+            path = self._season_path(kind, season)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"No recorded {kind} for season {season} in {self.root}")
+            frames.append(pl.read_parquet(path))
+        if not frames:
+            return pl.DataFrame()
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def load_pbp(self, seasons):
+        return self._load_seasons("pbp", seasons)
+
+    def load_schedules(self, seasons):
+        return self._load_seasons("schedules", seasons)
+
+    def load_teams(self):
+        path = os.path.join(self.root, "teams.parquet")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No recorded teams in {self.root}")
+        return pl.read_parquet(path)
+
+
+def _from_environment():
+    name = os.environ.get(DATA_SOURCE_ENV) or NflreadpyDataSource.name
+    if name == NflreadpyDataSource.name:
+        return NflreadpyDataSource()
+    if name == FixtureDataSource.name:
+        root = os.environ.get(FIXTURE_DIR_ENV)
+        if not root:
+            raise ValueError(f"{DATA_SOURCE_ENV}=fixtures requires {FIXTURE_DIR_ENV} to be set")
+        return FixtureDataSource(root)
+    raise ValueError(f"Unknown data source '{name}' (expected nflreadpy or fixtures)")
+
+
+def get_data_source():
+    """Returns the configured data source, reading the environment on first use."""
+    global _DATA_SOURCE
+    if _DATA_SOURCE is None:
+        _DATA_SOURCE = _from_environment()
+    return _DATA_SOURCE
+
+
+def set_data_source(source):
+    """
+    Makes source (a NflreadpyDataSource, a FixtureDataSource or any object with
+    the same load methods) the process-wide data source. None goes back to the
+    environment's choice. Returns the previous source.
+    """
+    global _DATA_SOURCE
+    previous, _DATA_SOURCE = _DATA_SOURCE, source
+    return previous
+
+
+def _write_parquet(frame, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    frame.write_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def record_fixtures(seasons, root, source=None, pbp=True):
+    """
+    Records the schedules (and, unless pbp=False, play-by-play) of the given
+    seasons plus the teams table from source (nflreadpy by default) into a
+    fixture directory, one Parquet file per season.
+    """
+    source = source or NflreadpyDataSource()
+    fixtures = FixtureDataSource(root)
+    for season in seasons:
+        _write_parquet(source.load_schedules([season]), fixtures._season_path("schedules", season))
+        if pbp:
+            _write_parquet(source.load_pbp([season]), fixtures._season_path("pbp", season))
+    _write_parquet(source.load_teams(), os.path.join(root, "teams.parquet"))
+
+
+def main():
+    """
+    Main function
+    """
+    parser = argparse.ArgumentParser(
+        description="Record nflverse data as Parquet fixtures for offline runs."
+    )
+    parser.add_argument("seasons", type=int, nargs="+", help="The seasons to record (e.g., 2023)")
+    parser.add_argument(
+        "-o", "--output-dir", required=True, help="Fixture directory to write to."
+    )
+    parser.add_argument(
+        "--no-pbp",
+        action="store_true",
+        help="Record only schedules and teams (play-by-play is large).",
+    )
+
+    args = parser.parse_args()
+    record_fixtures(args.seasons, args.output_dir, pbp=not args.no_pbp)
+    print(f"Recorded {len(args.seasons)} seasons to {args.output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Materialized consensus table of the mock draft board.
+
+For every (pick, team, player) cell it keeps the number of experts projecting
+it and their date-sorted "author (date)" entries, and for every player a
+running median of the slots they are mocked at. The table is built from all
+mocks once per process; after that, ingesting or replacing a mock updates only
+that mock's cells and the medians of its players instead of regrouping the
+whole dataset.
+"""
+
+import bisect
+import heapq
+from collections import Counter
+
+import pandas as pd
+import polars as pl
+
+from .mock_draft_data import add_mocks, load_draft_picks, with_trades
+
+CELL_COLUMNS = [
+    "pick",
+    "team",
+    "player",
+    "position",
+    "is_trade",
+    "default_team",
+    "consensus_count",
+    "expert_info",
+]
+
+_CONSENSUS = None  # The process-wide ConsensusTable, built on first use
+
+
+class RunningMedian:
+    """
+    Streaming median of a multiset of numbers: a max-heap of the lower half and
+    a min-heap of the upper half. Removals are lazy, so adding or removing a
+    value costs O(log n) and reading the median is O(1) (amortized).
+    """
+
+    def __init__(self, sorted_values=()):
+        sorted_values = list(sorted_values)
+        half = (len(sorted_values) + 1) // 2
+        # A descending list of negated values is already a valid min-heap
+        self._low = [-v for v in reversed(sorted_values[:half])]
+        self._high = sorted_values[half:]
+        self._low_size = half
+        self._high_size = len(sorted_values) - half
+        self._removed = Counter()
+
+    def __len__(self):
+        return self._low_size + self._high_size
+
+    def _prune(self, heap, sign):
+        while heap and self._removed[sign * heap[0]]:
+            self._removed[sign * heap[0]] -= 1
+            heapq.heappop(heap)
+
+    def _rebalance(self):
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._low_size += 1
+            self._high_size -= 1
+        self._prune(self._low, -1)
+        self._prune(self._high, 1)
+
+    def add(self, value):
+        if self._low_size == 0 or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, value):
+        """Removes one occurrence of value, which must have been added."""
+        self._removed[value] += 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            self._prune(self._high, 1)
+        self._rebalance()
+
+    def median(self):
+        """The median (the mean of the middle two for an even count), or None if empty."""
+        if not self:  # Empty by __len__
+            return None
+        if self._low_size > self._high_size:
+            return float(-self._low[0])
+        return (-self._low[0] + self._high[0]) / 2
+
+
+def _expert_label(author, date, is_trade):
+    return f"{author} ({date}){' - TRADE' if is_trade else ''}"
+
+
+class ConsensusTable:
+    """
+    The consensus of a set of mocks, updatable one mock at a time.
+
+    cells maps (pick, team, player) to a dict of position, is_trade,
+    default_team and experts: (date, seq, label) tuples in ascending order, so
+    reading them backwards lists the newest projections first (the most
+    recently ingested first among mocks of the same date).
+    """
+
+    def __init__(self):
+        self.cells = {}
+        self.medians = {}
+        self.mocks = {}  # source_id -> [(cell key, expert entry)], to undo a mock
+        self._seq = 0
+        # The rows from_picks built the table from, sorted by source_id: a mock's
+        # entries are only materialized into mocks when it is replaced
+        self._built = None
+        self._built_ids = set()
+
+    @classmethod
+    def from_picks(cls, picks):
+        """
+        Builds the table from load_draft_picks output, grouping the cells, mocks
+        and medians in Polars rather than adding the mocks one by one.
+        """
+        table = cls()
+        picks = picks.with_columns(
+            pl.col(name).cast(pl.String)
+            for name in ("team", "player", "source_id", "position", "author", "date", "default_team")
+        ).with_row_index("seq")
+        table._seq = len(picks)
+        picks = picks.with_columns(
+            label=pl.format("{} ({})", "author", "date")
+            + pl.when("is_trade").then(pl.lit(" - TRADE")).otherwise(pl.lit(""))
+        )
+
+        cells = (
+            picks.sort(["date", "seq"])
+            .group_by(["pick", "team", "player"])
+            .agg(
+                pl.col("position", "is_trade", "default_team").first(),
+                "date",
+                "seq",
+                "label",
+            )
+        )
+        for pick, team, player, position, is_trade, default_team, dates, seqs, labels in cells.iter_rows():
+            table.cells[(pick, team, player)] = {
+                "position": position,
+                "is_trade": is_trade,
+                "default_team": default_team,
+                "experts": list(zip(dates, seqs, labels)),
+            }
+
+        table._built = picks.select(
+            "source_id", "pick", "team", "player", "date", "seq", "label"
+        ).sort("source_id", "seq")
+        table._built_ids = set(table._built["source_id"].unique().to_list())
+
+        medians = picks.group_by("player").agg(pl.col("pick").sort())
+        for player, player_picks in medians.iter_rows():
+            table.medians[player] = RunningMedian(player_picks)
+        return table
+
+    def _mock_entries(self, source_id):
+        if source_id in self.mocks:
+            return self.mocks.pop(source_id)
+        if source_id not in self._built_ids:
+            return []
+        self._built_ids.discard(source_id)
+        ids = self._built["source_id"]
+        start = ids.search_sorted(source_id, side="left")
+        end = ids.search_sorted(source_id, side="right")
+        return [
+            ((pick, team, player), (date, seq, label))
+            for _, pick, team, player, date, seq, label in self._built.slice(start, end - start).iter_rows()
+        ]
+
+    def remove_mock(self, source_id):
+        """Takes a mock's picks out of the table (a no-op for unknown mocks)."""
+        for key, entry in self._mock_entries(source_id):
+            cell = self.cells[key]
+            experts = cell["experts"]
+            del experts[bisect.bisect_left(experts, entry)]
+            if not experts:
+                del self.cells[key]
+            median = self.medians[key[2]]
+            median.remove(key[0])
+            if not median:
+                del self.medians[key[2]]
+
+    def add_mock(self, source_id, meta, picks):
+        """
+        Adds one mock, replacing any earlier version of it. picks holds its
+        (pick, team, player, position, default_team, is_trade) rows.
+        """
+        self.remove_mock(source_id)
+        entries = self.mocks[source_id] = []
+        for pick, team, player, position, default_team, is_trade in picks:
+            key = (pick, team, player)
+            cell = self.cells.setdefault(
+                key,
+                {"position": position, "is_trade": is_trade, "default_team": default_team, "experts": []},
+            )
+            entry = (meta["date"], self._seq, _expert_label(meta["author"], meta["date"], is_trade))
+            self._seq += 1
+            bisect.insort(cell["experts"], entry)
+            entries.append((key, entry))
+
+            median = self.medians.get(player)
+            if median is None:
+                median = self.medians[player] = RunningMedian()
+            median.add(pick)
+
+    def player_order(self):
+        """Players sorted by their median pick (ties by name)."""
+        return sorted(self.medians, key=lambda player: (self.medians[player].median(), player))
+
+    def to_frame(self):
+        """
+        Returns one row per cell (CELL_COLUMNS) as a pandas DataFrame;
+        expert_info lists each distinct expert entry, newest first.
+        """
+        rows = []
+        for (pick, team, player), cell in self.cells.items():
+            labels = dict.fromkeys(label for _, _, label in reversed(cell["experts"]))
+            rows.append(
+                (
+                    pick,
+                    team,
+                    player,
+                    cell["position"],
+                    cell["is_trade"],
+                    cell["default_team"],
+                    len(cell["experts"]),
+                    "<br>• " + "<br>• ".join(labels),
+                )
+            )
+        return pd.DataFrame(rows, columns=CELL_COLUMNS).sort_values(
+            ["pick", "team", "player"], kind="stable", ignore_index=True
+        )
+
+
+def get_consensus_table():
+    """Returns the process-wide consensus table, building it from every mock on first use."""
+    global _CONSENSUS
+    if _CONSENSUS is None:
+        _CONSENSUS = ConsensusTable.from_picks(load_draft_picks())
+    return _CONSENSUS
+
+
+def ingest_mocks(registry, picks):
+    """
+    Stores new mocks (see mock_draft_data.add_mocks) and, if the consensus table
+    is already built, applies them to it incrementally.
+    """
+    picks = add_mocks(registry, picks)
+    if _CONSENSUS is None:
+        return
+
+    picks = with_trades(picks)
+    for source_id, meta in registry.items():
+        rows = picks.filter(pl.col("source_id").cast(pl.String) == source_id).select(
+            "pick",
+            pl.col("team").cast(pl.String),
+            pl.col("player").cast(pl.String),
+            pl.col("position").cast(pl.String),
+            pl.col("default_team").cast(pl.String),
+            "is_trade",
+        )
+        _CONSENSUS.add_mock(source_id, meta, rows.iter_rows())
@@ -0,0 +1,76 @@
+"""
+Expected-score derivation for a game's play-by-play.
+
+Everything here works on whole columns with NumPy and has no plotting
+dependencies, so the same derived series can be reused outside plot_scores.
+Columns are read with np.asarray, so both pandas and Polars frames are accepted.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def forward_fill(values):
+    """
+    Forward-fills missing values (None/NaN) in a 1-D array.
+    Leading missing values are left as they are, matching pandas' ffill().
+    """
+    values = np.asarray(values)
+    missing = pd.isna(values)
+    if not missing.any():
+        return values
+
+    # Index of the last non-missing position at or before each row
+    last_valid = np.where(missing, 0, np.arange(len(values)))
+    np.maximum.accumulate(last_valid, out=last_valid)
+    return values[last_valid]
+
+
+def pre_snap_scores(post_play_totals):
+    """
+    Converts post-play running totals into pre-snap scores: the score from the
+    previous play, forward-filled, with 0 before the first known score.
+    """
+    totals = np.asarray(post_play_totals, dtype=float)
+    shifted = np.empty_like(totals)
+    shifted[:1] = np.nan
+    shifted[1:] = totals[:-1]
+
+    shifted = forward_fill(shifted)
+    return np.nan_to_num(shifted, nan=0.0).astype(int)
+
+
+def expected_scores(pre_snap, expected_points, possession, team):
+    """
+    Returns a team's expected score for each play: its pre-snap score plus the
+    play's expected points when it has the ball, forward-filled over gaps.
+    """
+    has_ball = np.asarray(possession, dtype=object) == team
+    points = np.where(has_ball, np.asarray(expected_points, dtype=float), 0.0)
+    return forward_fill(pre_snap + points)
+
+
+def derive_expected_scores(plays, home_team, visitor_team):
+    """
+    Derives the per-play score series used by plot_scores from raw nflreadpy
+    columns (total_home_score, total_away_score, ep, posteam).
+
+    Returns a dict of arrays: preSnapHomeScore, preSnapVisitorScore,
+    possessionTeam (forward-filled), home_expected and visitor_expected.
+    """
+    pre_snap_home = pre_snap_scores(plays["total_home_score"])
+    pre_snap_visitor = pre_snap_scores(plays["total_away_score"])
+
+    # Forward fill possession to handle timeouts or other plays without a posteam.
+    possession = forward_fill(np.asarray(plays["posteam"], dtype=object))
+    ep = plays["ep"]
+
+    return {
+        "preSnapHomeScore": pre_snap_home,
+        "preSnapVisitorScore": pre_snap_visitor,
+        "possessionTeam": possession,
+        "home_expected": expected_scores(pre_snap_home, ep, possession, home_team),
+        "visitor_expected": expected_scores(
+            pre_snap_visitor, ep, possession, visitor_team
+        ),
+    }
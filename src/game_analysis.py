@@ -0,0 +1,232 @@
+"""
+Headless game analytics built on the expected-score derivation.
+
+Takes the plays of one game (or many games at once) and returns the derived
+series, lead changes and per-quarter summaries as plain dicts and arrays. This
+module never imports Matplotlib, so batch runs skip GUI import and figure costs,
+and the text, JSON and plot outputs can all share one computed result.
+"""
+
+import json
+
+import numpy as np
+
+from . import game_clock
+from .expected_points import derive_expected_scores, forward_fill
+
+# Bump whenever a change here (or in expected_points) changes any derived value,
+# so cached analyses (see metrics_cache) are recomputed.
+ANALYSIS_VERSION = 2
+
+
+def _post_play_totals(plays, column):
+    """Running post-play totals, forward-filled and starting from 0."""
+    totals = forward_fill(np.asarray(plays[column], dtype=float))
+    return np.nan_to_num(totals, nan=0.0)
+
+
+def _game_seconds_elapsed(plays):
+    if "game_seconds_elapsed" in plays.columns:
+        return np.asarray(plays["game_seconds_elapsed"], dtype=float)
+    if "game_seconds_remaining" in plays.columns:
+        return game_clock.game_seconds_elapsed(plays)
+    return None
+
+
+def find_lead_changes(net_actual, elapsed=None):
+    """
+    Returns the plays where the leading side changes, ignoring ties: each entry
+    holds the play index, the new sign of the lead (+1/-1) and the elapsed time.
+    """
+    sign = np.sign(net_actual)
+    lead_plays = np.flatnonzero(sign != 0)
+    if len(lead_plays) < 2:
+        return []
+
+    changed = lead_plays[1:][sign[lead_plays[1:]] != sign[lead_plays[:-1]]]
+    return [
+        {
+            "play_index": int(i),
+            "leader_sign": int(sign[i]),
+            "game_seconds_elapsed": float(elapsed[i]) if elapsed is not None else None,
+        }
+        for i in changed
+    ]
+
+
+def summarize_quarters(quarters, home_totals, visitor_totals, net_actual, net_expected):
+    """Per-quarter points scored, end-of-quarter margin and average expected margin."""
+    quarters = np.asarray(quarters, dtype=float)
+    summaries = []
+    previous_home, previous_visitor = 0.0, 0.0
+
+    for quarter in np.unique(quarters[~np.isnan(quarters)]):
+        rows = np.flatnonzero(quarters == quarter)
+        last = rows[-1]
+        summaries.append(
+            {
+                "quarter": int(quarter),
+                "plays": int(len(rows)),
+                "home_points": int(home_totals[last] - previous_home),
+                "visitor_points": int(visitor_totals[last] - previous_visitor),
+                "net_actual_end": int(net_actual[last]),
+                "net_expected_mean": float(np.nanmean(net_expected[rows]))
+                if not np.isnan(net_expected[rows]).all()
+                else None,
+            }
+        )
+        previous_home, previous_visitor = home_totals[last], visitor_totals[last]
+
+    return summaries
+
+
+def analyze_game(
+    plays,
+    home_team,
+    visitor_team,
+    final_home_score,
+    final_visitor_score,
+    game_id=None,
+):
+    """
+    Derives the expected-score series of one game from its chronologically
+    sorted plays (pandas or Polars, raw nflreadpy column names).
+
+    Net differences are oriented so the winner (home on a tie) is positive.
+    Returns a dict with the teams, "series" (dict of per-play arrays),
+    "lead_changes" and "quarters" (per-quarter summaries).
+    """
+    series = derive_expected_scores(plays, home_team, visitor_team)
+
+    if final_home_score >= final_visitor_score:
+        leader, trailer = home_team, visitor_team
+        net_actual = series["preSnapHomeScore"] - series["preSnapVisitorScore"]
+        net_expected = series["home_expected"] - series["visitor_expected"]
+    else:
+        leader, trailer = visitor_team, home_team
+        net_actual = series["preSnapVisitorScore"] - series["preSnapHomeScore"]
+        net_expected = series["visitor_expected"] - series["home_expected"]
+
+    series["net_actual"] = net_actual
+    series["net_expected"] = net_expected
+
+    elapsed = _game_seconds_elapsed(plays)
+    if elapsed is not None:
+        series["game_seconds_elapsed"] = elapsed
+
+    lead_changes = find_lead_changes(net_actual, elapsed)
+    for change in lead_changes:
+        change["leader"] = leader if change.pop("leader_sign") > 0 else trailer
+
+    quarters = []
+    if "qtr" in plays.columns:
+        quarters = summarize_quarters(
+            plays["qtr"],
+            _post_play_totals(plays, "total_home_score"),
+            _post_play_totals(plays, "total_away_score"),
+            net_actual,
+            net_expected,
+        )
+
+    return {
+        "game_id": game_id,
+        "home_team": home_team,
+        "visitor_team": visitor_team,
+        "final_home_score": int(final_home_score),
+        "final_visitor_score": int(final_visitor_score),
+        "leader": leader,
+        "trailer": trailer,
+        "series": series,
+        "lead_changes": lead_changes,
+        "quarters": quarters,
+    }
+
+
+def analyze_games(plays, schedule_rows=None):
+    """
+    Analyzes many games at once from a single play frame holding a game_id,
+    home_team and away_team column (e.g. a whole season of nflreadpy pbp).
+    Each game's plays are expected in chronological order, as nflreadpy returns them.
+
+    Final scores come from the optional schedule_rows (game_id -> schedule row
+    dict) and otherwise from the last running totals of each game.
+    Returns a dict of game_id -> analysis (see analyze_game).
+    """
+    schedule_rows = schedule_rows or {}
+    game_ids = np.asarray(plays["game_id"], dtype=object)
+    if len(game_ids) == 0:
+        return {}
+
+    # Group rows by game while keeping each game's play order
+    order = np.argsort(game_ids, kind="stable")
+    boundaries = np.flatnonzero(game_ids[order][1:] != game_ids[order][:-1]) + 1
+
+    analyses = {}
+    for rows in np.split(order, boundaries):
+        game_plays = plays[rows] if not hasattr(plays, "iloc") else plays.iloc[rows]
+        first = rows[0]
+        game_id = game_ids[first]
+        row = schedule_rows.get(game_id, {})
+
+        final_home = row.get("home_score")
+        final_visitor = row.get("away_score")
+        if final_home is None or final_visitor is None:
+            final_home = _post_play_totals(game_plays, "total_home_score")[-1]
+            final_visitor = _post_play_totals(game_plays, "total_away_score")[-1]
+
+        analyses[game_id] = analyze_game(
+            game_plays,
+            row.get("home_team") or np.asarray(game_plays["home_team"])[0],
+            row.get("away_team") or np.asarray(game_plays["away_team"])[0],
+            final_home,
+            final_visitor,
+            game_id=game_id,
+        )
+
+    return analyses
+
+
+def _to_json_value(value):
+    if isinstance(value, np.ndarray):
+        return [_to_json_value(v) for v in value.tolist()]
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def analysis_to_json(analysis, include_series=True):
+    """Serializes an analysis to a JSON string (NaN becomes null)."""
+    data = dict(analysis)
+    if not include_series:
+        data.pop("series")
+    return json.dumps(_to_json_value(data))
+
+
+def format_analysis(analysis):
+    """Returns a human-readable text summary of an analysis."""
+    lines = [
+        f"{analysis['visitor_team']} {analysis['final_visitor_score']} at "
+        f"{analysis['home_team']} {analysis['final_home_score']}"
+        + (f" ({analysis['game_id']})" if analysis["game_id"] else ""),
+        f"{'Qtr':<4} | {analysis['home_team']:>5} | {analysis['visitor_team']:>5} | "
+        f"{'Margin':>6} | {'Avg Exp Margin':>14}",
+        "-" * 47,
+    ]
+    for q in analysis["quarters"]:
+        expected = q["net_expected_mean"]
+        expected_str = f"{expected:+14.2f}" if expected is not None else f"{'N/A':>14}"
+        lines.append(
+            f"Q{q['quarter']:<3} | {q['home_points']:>5} | {q['visitor_points']:>5} | "
+            f"{q['net_actual_end']:>+6} | {expected_str}"
+        )
+    lines.append(
+        f"Lead changes: {len(analysis['lead_changes'])} "
+        f"(margins relative to {analysis['leader']})"
+    )
+    return "\n".join(lines)
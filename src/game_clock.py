@@ -0,0 +1,130 @@
+"""
+Game clock helpers: elapsed time across regulation and overtime periods.
+
+Elapsed time is derived from each play's period (qtr) and the seconds left in
+it, so overtime plays continue the timeline instead of folding back onto the
+fourth quarter. Overtime is 10 minutes in regular-season games since 2017 and
+15 minutes in playoff games (and in regular-season games before 2017).
+
+Like expected_points, everything works on whole NumPy columns and accepts
+pandas or Polars frames.
+"""
+
+import numpy as np
+
+QUARTER_SECONDS = 900
+REGULATION_QUARTERS = 4
+REGULATION_SECONDS = QUARTER_SECONDS * REGULATION_QUARTERS
+REGULAR_SEASON_OT_SECONDS = 600
+PLAYOFF_OT_SECONDS = 900
+SHORT_OT_FIRST_SEASON = 2017  # First season with 10-minute regular-season overtime
+
+
+def _column(plays, name, dtype=float):
+    if name not in plays.columns:
+        return None
+    return np.asarray(plays[name], dtype=dtype)
+
+
+def overtime_seconds(playoff, season=None):
+    """
+    Returns the length of an overtime period (vectorized over arrays): 900 s in
+    the playoffs or before 2017, otherwise 600 s. An unknown season (None or
+    NaN) is treated as a current one.
+    """
+    playoff = np.asarray(playoff, dtype=bool)
+    season = np.asarray(np.nan if season is None else season, dtype=float)
+    long_ot = playoff | (season < SHORT_OT_FIRST_SEASON)
+    return np.where(long_ot, PLAYOFF_OT_SECONDS, REGULAR_SEASON_OT_SECONDS)
+
+
+def is_playoff(game_type):
+    """
+    Whether a schedule game_type (REG, WC, DIV, CON, SB, or POST) is a playoff
+    game; None when unknown, so callers fall back to the plays' season_type.
+    """
+    if game_type is None:
+        return None
+    return game_type != "REG"
+
+
+def get_overtime_seconds(plays, playoff=None, season=None):
+    """
+    Returns the overtime length of each play. Unless given, the playoff flag
+    comes from season_type ("POST") and the season from the season column or
+    the game_id prefix.
+    """
+    n = len(plays)
+    if playoff is None:
+        season_type = _column(plays, "season_type", dtype=object)
+        playoff = season_type == "POST" if season_type is not None else np.zeros(n, dtype=bool)
+
+    if season is None:
+        season = _column(plays, "season")
+        if season is None:
+            game_ids = _column(plays, "game_id", dtype=object)
+            if game_ids is not None:
+                prefixes = [str(game_id)[:4] for game_id in game_ids]
+                season = np.array(
+                    [float(p) if p.isdigit() else np.nan for p in prefixes], dtype=float
+                )
+
+    return np.broadcast_to(overtime_seconds(playoff, season), (n,))
+
+
+def period_start_seconds(qtr, ot_seconds):
+    """Game seconds elapsed at the start of each period (1-4, then 5+ for OT)."""
+    qtr = np.asarray(qtr, dtype=float)
+    return QUARTER_SECONDS * (np.minimum(qtr, REGULATION_QUARTERS + 1) - 1) + ot_seconds * np.maximum(
+        qtr - (REGULATION_QUARTERS + 1), 0
+    )
+
+
+def game_seconds_elapsed(plays, playoff=None, season=None):
+    """
+    Returns the game seconds elapsed at each play, in one vectorized pass:
+    the start of the play's period plus the time already run off in it.
+
+    Uses quarter_seconds_remaining when present; otherwise it is recovered from
+    game_seconds_remaining (qsr = gsr - max(4 - qtr, 0) * 900, which also holds
+    in overtime). Plays without a quarter fall back to 3600 - gsr.
+    """
+    n = len(plays)
+    qtr = _column(plays, "qtr")
+    gsr = _column(plays, "game_seconds_remaining")
+    if gsr is None:
+        gsr = np.full(n, np.nan)
+    if qtr is None:
+        return REGULATION_SECONDS - gsr
+
+    qsr = _column(plays, "quarter_seconds_remaining")
+    recovered = gsr - np.maximum(REGULATION_QUARTERS - qtr, 0) * QUARTER_SECONDS
+    qsr = recovered if qsr is None else np.where(np.isnan(qsr), recovered, qsr)
+
+    ot_seconds = get_overtime_seconds(plays, playoff, season)
+    period_seconds = np.where(qtr <= REGULATION_QUARTERS, QUARTER_SECONDS, ot_seconds)
+    elapsed = period_start_seconds(qtr, ot_seconds) + period_seconds - qsr
+    return np.where(np.isnan(qtr), REGULATION_SECONDS - gsr, elapsed)
+
+
+def get_periods(plays, playoff=None, season=None):
+    """
+    Returns (label, start, end) in game seconds elapsed for every period of a
+    game: Q1-Q4, plus OT, OT2, ... for the overtime periods its plays reach.
+    """
+    qtr = _column(plays, "qtr")
+    last = REGULATION_QUARTERS
+    if qtr is not None and not np.isnan(qtr).all():
+        last = max(last, int(np.nanmax(qtr)))
+
+    ot_seconds = int(get_overtime_seconds(plays, playoff, season)[0]) if len(plays) else REGULAR_SEASON_OT_SECONDS
+    periods = []
+    for period in range(1, last + 1):
+        start = float(period_start_seconds(period, ot_seconds))
+        if period <= REGULATION_QUARTERS:
+            label, length = f"Q{period}", QUARTER_SECONDS
+        else:
+            overtime = period - REGULATION_QUARTERS
+            label, length = ("OT" if overtime == 1 else f"OT{overtime}"), ot_seconds
+        periods.append((label, start, start + length))
+    return periods
@@ -0,0 +1,183 @@
+"""
+Content-addressed on-disk cache of derived per-game metrics.
+
+A game's analysis (pre-snap scores, expected-score series, net differences,
+lead changes and quarter summaries) is a pure function of its plays, so it is
+stored under a key built from the game_id, a hash of the input data and
+ANALYSIS_VERSION. Re-rendering or comparing games then loads the arrays instead
+of recomputing them, and any change to the data or the derivation code simply
+misses the cache. The cache directory is kept under a size bound by evicting
+the least recently used entries.
+
+    <cache_dir>/metrics/<sha256 key>.npz
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from . import tracing
+from .game_analysis import ANALYSIS_VERSION, analysis_to_json, analyze_game
+from .utils import get_cache_dir
+
+METRICS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Play columns analyze_game reads; only these feed the data snapshot hash
+ANALYSIS_COLUMNS = [
+    "qtr",
+    "game_seconds_elapsed",
+    "game_seconds_remaining",
+    "total_home_score",
+    "total_away_score",
+    "ep",
+    "posteam",
+]
+
+_MISSING_TEAM = ""  # Stand-in for missing possession teams in the stored string array
+
+
+def get_metrics_dir():
+    """Returns the directory holding the cached analyses."""
+    return get_cache_dir("metrics")
+
+
+def cache_key(game_id, snapshot):
+    """Returns the content address of a game's analysis."""
+    return hashlib.sha256(f"{game_id}\0{snapshot}\0{ANALYSIS_VERSION}".encode()).hexdigest()
+
+
+def get_cache_path(key):
+    """Returns the file path of a cache entry."""
+    return os.path.join(get_metrics_dir(), f"{key}.npz")
+
+
+def plays_snapshot(plays, home_team, visitor_team, final_home_score, final_visitor_score):
+    """
+    Hashes everything analyze_game depends on: the analysis columns of the
+    (sorted) plays, pandas or Polars, plus the teams and final scores.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        f"{home_team}\0{visitor_team}\0{final_home_score}\0{final_visitor_score}".encode()
+    )
+    for column in ANALYSIS_COLUMNS:
+        if column not in plays.columns:
+            continue
+        values = np.asarray(plays[column])
+        digest.update(column.encode() + b"\0")
+        if values.dtype.kind in "biuf":
+            digest.update(values.astype(float).tobytes())
+        else:
+            digest.update("\x1f".join("\x00" if v is None else str(v) for v in values).encode())
+    return digest.hexdigest()
+
+
+def save_analysis(key, analysis, max_bytes=METRICS_CACHE_MAX_BYTES):
+    """Stores an analysis under a key, then evicts old entries past max_bytes."""
+    arrays = {}
+    for name, values in analysis["series"].items():
+        values = np.asarray(values)
+        if values.dtype == object:
+            values = np.array(
+                [_MISSING_TEAM if v is None else str(v) for v in values], dtype=str
+            )
+        arrays[f"series.{name}"] = values
+    arrays["meta"] = np.array(analysis_to_json(analysis, include_series=False))
+
+    path = get_cache_path(key)
+    tmp_path = f"{path}.tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+    evict(max_bytes)
+
+
+def load_analysis(key):
+    """
+    Returns the cached analysis for a key, or None on a miss. A hit marks the
+    entry as recently used.
+    """
+    path = get_cache_path(key)
+    try:
+        with np.load(path, allow_pickle=False) as stored:
+            analysis = json.loads(str(stored["meta"]))
+            series = {}
+            for name in stored.files:
+                if not name.startswith("series."):
+                    continue
+                values = stored[name]
+                if values.dtype.kind == "U":
+                    values = np.where(values == _MISSING_TEAM, None, values.astype(object))
+                series[name[len("series.") :]] = values
+    except (OSError, ValueError, KeyError):
+        return None
+
+    analysis["series"] = series
+    os.utime(path)  # Eviction is by modification time, so a hit refreshes it
+    return analysis
+
+
+def evict(max_bytes=METRICS_CACHE_MAX_BYTES):
+    """
+    Deletes the least recently used entries until the cache fits in max_bytes.
+    Returns the number of entries removed.
+    """
+    entries = []
+    for entry in os.scandir(get_metrics_dir()):
+        if entry.name.endswith(".npz") and ".tmp" not in entry.name:
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def cached_analyze_game(
+    plays,
+    home_team,
+    visitor_team,
+    final_home_score,
+    final_visitor_score,
+    game_id=None,
+    snapshot=None,
+    max_bytes=METRICS_CACHE_MAX_BYTES,
+):
+    """
+    analyze_game with the on-disk cache in front of it. The snapshot defaults
+    to plays_snapshot; callers that already hold a hash of their source data
+    can pass it instead.
+    """
+    with tracing.span("derive", game_id=game_id):
+        if snapshot is None:
+            snapshot = plays_snapshot(
+                plays, home_team, visitor_team, final_home_score, final_visitor_score
+            )
+        key = cache_key(game_id, snapshot)
+
+        analysis = load_analysis(key)
+        if analysis is None:
+            tracing.count("cache_misses")
+            analysis = analyze_game(
+                plays,
+                home_team,
+                visitor_team,
+                final_home_score,
+                final_visitor_score,
+                game_id=game_id,
+            )
+            save_analysis(key, analysis, max_bytes)
+        else:
+            tracing.count("cache_hits")
+        return analysis
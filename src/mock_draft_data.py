@@ -1,4 +1,20 @@
+"""
+Mock draft data: the built-in 2026 boards plus any mocks ingested into the
+local columnar store.
+
+Ingested mocks are kept as Parquet under <cache_dir>/drafts: picks.parquet holds
+one row per (mock, pick) with the team as an Enum and the player, position and
+source ID as categoricals, and mocks.parquet holds one row of metadata per mock
+(the MOCK_REGISTRY fields). Thousands of full 257-pick mocks load in one read.
+"""
+
+import os
+
+import numpy as np
 import pandas as pd
+import polars as pl
+
+from .utils import FRANCHISE_ALIASES, FRANCHISES, get_cache_dir
 
 # Standard 2026 Draft Order (Pre-Trade)
 DEFAULT_ORDER = {
@@ -129,12 +145,170 @@ DRAFT_DATA = [
     (15, "TB", "Akheem Mesidor", "RING_DL", "EDGE"), (15, "TB", "Akheem Mesidor", "ATH_BW", "EDGE")
 ]
 
+# Every abbreviation a mock may use for a team (current and historical, e.g. LAR)
+DRAFT_TEAMS = sorted(set(FRANCHISES) | set(FRANCHISE_ALIASES))
+
+PICK_SCHEMA = {
+    "pick": pl.UInt16,
+    "team": pl.Enum(DRAFT_TEAMS),
+    "player": pl.Categorical,
+    "source_id": pl.Categorical,
+    "position": pl.Categorical,
+}
+MOCK_FIELDS = ["source", "author", "version", "date", "context", "url", "last_checked"]
+MOCK_SCHEMA = {"source_id": pl.Categorical, **{field: pl.String for field in MOCK_FIELDS}}
+
+_BUILTIN = None  # (picks, mocks) frames of DRAFT_DATA / MOCK_REGISTRY, built on first use
+
+
+def get_draft_store_dir():
+    """Returns the directory of the local mock draft store."""
+    return get_cache_dir("drafts")
+
+
+def _store_path(name):
+    return os.path.join(get_draft_store_dir(), f"{name}.parquet")
+
+
+def _picks_frame(rows):
+    """Builds a picks frame from (pick, team, player, source_id, position) tuples."""
+    return pl.DataFrame(rows, schema=list(PICK_SCHEMA), orient="row").cast(PICK_SCHEMA)
+
+
+def _mocks_frame(registry):
+    """Builds a mocks frame from a MOCK_REGISTRY-style dict of source_id -> metadata."""
+    return pl.DataFrame(
+        {
+            "source_id": list(registry),
+            **{field: [meta.get(field) for meta in registry.values()] for field in MOCK_FIELDS},
+        },
+        schema=MOCK_SCHEMA,
+    )
+
+
+def _builtin_frames():
+    global _BUILTIN
+    if _BUILTIN is None:
+        _BUILTIN = (_picks_frame(DRAFT_DATA), _mocks_frame(MOCK_REGISTRY))
+    return _BUILTIN
+
+
+def _read_store(name, schema):
+    path = _store_path(name)
+    if not os.path.exists(path):
+        return pl.DataFrame(schema=schema)
+    return pl.read_parquet(path)
+
+
+def _write_store(name, frame):
+    path = _store_path(name)
+    tmp_path = f"{path}.tmp"
+    frame.write_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def add_mocks(registry, picks):
+    """
+    Ingests mock drafts into the local store. registry maps each new source_id
+    to its MOCK_REGISTRY-style metadata; picks holds their (pick, team, player,
+    source_id, position) rows, as tuples or a frame. Re-adding a source_id
+    replaces its earlier picks and metadata. Returns the new picks as a frame.
+    """
+    mocks = _mocks_frame(registry)
+    if not isinstance(picks, pl.DataFrame):
+        picks = _picks_frame(picks)
+    picks = picks.select(list(PICK_SCHEMA)).cast(PICK_SCHEMA)
+
+    replaced = mocks["source_id"].cast(pl.String).to_list()
+    stored_mocks = _read_store("mocks", MOCK_SCHEMA)
+    stored_picks = _read_store("picks", PICK_SCHEMA)
+    _write_store(
+        "picks",
+        pl.concat(
+            [stored_picks.filter(~pl.col("source_id").cast(pl.String).is_in(replaced)), picks]
+        ),
+    )
+    _write_store(
+        "mocks",
+        pl.concat(
+            [stored_mocks.filter(~pl.col("source_id").cast(pl.String).is_in(replaced)), mocks]
+        ),
+    )
+    return picks
+
+
+def with_trades(picks):
+    """
+    Adds default_team and is_trade to a picks frame. A pick is a trade when
+    DEFAULT_ORDER assigns it to another team; picks past the known order have
+    no default team and are never trades.
+    """
+    # One join against the default order instead of a per-row lookup
+    default_order = pl.DataFrame(
+        {"pick": list(DEFAULT_ORDER), "default_team": list(DEFAULT_ORDER.values())},
+        schema={"pick": pl.UInt16, "default_team": pl.Enum(DRAFT_TEAMS)},
+    )
+    return picks.join(default_order, on="pick", how="left", maintain_order="left").with_columns(
+        is_trade=(pl.col("team") != pl.col("default_team")).fill_null(False)
+    )
+
+
+def _all_frames():
+    """
+    Returns the (picks, mocks) frames of the built-in and stored mocks. A stored
+    mock replaces the built-in mock of the same source_id, picks and metadata.
+    """
+    builtin_picks, builtin_mocks = _builtin_frames()
+    stored_picks = _read_store("picks", PICK_SCHEMA)
+    stored_mocks = _read_store("mocks", MOCK_SCHEMA)
+    replaced = stored_mocks["source_id"].cast(pl.String).to_list()
+
+    def builtin(frame):
+        return frame.filter(~pl.col("source_id").cast(pl.String).is_in(replaced))
+
+    return (
+        pl.concat([builtin(builtin_picks), stored_picks]),
+        pl.concat([builtin(builtin_mocks), stored_mocks]),
+    )
+
+
+def load_draft_picks():
+    """
+    Returns every mock's picks (built-in and stored) as a Polars frame joined
+    with the mock metadata, plus default_team and is_trade (see with_trades).
+    """
+    picks, mocks = _all_frames()
+
+    # Metadata repeats on every pick of a mock, so it is carried as categoricals
+    mocks = mocks.with_columns(pl.col(MOCK_FIELDS).cast(pl.Categorical))
+    return with_trades(picks.join(mocks, on="source_id", how="inner", maintain_order="left"))
+
+
+def load_mock_registry():
+    """Returns the metadata of every mock (built-in and stored), as MOCK_REGISTRY does."""
+    _, mocks = _all_frames()
+    return {row.pop("source_id"): row for row in mocks.to_dicts()}
+
+
+def _to_pandas_column(series):
+    """
+    Converts one Polars column to pandas without pyarrow: Enum and categorical
+    columns become pandas categoricals built from their integer codes.
+    """
+    if series.dtype == pl.Categorical:
+        # Sorted categories keep pandas sorting on the codes equal to sorting the strings
+        categories = series.unique().drop_nulls().cast(pl.String).sort()
+        series = series.cast(pl.Enum(categories))
+    if isinstance(series.dtype, pl.Enum):
+        codes = series.to_physical().fill_null(-1).to_numpy().astype(np.int32)
+        return pd.Categorical.from_codes(codes, categories=series.dtype.categories.to_list())
+    return series.to_numpy()
+
+
 def get_draft_dataframe():
-    df_picks = pd.DataFrame(DRAFT_DATA, columns=["pick", "team", "player", "source_id", "position"])
-    df_meta = pd.DataFrame.from_dict(MOCK_REGISTRY, orient='index').reset_index().rename(columns={'index': 'source_id'})
-    df = df_picks.merge(df_meta, on="source_id")
-    
-    # Identify trades
-    df['is_trade'] = df.apply(lambda x: x['team'] != DEFAULT_ORDER.get(x['pick']), axis=1)
-    df['default_team'] = df['pick'].map(DEFAULT_ORDER)
-    return df
+    """
+    Returns every mock pick with its mock's metadata as a pandas DataFrame
+    (see load_draft_picks). Every string column is a pandas categorical.
+    """
+    picks = load_draft_picks()
+    return pd.DataFrame({name: _to_pandas_column(picks[name]) for name in picks.columns})
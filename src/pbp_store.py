@@ -0,0 +1,207 @@
+"""
+Local on-disk store for nflverse play-by-play data.
+
+Seasons are ingested once from nflreadpy and written as one Parquet file per
+game, so later lookups read only the rows of the requested game:
+
+    <cache_dir>/pbp/season=2023/game_id=2023_01_DET_KC.parquet
+
+Each ingest also writes a <cache_dir>/pbp/season=2023/_ingested marker with its
+fetch time, so games missing from a fresh download (unplayed or mistyped) do
+not trigger another download, and seasons still in progress are refetched
+once the marker is older than PBP_TTL_SECONDS.
+"""
+
+import datetime
+import json
+import os
+import time
+
+import polars as pl
+
+from . import tracing
+from .data_source import get_data_source
+from .utils import get_cache_dir
+
+# The play-by-play fields the analysis and display paths actually use; reading
+# only these instead of all ~370 nflverse columns keeps a game's frame small.
+PLAY_COLUMNS = (
+    "game_id",
+    "play_id",
+    "home_team",
+    "away_team",
+    "qtr",
+    "game_seconds_remaining",
+    "quarter_seconds_remaining",
+    "ep",
+    "epa",
+    "posteam",
+    "down",
+    "ydstogo",
+    "yrdln",
+    "desc",
+    "total_home_score",
+    "total_away_score",
+)
+
+
+# Ingests of seasons that may still gain games are refetched after this age.
+PBP_TTL_SECONDS = 6 * 60 * 60
+
+INGEST_MARKER = "_ingested"
+
+
+def get_season_dir(season):
+    """Returns the directory holding the per-game partitions of a season."""
+    return get_cache_dir("pbp", f"season={int(season)}")
+
+
+def get_game_path(game_id, season):
+    """Returns the Parquet path of a single game's partition."""
+    return os.path.join(get_season_dir(season), f"game_id={game_id}.parquet")
+
+
+def has_game(game_id, season):
+    """Returns True if the game's plays are already in the local store."""
+    return os.path.exists(get_game_path(game_id, season))
+
+
+def get_ingest_marker_path(season):
+    """Returns the path of the marker recording when a season was last ingested."""
+    return os.path.join(get_season_dir(season), INGEST_MARKER)
+
+
+def _write_ingest_marker(season, games):
+    path = get_ingest_marker_path(season)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"fetched_at": time.time(), "games": games}, f)
+    os.replace(tmp_path, path)
+
+
+def _ingested_at(season):
+    """
+    Returns when the season was last ingested, or None if never. Stores written
+    before the marker existed fall back to the newest partition's mtime.
+    """
+    try:
+        with open(get_ingest_marker_path(season), encoding="utf-8") as f:
+            return json.load(f)["fetched_at"]
+    except (OSError, ValueError, KeyError):
+        pass
+    paths = list_game_paths(season).values()
+    return max((os.path.getmtime(path) for path in paths), default=None)
+
+
+def _is_season_over(season):
+    """A season (including its playoffs) is over by March of the following year."""
+    return datetime.date.today() >= datetime.date(int(season) + 1, 3, 1)
+
+
+def is_ingest_fresh(season):
+    """
+    Returns True if the season was ingested and needs no refetch: finished
+    seasons never go stale, others are reused until PBP_TTL_SECONDS expires.
+    """
+    fetched_at = _ingested_at(season)
+    if fetched_at is None:
+        return False
+    return _is_season_over(season) or time.time() - fetched_at < PBP_TTL_SECONDS
+
+
+def ingest_season(season):
+    """
+    Loads a full season of play-by-play from the data source (nflreadpy by
+    default) and writes it to the store partitioned by game_id. Returns the
+    number of games written. Records the ingest in the season's marker, even
+    when the season has no plays.
+    """
+    with tracing.span("pbp.fetch", season=season):
+        pbp_df = get_data_source().load_pbp([season])
+        tracing.count("rows_scanned", len(pbp_df))
+
+    if pbp_df.is_empty():
+        print(f"Warning: No plays found for season {season}.")
+        _write_ingest_marker(season, 0)
+        return 0
+
+    games = pbp_df.partition_by("game_id", as_dict=True)
+    for (game_id,), game_df in games.items():
+        path = get_game_path(game_id, season)
+        # Write to a temporary file first so readers never see a partial partition
+        tmp_path = f"{path}.tmp"
+        game_df.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    _write_ingest_marker(season, len(games))
+    return len(games)
+
+
+def _read_projected(source, columns):
+    """Scans Parquet file(s), reading only the requested columns that exist."""
+    plays = pl.scan_parquet(source)
+    if columns is not None:
+        available = plays.collect_schema().names()
+        plays = plays.select([c for c in columns if c in available])
+    plays = plays.collect()
+
+    if tracing.enabled():
+        paths = [source] if isinstance(source, str) else source
+        tracing.count("rows_scanned", len(plays))
+        tracing.count("bytes_loaded", sum(os.path.getsize(path) for path in paths))
+    return plays
+
+
+def load_game(game_id, season, columns=PLAY_COLUMNS):
+    """
+    Returns the plays of a single game as a Polars DataFrame, ingesting the
+    season into the store first if the game is not available locally and the
+    last ingest is stale (see is_ingest_fresh).
+
+    Only the requested columns that exist in the partition are read (pass
+    columns=None for all of them). Returns an empty DataFrame if the game has no plays.
+    """
+    with tracing.span("pbp.load", game_id=game_id):
+        if not has_game(game_id, season):
+            if not is_ingest_fresh(season):
+                ingest_season(season)
+
+            if not has_game(game_id, season):
+                return pl.DataFrame()
+
+        return _read_projected(get_game_path(game_id, season), columns)
+
+
+def list_game_paths(season):
+    """Returns the stored partitions of a season as a dict of game_id -> path."""
+    season_dir = get_season_dir(season)
+    paths = {}
+    for name in sorted(os.listdir(season_dir)):
+        if name.startswith("game_id=") and name.endswith(".parquet"):
+            paths[name[len("game_id=") : -len(".parquet")]] = os.path.join(season_dir, name)
+    return paths
+
+
+def has_season(season):
+    """Returns True if any game of the season is in the local store."""
+    return bool(list_game_paths(season))
+
+
+def read_games(paths, columns=PLAY_COLUMNS):
+    """Reads the given game partitions into one Polars DataFrame."""
+    if not paths:
+        return pl.DataFrame()
+    return _read_projected(list(paths), columns)
+
+
+def load_season(season, columns=PLAY_COLUMNS):
+    """
+    Returns every stored play of a season as a Polars DataFrame (projected to
+    the given columns), ingesting the season first if it was never ingested
+    or the last ingest is stale (see is_ingest_fresh).
+    """
+    with tracing.span("pbp.load", season=season):
+        if not is_ingest_fresh(season):
+            ingest_season(season)
+
+        return read_games(list(list_game_paths(season).values()), columns)
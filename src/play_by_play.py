@@ -9,9 +9,10 @@ import argparse
 import sys
 import logging
 
-import nflreadpy
 import polars as pl
 
+from . import pbp_store, schedule_index
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -27,9 +28,24 @@ if not logger.handlers:
     logger.addHandler(console_handler)
 
 
-def get_play_by_play(game_id):
+# Fields shown by the text renderer
+TEXT_COLUMNS = {
+    "ep": pl.Float64,
+    "qtr": pl.Float64,
+    "down": pl.Float64,
+    "ydstogo": pl.Float64,
+    "yrdln": pl.String,
+    "desc": pl.String,
+}
+
+OUTPUT_FORMATS = ["text", "json", "csv"]
+BATCH_SIZE = 50_000  # Plays formatted and written per batch
+
+
+def get_play_by_play(game_id, quiet=False):
     """
     Fetches and returns play-by-play data for a given game ID.
+    quiet=True suppresses progress messages (errors are still printed).
     """
     # Extract season from game_id (YYYY_WEEK_HOME_AWAY)
     parts = game_id.split("_")
@@ -39,81 +55,200 @@ def get_play_by_play(game_id):
 
     season = int(parts[0])
 
-    # Validate game exists using schedules (much faster than loading full PBP)
-    print(f"Validating game {game_id} in {season} schedule...")
-    schedules = nflreadpy.load_schedules(seasons=[season])
-    game_info = schedules.filter(pl.col("game_id") == game_id)
-
-    if game_info.is_empty():
+    # Validate game exists using the schedule index (much faster than loading full PBP)
+    if not quiet:
+        print(f"Validating game {game_id} in {season} schedule...")
+    if schedule_index.get_game(game_id, season) is None:
         print(f"Game ID {game_id} not found in {season} schedule.")
         return None
 
-    # load_pbp returns a Polars DataFrame for the entire season(s)
-    # Note: it does NOT accept game_id directly.
-    print(f"Loading play-by-play data for {season} season...")
-    df = nflreadpy.load_pbp(seasons=[season])
-
-    # Filter for the specific game
-    game_plays = df.filter(pl.col("game_id") == game_id)
+    # load_pbp only returns whole seasons, so plays are read through the local
+    # store, which ingests the season once and then serves single games.
+    if not pbp_store.has_game(game_id, season) and not quiet:
+        print(f"Loading play-by-play data for {season} season...")
+    game_plays = pbp_store.load_game(game_id, season)
 
     if game_plays.is_empty():
         print(f"No plays found for game ID: {game_id} (though it exists in schedule).")
         return None
 
-    return game_plays.to_dicts()  # Return list of dictionaries
+    return game_plays  # Polars DataFrame projected to pbp_store.PLAY_COLUMNS
+
+
+def get_season_play_by_play(season):
+    """Returns every play of a season (projected to pbp_store.PLAY_COLUMNS), or None."""
+    plays = pbp_store.load_season(season)
+    if plays.is_empty():
+        print(f"No plays found for season {season}.")
+        return None
+    return plays
+
+
+def _to_frame(plays):
+    """Accepts a Polars DataFrame or a list of play dicts (e.g. a replayed simulation)."""
+    if isinstance(plays, pl.DataFrame):
+        return plays
+    return pl.DataFrame(list(plays), infer_schema_length=None)
+
+
+def _optional(expr, fallback=""):
+    return pl.when(expr.is_null()).then(pl.lit(fallback)).otherwise(expr)
+
+
+def _format_fixed2(x):
+    """
+    Formats a float expression like Python's "%6.2f", nulls as "   N/A".
+
+    Polars' round() breaks ties on the decimal literal (e.g. 3.775 -> 3.78)
+    while "%6.2f" rounds the exact binary value (3.775 is 3.77499... -> 3.77),
+    so the cents are rounded here from an error-free x * 100 product instead.
+    """
+    cents = x * 100
+    # Dekker's split gives the exact rounding error of x * 100: x * 100 == cents + err
+    split = x * 134217729.0
+    high = split - (split - x)
+    err = (high * 100 - cents) + (x - high) * 100
+    floor = cents.floor()
+    above_half = (cents - floor) - 0.5
+    # Round half to even on the exact value, as float formatting does
+    round_up = (above_half > 0) | (
+        (above_half == 0) & ((err > 0) | ((err == 0) & (floor % 2 == 1)))
+    )
+    cents = (floor + round_up.cast(pl.Float64)).cast(pl.Int64).abs()
+    negative = (x < 0) | ((x == 0) & (1 / x < 0))  # Keeps "-0.00"
+    text = pl.concat_str(
+        pl.when(negative).then(pl.lit("-")).otherwise(pl.lit("")),
+        (cents // 100).cast(pl.String),
+        pl.lit("."),
+        (cents % 100).cast(pl.String).str.pad_start(2, "0"),
+    )
+    return (
+        pl.when(x.is_finite())
+        .then(text)
+        .otherwise(x.cast(pl.String).str.to_lowercase())
+        .str.pad_start(6)
+        .fill_null("   N/A")
+    )
+
+
+def format_play_lines(plays):
+    """
+    Formats a frame of plays into a Series of text lines, one per play, as
+    "[    ep] Q1 - (1 & 10 at KC 25) desc". Columns are formatted whole with
+    Polars string expressions rather than play by play in Python.
+    """
+    missing = [
+        pl.lit(None, dtype=dtype).alias(name)
+        for name, dtype in TEXT_COLUMNS.items()
+        if name not in plays.columns
+    ]
+    plays = plays.with_columns(missing) if missing else plays
+
+    def as_int_string(column):
+        return pl.col(column).cast(pl.Float64).cast(pl.Int64).cast(pl.String)
+
+    situation = pl.concat_str(
+        _optional(as_int_string("down") + pl.lit(" & ")),
+        _optional(as_int_string("ydstogo") + pl.lit(" ")),
+        _optional(pl.lit("at ") + pl.col("yrdln").cast(pl.String)),
+    ).str.strip_chars()
+
+    line = pl.concat_str(
+        pl.lit("["),
+        _format_fixed2(pl.col("ep").cast(pl.Float64)),
+        pl.lit("] Q"),
+        _optional(as_int_string("qtr"), "?"),
+        pl.lit(" - "),
+        pl.when(situation == "").then(pl.lit("")).otherwise(pl.lit("(") + situation + pl.lit(") ")),
+        _optional(pl.col("desc").cast(pl.String), "None"),
+    )
+    return plays.select(line.alias("line"))["line"]
+
+
+def write_play_by_play(plays, out, output_format="text", batch_size=BATCH_SIZE):
+    """
+    Streams plays (a Polars DataFrame or list of play dicts) to a text writer
+    in batches: one formatted line per play for "text", JSON Lines for "json"
+    or CSV (with a single header) for "csv". Each batch is formatted as a whole
+    and written with one write call, so output runs at I/O speed.
+    Returns the number of plays written.
+    """
+    plays = _to_frame(plays)
+    for offset, batch in enumerate(plays.iter_slices(n_rows=batch_size)):
+        if output_format == "json":
+            out.write(batch.write_ndjson())
+        elif output_format == "csv":
+            out.write(batch.write_csv(include_header=offset == 0))
+        else:
+            out.write("\n".join(format_play_lines(batch).to_list()) + "\n")
+    return len(plays)
 
 
 def display_play_by_play(play_by_play_data):
     """
-    Displays the play-by-play data in a human-readable format.
+    Displays the play-by-play data (a Polars DataFrame or a list of play dicts)
+    in a human-readable format.
     """
-    if not play_by_play_data:
+    if play_by_play_data is None or len(play_by_play_data) == 0:
         print("No play-by-play data available to display.")
         return
 
     print("--- Play-by-Play Data ---")
-    for play in play_by_play_data:
-        # Using correct column names from nflreadpy: ep, qtr, desc
-        ep = play.get("ep")
-        ep_str = f"{ep:6.2f}" if ep is not None else "   N/A"
-
-        qtr = play.get("qtr")
-        qtr_val = int(qtr) if qtr is not None else "?"
-
-        down = play.get("down")
-        down_str = f"{int(down)} & " if down is not None else ""
-        
-        togo = play.get("ydstogo")
-        togo_str = f"{int(togo)} " if togo is not None else ""
-        
-        yrdln = play.get("yrdln")
-        yrdln_str = f"at {yrdln}" if yrdln is not None else ""
-        
-        situation = f"{down_str}{togo_str}{yrdln_str}".strip()
-        situation_str = f"({situation}) " if situation else ""
-
-        print(f"[{ep_str}] Q{qtr_val} - {situation_str}{play.get('desc')}")
+    sys.stdout.flush()
+    write_play_by_play(play_by_play_data, sys.stdout)
     print("-------------------------")
 
 
+def export_play_by_play(plays, output_format="text", output_path=None):
+    """
+    Writes plays in the given format to output_path (through one large
+    buffered file writer) or to stdout.
+    """
+    if output_path is None:
+        if output_format == "text":
+            display_play_by_play(plays)
+        else:
+            write_play_by_play(plays, sys.stdout, output_format)
+        return
+
+    with open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        count = write_play_by_play(plays, f, output_format)
+    print(f"Wrote {count} plays to {output_path}")
+
+
 def main():
     """
     Main function
     """
     parser = argparse.ArgumentParser(
-        description="Display NFL play-by-play data for a given game ID."
+        description="Display or export NFL play-by-play data for a game or a whole season."
     )
     parser.add_argument(
         "game_id",
         type=str,
-        help="The game ID in the format YYYY_MM_TEAM_TEAM (e.g., 2023_01_DET_KC).",
+        help="The game ID in the format YYYY_MM_TEAM_TEAM (e.g., 2023_01_DET_KC), "
+        + "or a season (e.g., 2023) to export every play of it.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format: text (default), json (JSON Lines) or csv.",
     )
+    parser.add_argument("-o", "--output", help="Path to write the plays to instead of stdout.")
 
     args = parser.parse_args()
 
-    play_data = get_play_by_play(args.game_id)
+    # Progress messages would corrupt JSON/CSV written to stdout
+    quiet = args.format != "text" and args.output is None
+    if args.game_id.isdigit():
+        play_data = get_season_play_by_play(int(args.game_id))
+    else:
+        play_data = get_play_by_play(args.game_id, quiet=quiet)
+
     if play_data is not None:
-        display_play_by_play(play_data)
+        export_play_by_play(play_data, args.format, args.output)
 
 
 if __name__ == "__main__":
@@ -1,75 +1,80 @@
-import plotly.express as px
+import numpy as np
 import plotly.graph_objects as go
-import pandas as pd
-from mock_draft_data import get_draft_dataframe, MOCK_REGISTRY, DEFAULT_ORDER
-from utils import get_team_colors_map
+
+from .draft_consensus import get_consensus_table
+from .mock_draft_data import load_mock_registry
+from .utils import get_team_colors_map
 
 def create_draft_heatmap():
     # 1. Prepare Data
-    df = get_draft_dataframe()
+    # The consensus table is materialized once per process and updated per ingested mock
+    table = get_consensus_table()
     colors_map = get_team_colors_map()
-    df = df.sort_values(by="date", ascending=False)
-    
-    # Calculate median pick for each player to sort X-axis
-    player_medians = df.groupby('player')['pick'].median().sort_values()
-    x_order = player_medians.index.tolist()
-
-    # Aggregation
-    df['consensus_count'] = df.groupby(['pick', 'team', 'player'])['player'].transform('count')
-    df['expert_info'] = df.apply(lambda x: f"{x['author']} ({x['date']}){' - TRADE' if x['is_trade'] else ''}", axis=1)
-    
-    df_agg = df.groupby(['pick', 'team', 'player', 'position', 'is_trade', 'default_team', 'consensus_count']).agg({
-        'expert_info': lambda x: "<br>• " + "<br>• ".join(dict.fromkeys(x))
-    }).reset_index()
-
-    df_agg['pick_label'] = df_agg['pick'].apply(lambda x: f"Pick #{x}")
-    
+
+    # X-axis is sorted by each player's median pick
+    x_order = table.player_order()
+
+    # One row per (pick, team, player) cell with its consensus_count and expert_info
+    df_agg = table.to_frame()
+
+    df_agg['pick_label'] = "Pick #" + df_agg['pick'].astype(str)
+
     def get_team_color(team):
         return colors_map.get(team, {}).get("primary", "#555555")
 
+    # Fill colors go in as codes into a colorscale with one stop per team color:
+    # Plotly validates numeric arrays in bulk but color strings one by one
+    team_colors = sorted({get_team_color(team) for team in df_agg['team'].unique()})
+    color_codes = {color: code for code, color in enumerate(team_colors)}
+    df_agg['color_code'] = [color_codes[get_team_color(team)] for team in df_agg['team']]
+    last_code = max(len(team_colors) - 1, 1)
+    colorscale = [[code / last_code, color] for code, color in enumerate(team_colors)]
+    if len(team_colors) == 1:
+        colorscale.append([1, team_colors[0]])
+
     # 2. Create Visualization
     fig = go.Figure()
 
-    # Plot all draft slots
-    # We group by team just for organizational purposes in the hover/data
-    for team in df_agg['team'].unique():
-        team_df = df_agg[df_agg['team'] == team]
-        
-        for _, row in team_df.iterrows():
-            border_width = 4 if row['consensus_count'] >= 7 else 1.5
-            team_color = get_team_color(row['team'])
-            
-            line_style = dict(width=border_width, color="white") # High contrast border
-            if row['is_trade']:
-                line_style['dash'] = 'dot'
-
-            fig.add_trace(go.Scatter(
-                x=[row['player']],
-                y=[row['pick_label']],
-                mode='markers+text',
-                name=team,
-                marker=dict(
-                    size=row['consensus_count'] * 6 + 25, 
-                    color=team_color, # Fill color is Team Color
-                    symbol='square',
-                    line=line_style
-                ),
-                text=row['consensus_count'],
-                textposition="middle center",
-                textfont=dict(color='white', size=11, family="Arial Black"),
-                customdata=[[row['consensus_count'], row['expert_info'], row['position'], row['team'], row['is_trade'], row['default_team']]],
-                hovertemplate=(
-                    "<b>%{x} (%{customdata[2]})</b><br>" +
-                    "Team: <b>%{customdata[3]}</b>" + (" (TRADE UP)" if row['is_trade'] else "") + "<br>" +
-                    "Default Owner: %{customdata[5]}<br>" +
-                    "Consensus: %{customdata[0]} Experts<br>" +
-                    "<br><b>Recent Expert Projections:</b>%{customdata[1]}<extra></extra>"
-                ),
-                showlegend=False
-            ))
+    # Plot all draft slots as one batched trace per border style (projected
+    # trades get a dotted border); size, color, border width and hover data are
+    # per-point arrays, so the trace count does not grow with the board
+    for is_trade, cells in df_agg.groupby('is_trade', sort=True):
+        counts = cells['consensus_count'].to_numpy()
+        line_style = dict(width=np.where(counts >= 7, 4, 1.5), color="white") # High contrast border
+        if is_trade:
+            line_style['dash'] = 'dot'
+
+        fig.add_trace(go.Scatter(
+            x=cells['player'],
+            y=cells['pick_label'],
+            mode='markers+text',
+            name="Trades" if is_trade else "Picks",
+            marker=dict(
+                size=counts * 6 + 25,
+                color=cells['color_code'].to_numpy(), # Fill color is Team Color
+                colorscale=colorscale,
+                cmin=0,
+                cmax=last_code,
+                symbol='square',
+                line=line_style
+            ),
+            text=counts.tolist(),
+            textposition="middle center",
+            textfont=dict(color='white', size=11, family="Arial Black"),
+            customdata=cells[['consensus_count', 'expert_info', 'position', 'team', 'is_trade', 'default_team']].to_numpy(dtype=object),
+            hovertemplate=(
+                "<b>%{x} (%{customdata[2]})</b><br>" +
+                "Team: <b>%{customdata[3]}</b>" + (" (TRADE UP)" if is_trade else "") + "<br>" +
+                "Default Owner: %{customdata[5]}<br>" +
+                "Consensus: %{customdata[0]} Experts<br>" +
+                "<br><b>Recent Expert Projections:</b>%{customdata[1]}<extra></extra>"
+            ),
+            showlegend=False
+        ))
 
     # 3. Customize Layout
-    y_labels = [f"Pick #{i}" for i in range(1, 16)][::-1]
+    last_pick = max(15, int(df_agg['pick'].max()))
+    y_labels = [f"Pick #{i}" for i in range(1, last_pick + 1)][::-1]
 
     fig.update_layout(
         title={
@@ -91,7 +96,7 @@ def create_draft_heatmap():
     fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='#eeeeee')
 
     # 4. Sorted List Footer (Multi-Annotation for 2-column effect)
-    sorted_registry = sorted(MOCK_REGISTRY.values(), key=lambda x: x['date'], reverse=True)
+    sorted_registry = sorted(load_mock_registry().values(), key=lambda x: x['date'], reverse=True)
     mid = (len(sorted_registry) + 1) // 2
     col1, col2 = sorted_registry[:mid], sorted_registry[mid:]
 
@@ -0,0 +1,186 @@
+"""
+Batch rendering of score-over-time charts for a whole season (or one team's
+season).
+
+The schedule, the season's play-by-play and the team registry are loaded once in
+the parent process; each game's plays are then handed to a pool of worker
+processes that render plot_scores PNGs with the non-interactive Agg backend.
+"""
+
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+from . import game_clock, pbp_store, schedule_index, utils
+from .metrics_cache import cached_analyze_game
+from .score_over_time import get_sorted_plays, plot_scores
+from .team_games import fetch_team_games
+
+
+def select_games(season, team_abbr=None, game_type=None):
+    """
+    Returns the schedule rows of the season's completed games, optionally only
+    those of one team (via fetch_team_games) and/or one game type (e.g. "REG").
+    """
+    if team_abbr:
+        games = fetch_team_games(season, team_abbr) or []
+        rows = [schedule_index.get_game(game["game_id"], season) or game for game in games]
+    else:
+        schedule = schedule_index.load_season(season)
+        rows = schedule.sort("game_id").to_dicts() if "game_id" in schedule.columns else []
+
+    return [
+        row
+        for row in rows
+        if row.get("home_score") is not None
+        and row.get("away_score") is not None
+        and (game_type is None or row.get("game_type") == game_type)
+    ]
+
+
+def get_output_path(output_dir, game_id):
+    """Returns the PNG path of a game's chart in the output directory."""
+    return os.path.join(output_dir, f"{game_id}.png")
+
+
+def _init_worker(team_registry):
+    # Batch output is always written to files, so never start a GUI backend
+    matplotlib.use("Agg")
+    # Seed the team registry so workers never reload team data
+    utils._TEAM_REGISTRY = team_registry
+
+
+def _render_game(task):
+    """Renders one game's chart in a worker. Returns (game_id, error or None)."""
+    row, plays, output_path = task
+    game_id = row["game_id"]
+    try:
+        playoff = game_clock.is_playoff(row.get("game_type"))
+        plays = get_sorted_plays(plays, playoff=playoff)
+        teams_and_scores = (row["home_team"], row["away_team"], row["home_score"], row["away_score"])
+        plot_scores(
+            plays,
+            game_id,
+            *teams_and_scores,
+            output_path=output_path,
+            analysis=cached_analyze_game(plays, *teams_and_scores, game_id=game_id),
+            playoff=playoff,
+        )
+        return game_id, None
+    except Exception as e:
+        return game_id, str(e)
+
+
+def render_season(
+    season, output_dir, team_abbr=None, game_type=None, workers=None, skip_existing=False
+):
+    """
+    Renders the score-over-time chart of every selected game of a season into
+    output_dir as <game_id>.png. Returns a dict of game_id -> output path for
+    the games that were rendered successfully.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    rows = select_games(season, team_abbr, game_type)
+    if skip_existing:
+        rows = [row for row in rows if not os.path.exists(get_output_path(output_dir, row["game_id"]))]
+    if not rows:
+        print(f"No games to render for {team_abbr or 'the league'} in {season}.")
+        return {}
+
+    # One projected read of the season's plays, split into per-game frames
+    plays = pbp_store.load_season(season)
+    if plays.is_empty():
+        return {}
+    plays_by_game = {
+        game_id: game_plays
+        for (game_id,), game_plays in plays.partition_by("game_id", as_dict=True).items()
+    }
+
+    tasks = []
+    for row in rows:
+        game_plays = plays_by_game.get(row["game_id"])
+        if game_plays is None:
+            print(f"Warning: No plays found for game ID: {row['game_id']}.")
+            continue
+        tasks.append((row, game_plays, get_output_path(output_dir, row["game_id"])))
+
+    team_registry = utils.load_team_registry()
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(tasks) <= 1:
+        _init_worker(team_registry)
+        results = [_render_game(task) for task in tasks]
+    else:
+        # Polars' thread pool does not survive fork, so workers are spawned fresh
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(team_registry,),
+        ) as executor:
+            results = list(executor.map(_render_game, tasks))
+
+    rendered = {}
+    for game_id, error in results:
+        if error:
+            print(f"Error rendering {game_id}: {error}")
+        else:
+            rendered[game_id] = get_output_path(output_dir, game_id)
+    return rendered
+
+
+def main():
+    """
+    Main function
+    """
+    parser = argparse.ArgumentParser(
+        description="Render score-over-time charts for every game of a season."
+    )
+    parser.add_argument("season", type=int, help="The season year (e.g., 2023)")
+    parser.add_argument(
+        "-t", "--team", type=str, help="Only render this team's games (e.g., KC)."
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default="charts",
+        help="Directory to write the PNG files to (default: charts).",
+    )
+    parser.add_argument(
+        "--game-type",
+        type=str,
+        help="Only render games of this type (e.g., REG or POST).",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Do not re-render games whose PNG already exists.",
+    )
+
+    args = parser.parse_args()
+    team_abbr = args.team.upper() if args.team else None
+    game_type = args.game_type.upper() if args.game_type else None
+
+    rendered = render_season(
+        args.season,
+        args.output_dir,
+        team_abbr=team_abbr,
+        game_type=game_type,
+        workers=args.workers,
+        skip_existing=args.skip_existing,
+    )
+    print(f"Rendered {len(rendered)} charts to {args.output_dir}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Process-wide index over nflverse schedules.
+
+Each season's schedule is loaded once, persisted to the local cache as Parquet
+and indexed by game_id and by (season, franchise), so validating a game or
+listing a team's games is a dictionary lookup instead of a reload and a frame
+scan.
+"""
+
+import os
+import time
+
+import polars as pl
+
+from . import tracing
+from .data_source import get_data_source
+from .utils import franchise_id, franchise_ids, get_cache_dir
+
+# Cached schedules of seasons that still have unplayed games are refetched after this age.
+SCHEDULE_TTL_SECONDS = 6 * 60 * 60
+
+_SCHEDULES = {}  # season -> Polars schedule DataFrame
+_GAMES_BY_ID = {}  # game_id -> schedule row dict
+_GAMES_BY_FRANCHISE = {}  # (season, franchise_id) -> list of schedule row dicts, by game_id
+
+
+def clear_cache():
+    """Drops the in-process index (the on-disk cache is left untouched)."""
+    _SCHEDULES.clear()
+    _GAMES_BY_ID.clear()
+    _GAMES_BY_FRANCHISE.clear()
+
+
+def get_schedule_path(season):
+    """Returns the Parquet path of a season's cached schedule."""
+    return os.path.join(get_cache_dir("schedules"), f"season={int(season)}.parquet")
+
+
+def get_season_from_game_id(game_id):
+    """Returns the season encoded in a YYYY_WEEK_AWAY_HOME game ID, or None."""
+    prefix = str(game_id).split("_")[0]
+    return int(prefix) if prefix.isdigit() else None
+
+
+def _is_complete(schedule):
+    """A season is complete once every game has a final score."""
+    if schedule.is_empty() or "home_score" not in schedule.columns:
+        return False
+    return schedule["home_score"].null_count() == 0
+
+
+def _is_fresh(path, schedule):
+    """Completed seasons never go stale; others are reused until the TTL expires."""
+    if _is_complete(schedule):
+        return True
+    return time.time() - os.path.getmtime(path) < SCHEDULE_TTL_SECONDS
+
+
+def _save_season(season, schedule):
+    path = get_schedule_path(season)
+    tmp_path = f"{path}.tmp"
+    schedule.write_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _index_season(season, schedule):
+    _SCHEDULES[season] = schedule
+
+    if schedule.is_empty() or "game_id" not in schedule.columns:
+        return
+
+    schedule = schedule.sort("game_id")
+    # Current and historical abbreviations resolve to one franchise key (e.g. OAK and LV)
+    home_ids = franchise_ids(schedule["home_team"].fill_null("")) if "home_team" in schedule.columns else None
+    away_ids = franchise_ids(schedule["away_team"].fill_null("")) if "away_team" in schedule.columns else None
+    for i, row in enumerate(schedule.to_dicts()):
+        _GAMES_BY_ID[row["game_id"]] = row
+        for ids in (home_ids, away_ids):
+            if ids is not None and ids[i] >= 0:
+                _GAMES_BY_FRANCHISE.setdefault((season, int(ids[i])), []).append(row)
+
+
+def _load_cached_season(season):
+    """Indexes a season from the on-disk cache. Returns False if missing or stale."""
+    path = get_schedule_path(season)
+    if not os.path.exists(path):
+        return False
+
+    schedule = pl.read_parquet(path)
+    if tracing.enabled():
+        tracing.count("rows_scanned", len(schedule))
+        tracing.count("bytes_loaded", os.path.getsize(path))
+    if not _is_fresh(path, schedule):
+        return False
+
+    _index_season(season, schedule)
+    return True
+
+
+def _ensure_seasons(seasons):
+    """
+    Indexes any of the given seasons that are not indexed yet, fetching missing
+    or stale ones from nflreadpy in a single call. Returns the sorted seasons.
+    """
+    seasons = sorted({int(season) for season in seasons})
+    missing = [season for season in seasons if season not in _SCHEDULES]
+    if missing:
+        with tracing.span("schedule.load", seasons=missing):
+            missing = [season for season in missing if not _load_cached_season(season)]
+            _fetch_seasons(missing)
+    return seasons
+
+
+def load_seasons(seasons):
+    """
+    Ensures the schedules of the given seasons are indexed, fetching any missing
+    or stale seasons from nflreadpy in a single call. Returns the combined schedule.
+    """
+    seasons = _ensure_seasons(seasons)
+    return pl.concat([_SCHEDULES[season] for season in seasons], how="diagonal_relaxed")
+
+
+def _fetch_seasons(seasons):
+    """
+    Fetches seasons from the data source (nflreadpy by default) in a single
+    call, then saves and indexes each.
+    """
+    if not seasons:
+        return
+
+    with tracing.span("schedule.fetch", seasons=seasons):
+        fetched = get_data_source().load_schedules(seasons)
+        tracing.count("rows_scanned", len(fetched))
+    for season in seasons:
+        if len(seasons) == 1:
+            schedule = fetched
+        else:
+            schedule = fetched.filter(pl.col("season") == season)
+        _save_season(season, schedule)
+        _index_season(season, schedule)
+
+
+def _is_cached_on_disk(season):
+    """
+    Returns True if a fresh copy of the season is on disk, reading at most the
+    home_score column (completed seasons never go stale).
+    """
+    path = get_schedule_path(season)
+    if not os.path.exists(path):
+        return False
+    if time.time() - os.path.getmtime(path) < SCHEDULE_TTL_SECONDS:
+        return True
+    return _is_complete(pl.read_parquet(path, columns=["home_score"]))
+
+
+def scan_seasons(seasons):
+    """
+    Returns a lazy Polars scan over the cached schedule Parquet files of the
+    given seasons, fetching any missing or stale seasons first. Filters applied
+    to the scan are pushed down into the Parquet reads.
+    """
+    seasons = sorted({int(season) for season in seasons})
+    with tracing.span("schedule.load", seasons=seasons):
+        _fetch_seasons(
+            [season for season in seasons if season not in _SCHEDULES and not _is_cached_on_disk(season)]
+        )
+
+    # Seasons may differ slightly in schema (e.g. all-null columns), so each file
+    # is scanned separately and combined with relaxed type unification.
+    scans = [pl.scan_parquet(get_schedule_path(season)) for season in seasons]
+    if not scans:
+        return pl.LazyFrame()
+    return pl.concat(scans, how="diagonal_relaxed")
+
+
+def load_season(season):
+    """Returns a single season's schedule, loading and indexing it if needed."""
+    _ensure_seasons([season])
+    return _SCHEDULES[int(season)]
+
+
+def get_game(game_id, season=None):
+    """
+    Returns the schedule row (as a dict) for a game ID, or None if the game is
+    not in its season's schedule. The season is inferred from the ID if omitted.
+    """
+    if season is None:
+        season = get_season_from_game_id(game_id)
+        if season is None:
+            return None
+
+    load_season(season)
+    return _GAMES_BY_ID.get(game_id)
+
+
+def get_team_games(season, team_abbr):
+    """
+    Returns a team's (franchise's) schedule rows for a season, sorted by
+    game_id. Historical abbreviations match the whole franchise.
+    """
+    load_season(season)
+    return _GAMES_BY_FRANCHISE.get((int(season), franchise_id(team_abbr)), [])
+
+
+def get_franchise_games(seasons, team_abbr):
+    """
+    Returns every game of a franchise across the given seasons, sorted by
+    game_id. The team may be given by a current or historical abbreviation
+    (e.g. OAK or LV), and games under any of the franchise's abbreviations match.
+
+    Each season's games are a dictionary lookup on (season, franchise ID), so a
+    multi-decade query concatenates the per-season lists without scanning or
+    combining the schedules.
+    """
+    target = franchise_id(team_abbr)
+    seasons = _ensure_seasons(seasons)
+    if target < 0:
+        return []
+    return [row for season in seasons for row in _GAMES_BY_FRANCHISE.get((season, target), [])]
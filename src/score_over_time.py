@@ -2,22 +2,27 @@ import sys
 import argparse
 import textwrap
 
-import nflreadpy
-import polars as pl
 import pandas as pd
-import matplotlib.pyplot as plt
-import mplcursors
+import polars as pl
 
-from .utils import get_team_colors_map, get_distinct_colors
+from . import game_clock, pbp_store, schedule_index, tracing
+from .game_analysis import analyze_game, analysis_to_json, format_analysis
+from .metrics_cache import cached_analyze_game
+from .utils import (
+    DEFAULT_HOME_COLORS,
+    DEFAULT_VISITOR_COLORS,
+    get_distinct_colors,
+    get_team_colors_map,
+)
 
 ### FUNCTIONS ###
 
 
-def get_game_id_and_metadata(target_game_id_str):
+def get_game_row(target_game_id_str):
     """
-    Parses a game ID string (YYYY_WEEK_HOME_AWAY), loads schedules for the season,
-    filters to find the specific game, and returns its 10-digit game_id and metadata.
-    Returns (None, None) if the game is not found or an error occurs.
+    Parses a game ID string (YYYY_WEEK_HOME_AWAY) and looks the game up in the
+    season's schedule index. Returns its schedule row as a dict, or None if the
+    game is not found or an error occurs.
     """
     try:
         parts = target_game_id_str.split("_")
@@ -25,45 +30,40 @@ def get_game_id_and_metadata(target_game_id_str):
             print(
                 f"Invalid game ID format: {target_game_id_str}. Expected YYYY_WEEK_HOME_AWAY."
             )
-            return None, None
+            return None
 
         season = int(parts[0])
         week = int(parts[1])
         home_team_abbr = parts[2]
         visitor_team_abbr = parts[3]
 
-        # Load schedules for the given season
-        # nflreadpy.load_schedules takes 'seasons' as an argument.
-        schedules_df = nflreadpy.load_schedules(seasons=season)
-
-        # Filter for the specific game using week, home_team, and away_team
-        # Note: nflreadpy uses 'home_team' and 'away_team' for abbreviations.
-        # The actual game_id column is a 10-digit number.
-        game_info_polars = schedules_df.filter(
-            (pl.col("game_id") == target_game_id_str)
-        )
+        # Look the game up in the shared schedule index. The season's schedule is
+        # loaded once per process (and cached on disk), so repeated lookups are cheap.
+        game_row = schedule_index.get_game(target_game_id_str, season)
 
-        if game_info_polars.is_empty():
+        if game_row is None:
             print(
                 f"Warning: No game info found for game ID: {target_game_id_str} (Season: {season}, Week: {week}, Home: {home_team_abbr}, Away: {visitor_team_abbr})"
             )
-            return None, None
-
-        # Assuming only one game matches these criteria, take the first row
-        game_row = game_info_polars.row(0, named=True)
-
-        # Extract the 10-digit game_id and convert it to string
-        game_id_10_digit = str(game_row["game_id"])
-
-        # Create a Pandas DataFrame for the metadata, similar to original behavior
-        metadata_df = pd.DataFrame([game_row])
-
-        return game_id_10_digit, metadata_df
+        return game_row
 
     except (ValueError, IndexError) as e:
         print(f"Error parsing game ID '{target_game_id_str}': {e}")
+        return None
+
+
+def get_game_id_and_metadata(target_game_id_str):
+    """
+    Looks a game up (see get_game_row) and returns its 10-digit game_id and
+    its metadata as a one-row pandas DataFrame, or (None, None).
+    """
+    game_row = get_game_row(target_game_id_str)
+    if game_row is None:
         return None, None
 
+    # Create a Pandas DataFrame for the metadata, similar to original behavior
+    return str(game_row["game_id"]), pd.DataFrame([game_row])
+
 
 def get_season_from_game_id(game_id_str):
     """
@@ -82,34 +82,31 @@ def get_season_from_game_id(game_id_str):
 
 
 def load_plays_for_game(
-    target_game_id_str, season
+    target_game_id_str, season, columns=pbp_store.PLAY_COLUMNS
 ):  # 'season' parameter is no longer strictly needed but kept for signature compatibility
-    """Loads play-by-play data for a specific game using nflreadpy."""
-    # Use the helper function to get the 10-digit game_id and metadata
-    game_id_10_digit, metadata_df = get_game_id_and_metadata(target_game_id_str)
-
-    if game_id_10_digit is None:
-        # get_game_id_and_metadata already prints warnings/errors
-        return pd.DataFrame()
-
-    # Corrected: Use 'seasons' parameter and then filter by game_id string
-    pbp_df_polars = nflreadpy.load_pbp(seasons=[season])
+    """
+    Loads play-by-play data for a specific game as a Polars DataFrame,
+    projected down to the given columns (pbp_store.PLAY_COLUMNS by default).
+    """
+    # Only the game's existence and 10-digit game_id are needed here, not its metadata
+    game_row = get_game_row(target_game_id_str)
 
-    if pbp_df_polars.is_empty():
-        print(f"Warning: No plays found for season {season}.")
-        return pd.DataFrame()
+    if game_row is None:
+        # get_game_row already prints warnings/errors
+        return pl.DataFrame()
+    game_id_10_digit = str(game_row["game_id"])
 
-    # Filter the loaded DataFrame for the specific game using the string ID
-    game_plays = pbp_df_polars.filter(pl.col("game_id") == target_game_id_str)
+    # Read only this game's partition from the local store. The full season is
+    # downloaded from nflreadpy only the first time one of its games is requested.
+    game_plays = pbp_store.load_game(target_game_id_str, season, columns=columns)
 
     if game_plays.is_empty():
         print(
             f"Warning: No plays found for game ID: {target_game_id_str} (10-digit ID: {game_id_10_digit}) after loading season data."
         )
-        return pd.DataFrame()
 
-    # Convert to Pandas DataFrame via list of dicts to avoid pyarrow dependency
-    return pd.DataFrame(game_plays.to_dicts())
+    # Plays stay in Polars; plot_scores converts to pandas only at the plotting boundary
+    return game_plays
 
 
 def load_game_info(
@@ -127,20 +124,36 @@ def load_game_info(
     return metadata_df
 
 
-def get_sorted_plays(df):
-    """Sorts plays chronologically by quarter and clock."""
-    # nflreadpy provides 'qtr' (float) and 'game_seconds_remaining' (float) directly.
-    # We need to calculate 'game_seconds_elapsed' for plotting consistency.
+def get_sorted_plays(df, playoff=None):
+    """
+    Sorts plays (a Polars DataFrame) chronologically, overtime included.
+
+    game_seconds_elapsed is derived from each play's quarter and quarter clock in
+    one vectorized pass (see game_clock), so OT plays continue past 3600 seconds
+    with the right period length. It is monotonic over the game, so a stable
+    sort on that single key orders the plays and keeps plays sharing a clock
+    value in feed order. playoff defaults to season_type == "POST" when the
+    plays carry it.
+    """
+    with tracing.span("sort", plays=len(df)):
+        df = df.with_columns(
+            pl.col("qtr").cast(pl.Float64),
+            pl.Series("game_seconds_elapsed", game_clock.game_seconds_elapsed(df, playoff=playoff)),
+        )
 
-    # Ensure 'qtr' is float for calculation
-    df["qtr"] = df["qtr"].astype(float)
+        # Sort plays chronologically
+        return df.sort("game_seconds_elapsed", maintain_order=True)
 
-    # Calculate game seconds elapsed: Total game seconds (3600) - game_seconds_remaining
-    # nflreadpy's game_seconds_remaining is total seconds remaining in the game.
-    df["game_seconds_elapsed"] = 3600 - df["game_seconds_remaining"]
 
-    # Sort plays chronologically
-    return df.sort_values(by=["qtr", "game_seconds_remaining"], ascending=[True, False])
+def to_plot_frame(df):
+    """
+    Converts a Polars play frame to pandas for plotting without going through
+    Python dicts or pyarrow: each column is handed over as a NumPy array, which
+    is zero-copy for numeric columns without nulls. Pandas input is returned as is.
+    """
+    if isinstance(df, pd.DataFrame):
+        return df
+    return pd.DataFrame({name: df[name].to_numpy() for name in df.columns})
 
 
 def plot_scores(
@@ -152,13 +165,27 @@ def plot_scores(
     final_visitor_score,
     output_path=None,
     debug=False,
+    analysis=None,
+    playoff=None,
 ):
-    """Generates and displays (or saves) a plot of scores and net difference over time."""
+    """
+    Generates and displays (or saves) a plot of scores and net difference over time.
+    A precomputed game_analysis.analyze_game result can be passed to skip derivation.
+    playoff selects the overtime period length drawn (see get_sorted_plays).
+    """
+    # Plotting libraries are imported on first use; text and JSON output never need them
+    import matplotlib.pyplot as plt
+    import mplcursors
+
+    with tracing.span("pandas_conversion", plays=len(df)):
+        df = to_plot_frame(df)
+    periods = game_clock.get_periods(df, playoff=playoff)
 
     # Fetch team colors
-    colors_map = get_team_colors_map()
-    home_team_colors = colors_map.get(home_team_name, {"primary": "blue", "secondary": "white"})
-    visitor_team_colors = colors_map.get(visitor_team_name, {"primary": "red", "secondary": "white"})
+    with tracing.span("teams.load"):
+        colors_map = get_team_colors_map()
+    home_team_colors = colors_map.get(home_team_name, DEFAULT_HOME_COLORS)
+    visitor_team_colors = colors_map.get(visitor_team_name, DEFAULT_VISITOR_COLORS)
 
     # Ensure colors are distinct (collision logic)
     home_primary, visitor_primary = get_distinct_colors(home_team_colors, visitor_team_colors)
@@ -173,10 +200,19 @@ def plot_scores(
     home_colors = {"primary": home_primary}
     visitor_colors = {"primary": visitor_primary}
 
-    # Use the score from the previous play as the pre-snap score for the current play.
-    # nflreadpy's total_home_score/total_away_score are POST-play totals.
-    df["preSnapHomeScore"] = df["total_home_score"].shift(1).ffill().fillna(0).astype(int)
-    df["preSnapVisitorScore"] = df["total_away_score"].shift(1).ffill().fillna(0).astype(int)
+    # Pre-snap scores (nflreadpy's total_home_score/total_away_score are POST-play
+    # totals), forward-filled possession, expected scores and the winner-relative
+    # net differences are derived column-wise by the headless analytics module.
+    if analysis is None:
+        with tracing.span("derive", game_id=target_game_id_str):
+            analysis = analyze_game(
+                df,
+                home_team_name,
+                visitor_team_name,
+                final_home_score,
+                final_visitor_score,
+                game_id=target_game_id_str,
+            )
 
     # Rename columns for consistency with the original script's logic
     df = df.rename(
@@ -190,26 +226,7 @@ def plot_scores(
             "yrdln": "yardline",
         }
     )
-
-    # Forward fill possessionTeam to handle timeouts or other plays without a posteam.
-    df["possessionTeam"] = df["possessionTeam"].ffill()
-
-    # Calculate Expected Scores
-    df["home_expected"] = df.apply(
-        lambda row: row["preSnapHomeScore"]
-        + (row["expectedPoints"] if row["possessionTeam"] == home_team_name else 0),
-        axis=1,
-    )
-    df["visitor_expected"] = df.apply(
-        lambda row: row["preSnapVisitorScore"]
-        + (row["expectedPoints"] if row["possessionTeam"] == visitor_team_name else 0),
-        axis=1,
-    )
-
-    # Forward fill expected scores to avoid dips during timeouts or possession changes
-    # where expectedPoints might be NaN or the possessionTeam is None.
-    df["home_expected"] = df["home_expected"].ffill()
-    df["visitor_expected"] = df["visitor_expected"].ffill()
+    df = df.assign(**analysis["series"])
 
     if debug:
         print("\n--- DEBUG INFO: Data Distribution ---")
@@ -280,213 +297,191 @@ def plot_scores(
         print("\n--- END DEBUG INFO ---\n")
 
     # Determine leading team (winner) for the Y-axis reference
-    if final_home_score >= final_visitor_score:
-        pos_team, neg_team = home_team_name, visitor_team_name
-        df["net_actual"] = df["preSnapHomeScore"] - df["preSnapVisitorScore"]
-        df["net_expected"] = df["home_expected"] - df["visitor_expected"]
+    pos_team, neg_team = analysis["leader"], analysis["trailer"]
+    if pos_team == home_team_name:
         pos_color, neg_color = home_colors["primary"], visitor_colors["primary"]
     else:
-        pos_team, neg_team = visitor_team_name, home_team_name
-        df["net_actual"] = df["preSnapVisitorScore"] - df["preSnapHomeScore"]
-        df["net_expected"] = df["visitor_expected"] - df["home_expected"]
         pos_color, neg_color = visitor_colors["primary"], home_colors["primary"]
 
-    # Create subplots with shared X axis and different height ratios
-    # Top (ax1) is Net Difference (larger), Bottom (ax2) is Scores (smaller)
-    _, (ax1, ax2) = plt.subplots(
-        2, 1, figsize=(10, 7), sharex=True, gridspec_kw={"height_ratios": [3, 1]}
-    )
+    with tracing.span("figure.build", plays=len(df)):
+        # Create subplots with shared X axis and different height ratios
+        # Top (ax1) is Net Difference (larger), Bottom (ax2) is Scores (smaller)
+        fig, (ax1, ax2) = plt.subplots(
+            2, 1, figsize=(10, 7), sharex=True, gridspec_kw={"height_ratios": [3, 1]}
+        )
 
-    # --- Top Subplot: Net Difference (Winner is Positive) ---
-    ax1.step(
-        df["game_seconds_elapsed"],
-        df["net_actual"],
-        label="Actual Diff",
-        where="pre",
-        color="black",
-        alpha=0.2,
-    )
-    ax1.plot(
-        df["game_seconds_elapsed"],
-        df["net_expected"],
-        label="Expected Diff",
-        color="purple",
-        linewidth=1.5,
-    )
+        # --- Top Subplot: Net Difference (Winner is Positive) ---
+        ax1.step(
+            df["game_seconds_elapsed"],
+            df["net_actual"],
+            label="Actual Diff",
+            where="pre",
+            color="black",
+            alpha=0.2,
+        )
+        ax1.plot(
+            df["game_seconds_elapsed"],
+            df["net_expected"],
+            label="Expected Diff",
+            color="purple",
+            linewidth=1.5,
+        )
 
-    ax1.fill_between(
-        df["game_seconds_elapsed"],
-        0,
-        df["net_expected"],
-        where=(df["net_expected"] >= 0),
-        color=pos_color,
-        alpha=0.2,
-        label=f"{pos_team} Lead",
-        interpolate=True,
-    )
-    ax1.fill_between(
-        df["game_seconds_elapsed"],
-        0,
-        df["net_expected"],
-        where=(df["net_expected"] < 0),
-        color=neg_color,
-        alpha=0.2,
-        label=f"{neg_team} Lead",
-        interpolate=True,
-    )
+        ax1.fill_between(
+            df["game_seconds_elapsed"],
+            0,
+            df["net_expected"],
+            where=(df["net_expected"] >= 0),
+            color=pos_color,
+            alpha=0.2,
+            label=f"{pos_team} Lead",
+            interpolate=True,
+        )
+        ax1.fill_between(
+            df["game_seconds_elapsed"],
+            0,
+            df["net_expected"],
+            where=(df["net_expected"] < 0),
+            color=neg_color,
+            alpha=0.2,
+            label=f"{neg_team} Lead",
+            interpolate=True,
+        )
 
-    ax1.axhline(y=0, color="black", linestyle="-", linewidth=1.0)  # Baseline
-
-    # Plot play-by-play points for hover on Net Difference (ax1)
-    plays_with_ep = df.dropna(subset=["expectedPoints"]).copy()
-    
-    # Assign colors to scatter points based on possession team
-    scatter_colors = [
-        home_colors["primary"] if team == home_team_name else (visitor_colors["primary"] if team == visitor_team_name else "purple")
-        for team in plays_with_ep["possessionTeam"]
-    ]
-
-    sc_net = ax1.scatter(
-        plays_with_ep["game_seconds_elapsed"],
-        plays_with_ep["net_expected"],
-        color=scatter_colors,
-        s=25, # Increased size from 15 to 25
-        alpha=0.8, # Slightly increased alpha for prominence
-        edgecolors="white",
-        linewidths=0.7, # Slightly increased linewidth for prominence
-        label="_nolegend_",
-    )
+        ax1.axhline(y=0, color="black", linestyle="-", linewidth=1.0)  # Baseline
+
+        # Plot play-by-play points for hover on Net Difference (ax1)
+        plays_with_ep = df.dropna(subset=["expectedPoints"]).copy()
 
-    # Add hover functionality
-    cursor = mplcursors.cursor(sc_net, hover=True)
-
-    @cursor.connect("add")
-    def on_add(sel):
-        row = plays_with_ep.iloc[sel.index]
-        qtr = row["quarter"]
-        down = row["down"]
-        togo = row["yardsToGo"]
-        yrdln = row["yardline"]
-        home_score = row["preSnapHomeScore"]
-        visitor_score = row["preSnapVisitorScore"]
-        ep_val = row["expectedPoints"]
-        epa_val = row.get("expectedPointsAdded", 0.0)
-        desc = row.get("desc", "No description")
-
-        # Format situation string: "Q1 - 3rd & 10 at KC 25"
-        situation = f"Q{int(qtr)}"
-        if pd.notna(down) and pd.notna(togo):
-            situation += f" - {int(down)} & {int(togo)}"
-        if pd.notna(yrdln):
-            situation += f" at {yrdln}"
-
-        # Format score string: "DET 10 - KC 14"
-        score_str = f"{visitor_team_name} {int(visitor_score)} - {home_team_name} {int(home_score)}"
-
-        wrapped_desc = "\n".join(textwrap.wrap(str(desc), width=45))
-
-        hover_text = (
-            f"{situation} | {score_str}\n\n"
-            f"{wrapped_desc}\n\n"
-            f"EP: {ep_val:.2f} | EPA: {epa_val:+.2f}\n"
+        # Assign colors to scatter points based on possession team
+        scatter_colors = [
+            home_colors["primary"] if team == home_team_name else (visitor_colors["primary"] if team == visitor_team_name else "purple")
+            for team in plays_with_ep["possessionTeam"]
+        ]
+
+        sc_net = ax1.scatter(
+            plays_with_ep["game_seconds_elapsed"],
+            plays_with_ep["net_expected"],
+            color=scatter_colors,
+            s=25, # Increased size from 15 to 25
+            alpha=0.8, # Slightly increased alpha for prominence
+            edgecolors="white",
+            linewidths=0.7, # Slightly increased linewidth for prominence
+            label="_nolegend_",
         )
 
-        sel.annotation.set_text(hover_text)
-        sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9, boxstyle="round,pad=0.5")
-        sel.annotation.set_fontsize(9)
+        # Add hover functionality (only useful when the figure is shown interactively)
+        if output_path is None:
+            cursor = mplcursors.cursor(sc_net, hover=True)
+
+            @cursor.connect("add")
+            def on_add(sel):
+                row = plays_with_ep.iloc[sel.index]
+                qtr = row["quarter"]
+                down = row["down"]
+                togo = row["yardsToGo"]
+                yrdln = row["yardline"]
+                home_score = row["preSnapHomeScore"]
+                visitor_score = row["preSnapVisitorScore"]
+                ep_val = row["expectedPoints"]
+                epa_val = row.get("expectedPointsAdded", 0.0)
+                desc = row.get("desc", "No description")
+
+                # Format situation string: "Q1 - 3rd & 10 at KC 25"
+                situation = f"Q{int(qtr)}"
+                if pd.notna(down) and pd.notna(togo):
+                    situation += f" - {int(down)} & {int(togo)}"
+                if pd.notna(yrdln):
+                    situation += f" at {yrdln}"
+
+                # Format score string: "DET 10 - KC 14"
+                score_str = f"{visitor_team_name} {int(visitor_score)} - {home_team_name} {int(home_score)}"
+
+                wrapped_desc = "\n".join(textwrap.wrap(str(desc), width=45))
+
+                hover_text = (
+                    f"{situation} | {score_str}\n\n"
+                    f"{wrapped_desc}\n\n"
+                    f"EP: {ep_val:.2f} | EPA: {epa_val:+.2f}\n"
+                )
 
-    ax1.set_title(
-        f"Net Difference and Lead: {visitor_team_name} at {home_team_name} ({target_game_id_str})"
-    )
-    ax1.set_ylabel(f"Lead Magnitude\n({pos_team} Lead +)")
-    ax1.legend(loc="upper right", fontsize="x-small")
-    ax1.grid(True, linestyle="--", alpha=0.7)
-
-    # --- Bottom Subplot: Scores ---
-    ax2.step(
-        df["game_seconds_elapsed"],
-        df["preSnapHomeScore"],
-        label=f"{home_team_name} Actual",
-        where="pre",
-        color=home_colors["primary"],
-        alpha=0.3,
-    )
-    ax2.step(
-        df["game_seconds_elapsed"],
-        df["preSnapVisitorScore"],
-        label=f"{visitor_team_name} Actual",
-        where="pre",
-        color=visitor_colors["primary"],
-        alpha=0.3,
-    )
+                sel.annotation.set_text(hover_text)
+                sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9, boxstyle="round,pad=0.5")
+                sel.annotation.set_fontsize(9)
 
-    ax2.plot(
-        df["game_seconds_elapsed"],
-        df["home_expected"],
-        label=f"{home_team_name} Expected",
-        color=home_colors["primary"],
-        linewidth=2,
-    )
-    ax2.plot(
-        df["game_seconds_elapsed"],
-        df["visitor_expected"],
-        label=f"{visitor_team_name} Expected",
-        color=visitor_colors["primary"],
-        linewidth=2,
-    )
+        ax1.set_title(
+            f"Net Difference and Lead: {visitor_team_name} at {home_team_name} ({target_game_id_str})"
+        )
+        ax1.set_ylabel(f"Lead Magnitude\n({pos_team} Lead +)")
+        ax1.legend(loc="upper right", fontsize="x-small")
+        ax1.grid(True, linestyle="--", alpha=0.7)
+
+        # --- Bottom Subplot: Scores ---
+        ax2.step(
+            df["game_seconds_elapsed"],
+            df["preSnapHomeScore"],
+            label=f"{home_team_name} Actual",
+            where="pre",
+            color=home_colors["primary"],
+            alpha=0.3,
+        )
+        ax2.step(
+            df["game_seconds_elapsed"],
+            df["preSnapVisitorScore"],
+            label=f"{visitor_team_name} Actual",
+            where="pre",
+            color=visitor_colors["primary"],
+            alpha=0.3,
+        )
 
-    ax2.set_ylabel("Points")
-    ax2.set_xlabel("Game Seconds Elapsed")
-    ax2.legend()
-    ax2.grid(True, linestyle="--", alpha=0.7)
-
-    # Add vertical lines for quarter breaks to both subplots
-    for ax in [ax1, ax2]:
-        for q in range(1, 5):
-            ax.axvline(x=q * 900, color="gray", linestyle="-", alpha=0.5)
-            if ax == ax1:
-                ax.text(
-                    q * 900 - 450,
-                    ax.get_ylim()[1] * 0.95,
-                    f"Q{q}",
-                    horizontalalignment="center",
-                )
+        ax2.plot(
+            df["game_seconds_elapsed"],
+            df["home_expected"],
+            label=f"{home_team_name} Expected",
+            color=home_colors["primary"],
+            linewidth=2,
+        )
+        ax2.plot(
+            df["game_seconds_elapsed"],
+            df["visitor_expected"],
+            label=f"{visitor_team_name} Expected",
+            color=visitor_colors["primary"],
+            linewidth=2,
+        )
 
-    plt.tight_layout()
+        ax2.set_ylabel("Points")
+        ax2.set_xlabel("Game Seconds Elapsed")
+        ax2.legend()
+        ax2.grid(True, linestyle="--", alpha=0.7)
+
+        # Add vertical lines for quarter (and overtime period) breaks to both subplots
+        for ax in [ax1, ax2]:
+            for label, start, end in periods:
+                ax.axvline(x=end, color="gray", linestyle="-", alpha=0.5)
+                if ax == ax1:
+                    ax.text(
+                        (start + end) / 2,
+                        ax.get_ylim()[1] * 0.95,
+                        label,
+                        horizontalalignment="center",
+                    )
+
+        plt.tight_layout()
     if output_path:
-        plt.savefig(output_path)
+        with tracing.span("figure.save", path=output_path):
+            plt.savefig(output_path)
         print(f"Graph saved to {output_path}")
+        # Free the figure so long batch runs do not accumulate open figures
+        plt.close(fig)
     else:
         plt.show()
 
 
-### MAIN ###
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(
-        description="Plot scores and expected points over time for a specific game."
-    )
-    # Expecting game_id to be a string in nflverse format, e.g., '2023_01_ARI_WAS'
-    parser.add_argument(
-        "game_id", type=str, help="The nflverse game ID (e.g., '2023_01_ARI_WAS')."
-    )
-    parser.add_argument(
-        "-o",
-        "--output",
-        help="Path to save the output graph file (e.g., 'output.png'). "
-        + "If not provided, the graph will be displayed.",
-    )
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Enable debug logging to investigate data distribution.",
-    )
-
-    args = parser.parse_args()
-    game_id_str = args.game_id  # This is now expected to be a string
-    output_arg = args.output
-    debug_mode = args.debug
-
+def view_game(game_id_str, output_format="plot", output_path=None, debug=False):
+    """
+    Loads a game and shows its score-over-time graph, or prints/saves its
+    analysis as text or JSON. Returns False if the game could not be loaded.
+    """
     # Determine season from game_id_str. This is used for signature compatibility
     # with load_game_info and load_plays_for_game, which now re-parse season internally.
     season = get_season_from_game_id(game_id_str)
@@ -497,7 +492,7 @@ if __name__ == "__main__":
     df_game = load_game_info(game_id_str, season)
     if df_game.empty:
         # load_game_info (via get_game_id_and_metadata) already prints specific errors/warnings.
-        sys.exit(1)
+        return False
 
     # Extract team names and final scores from game_info DataFrame
     # Use .iloc[0] as filter should return at most one row.
@@ -506,25 +501,51 @@ if __name__ == "__main__":
         visitor_team_name = df_game["away_team"].iloc[0]
         home_final_score = df_game["home_score"].iloc[0]
         visitor_final_score = df_game["away_score"].iloc[0]
+        playoff = game_clock.is_playoff(df_game.get("game_type", pd.Series([None])).iloc[0])
     except IndexError:
         print(
             "Error: Could not retrieve team names or scores from game info. Ensure game_id is correct and data is loaded."
         )
-        sys.exit(1)
+        return False
     except KeyError as e:
         print(f"Error: Missing expected column in game info: {e}")
-        sys.exit(1)
+        return False
 
     # Load plays for the game
     # The 'season' parameter is passed for signature compatibility, but load_plays_for_game
     # re-parses it from game_id_str internally.
-    df_plays_pd = load_plays_for_game(game_id_str, season)
-    if df_plays_pd.empty:
+    df_plays = load_plays_for_game(game_id_str, season)
+    if df_plays.is_empty():
         # load_plays_for_game (via get_game_id_and_metadata) already prints specific errors/warnings.
-        sys.exit(1)
+        return False
 
     # Sort plays chronologically
-    df_sorted = get_sorted_plays(df_plays_pd)
+    df_sorted = get_sorted_plays(df_plays, playoff=playoff)
+
+    # Derive the expected-score series once (or load it from the metrics cache);
+    # every output format shares it
+    game_analysis = cached_analyze_game(
+        df_sorted,
+        home_team_name,
+        visitor_team_name,
+        home_final_score,
+        visitor_final_score,
+        game_id=game_id_str,
+    )
+
+    if output_format != "plot":
+        if output_format == "json":
+            output_text = analysis_to_json(game_analysis)
+        else:
+            output_text = format_analysis(game_analysis)
+
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(output_text + "\n")
+            print(f"Output saved to {output_path}")
+        else:
+            print(output_text)
+        return True
 
     # Generate Plot
     plot_scores(
@@ -534,6 +555,58 @@ if __name__ == "__main__":
         visitor_team_name,
         home_final_score,
         visitor_final_score,
-        output_path=output_arg,
-        debug=debug_mode,
+        output_path=output_path,
+        debug=debug,
+        analysis=game_analysis,
+        playoff=playoff,
+    )
+    return True
+
+
+### MAIN ###
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Plot scores and expected points over time for a specific game."
+    )
+    # Expecting game_id to be a string in nflverse format, e.g., '2023_01_ARI_WAS'
+    parser.add_argument(
+        "game_id", type=str, help="The nflverse game ID (e.g., '2023_01_ARI_WAS')."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Path to save the output graph file (e.g., 'output.png'). "
+        + "If not provided, the graph will be displayed.",
     )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["plot", "text", "json"],
+        default="plot",
+        help="Output format: the graph (default), a text summary or JSON series.",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging to investigate data distribution, and print span "
+        + "timings of each stage as JSON lines on stderr.",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write span timings to FILE (implies --debug timings): a Chrome trace if "
+        + "FILE ends in .json, JSON lines otherwise.",
+    )
+
+    args = parser.parse_args()
+
+    if args.debug or args.trace:
+        tracing.enable(args.trace)
+    try:
+        with tracing.span("view", game_id=args.game_id):
+            succeeded = view_game(args.game_id, args.format, args.output, args.debug)
+    finally:
+        tracing.disable()
+    if not succeeded:
+        sys.exit(1)
@@ -1,47 +1,220 @@
-import requests
-from bs4 import BeautifulSoup
-from mock_draft_data import MOCK_REGISTRY
+"""
+Watchdog over the expert mock draft pages in the mock registry.
+
+Pages are fetched concurrently through one pooled HTTP session, with at most a
+few requests in flight per host, and streamed into the source's extraction
+profile (see scout_extract), which stops reading once it finds the latest mock
+and its date. A source is flagged as outdated when that date is newer than the
+registry's. Every response's ETag / Last-Modified validators are kept in an
+on-disk cache together with what was extracted from the page, so the next scan
+sends conditional GETs: an unchanged page costs a 304 and no parse.
+"""
+
 import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .mock_draft_data import load_mock_registry
+from .scout_extract import CHUNK_SIZE, extract_stream, get_profile
+from .utils import get_cache_dir
+
+MAX_WORKERS = 16
+PER_HOST_LIMIT = 4
+TIMEOUT = 10
+# We use a header to avoid being blocked as a bot
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Bump whenever a change here changes what is extracted from a page, so cached
+# results are re-extracted instead of being trusted on a 304.
+SCOUT_VERSION = 2
+
+
+def get_scout_cache_dir():
+    """Returns the directory of the scout's per-URL response cache."""
+    return get_cache_dir("scout")
+
+
+def _cache_path(url):
+    return os.path.join(get_scout_cache_dir(), hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+
+def _read_cached(url):
+    """Returns the cached response of url, or None if missing, unreadable or of another version."""
+    try:
+        with open(_cache_path(url), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != SCOUT_VERSION or cached.get("url") != url:
+        return None
+    return cached
+
+
+def _write_cached(url, response, extracted):
+    path = _cache_path(url)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": SCOUT_VERSION,
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "extracted": extracted,
+            },
+            f,
+        )
+    os.replace(tmp_path, path)
+
+
+def extract_page(response, source=None):
+    """
+    Streams a response body through the extraction profile of source (a
+    MOCK_REGISTRY "source"). Returns {"has_mock", "mock_date"}.
+    """
+    # Without a declared charset requests assumes ISO-8859-1; HTML is far more often UTF-8
+    declared = "charset" in response.headers.get("Content-Type", "").lower()
+    return extract_stream(
+        response.iter_content(CHUNK_SIZE), get_profile(source), response.encoding if declared else None
+    )
+
 
-def scout_experts():
+def create_session(max_workers=MAX_WORKERS):
+    """Returns an HTTP session whose connection pools fit max_workers concurrent requests."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _HostLimits:
+    """One semaphore per host, created on first use."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.semaphores = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            if host not in self.semaphores:
+                self.semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self.semaphores[host]
+
+
+def check_source(session, source_id, meta, host_limits, timeout=TIMEOUT):
+    """
+    Fetches one registry entry's page, conditionally if it is cached. Returns
+    a result dict: source_id, author, local_date, url, status ("changed",
+    "unchanged", "link_error" or "error"), status_code, extracted (None unless
+    the page was read), newer (whether the page's mock_date is later than
+    local_date) and error.
+    """
+    url = meta["url"]
+    result = {
+        "source_id": source_id,
+        "author": meta["author"],
+        "local_date": meta["date"],
+        "url": url,
+        "status": "error",
+        "status_code": None,
+        "extracted": None,
+        "newer": False,
+        "error": None,
+    }
+
+    cached = _read_cached(url)
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        with host_limits(url), session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            result["status_code"] = response.status_code
+            if response.status_code == 304 and cached is not None:
+                result["status"] = "unchanged"
+                extracted = cached["extracted"]
+            elif response.status_code != 200:
+                result["status"] = "link_error"
+                return result
+            else:
+                result["status"] = "changed"
+                extracted = extract_page(response, meta.get("source"))
+                _write_cached(url, response, extracted)
+    except Exception as e:
+        # Network errors, but also a page that breaks extraction or a failed cache
+        # write: the source is reported as an error and the other sources still run
+        result["status"] = "error"
+        result["error"] = str(e)
+        return result
+
+    result["extracted"] = extracted
+    # ISO dates compare correctly as strings
+    result["newer"] = bool(extracted["mock_date"]) and extracted["mock_date"] > meta["date"]
+    return result
+
+
+def scan_sources(registry=None, max_workers=MAX_WORKERS, per_host=PER_HOST_LIMIT, session=None, timeout=TIMEOUT):
+    """
+    Checks every source of registry (the mock registry by default) concurrently,
+    with at most per_host requests in flight per host. Returns the results of
+    check_source in registry order.
+    """
+    registry = load_mock_registry() if registry is None else registry
+    own_session = session is None
+    session = session or create_session(max_workers)
+    host_limits = _HostLimits(per_host)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(check_source, session, source_id, meta, host_limits, timeout)
+                for source_id, meta in registry.items()
+            ]
+            return [future.result() for future in futures]
+    finally:
+        if own_session:
+            session.close()
+
+
+def format_status(result):
+    """The report's status column for one check_source result."""
+    if result["status"] == "link_error":
+        return f"⚠️ Link Error ({result['status_code']})"
+    if result["status"] == "error":
+        return f"❌ Error: {str(result['error'])[:20]}"
+    suffix = " (unchanged since last scan)" if result["status"] == "unchanged" else ""
+    extracted = result["extracted"]
+    if result["newer"]:
+        return f"🚨 OUTDATED (newer mock {extracted['mock_date']}){suffix}"
+    if extracted["mock_date"]:
+        return f"✅ Up to date (latest mock {extracted['mock_date']}){suffix}"
+    if extracted["has_mock"]:
+        return f"🔍 Mock found, no date{suffix}"
+    return f"🔍 No recent mock found{suffix}"
+
+
+def scout_experts(registry=None):
     print(f"--- NFL Draft Scout Report | {datetime.date.today()} ---")
     print(f"{'AUTHOR':<20} | {'LOCAL DATE':<12} | {'STATUS'}")
     print("-" * 50)
 
-    for key, meta in MOCK_REGISTRY.items():
-        author = meta['author']
-        url = meta['url']
-        local_date = meta['date']
-        
-        try:
-            # We use a header to avoid being blocked as a bot
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code != 200:
-                print(f"{author:<20} | {local_date:<12} | ⚠️ Link Error ({response.status_code})")
-                continue
-
-            # Check for mentions of "Mock" or "2026" near new dates
-            # This is a heuristic - it looks for the word "Mock" and then a date string
-            soup = BeautifulSoup(response.text, 'html.parser')
-            page_text = soup.get_text().lower()
-            
-            # Simple heuristic: Does the page contain "Mock" and a date newer than our local one?
-            # For a production script, we'd use site-specific selectors (e.g. .entry-date)
-            has_mock = "mock" in page_text
-            
-            # Note: Scrapers often fail on complex SPAs, so we provide a general signal
-            # If the page was modified today, it's a high-priority flag
-            last_modified = response.headers.get('Last-Modified', 'Unknown')
-            
-            if has_mock:
-                print(f"{author:<20} | {local_date:<12} | ✅ Checked (Mock keyword found)")
-            else:
-                print(f"{author:<20} | {local_date:<12} | 🔍 No recent 'Mock' keyword")
-
-        except Exception as e:
-            print(f"{author:<20} | {local_date:<12} | ❌ Error: {str(e)[:20]}")
+    for result in scan_sources(registry):
+        print(f"{result['author']:<20} | {result['local_date']:<12} | {format_status(result)}")
 
     print("-" * 50)
     print("Recommendation: Check 🚨 'OUTDATED' entries manually to update DRAFT_DATA.")
@@ -0,0 +1,252 @@
+"""
+Streaming extraction of the latest mock draft date from an expert's page.
+
+Each source in the mock registry has an extraction profile: CSS-style
+selectors for the elements that carry a publication date (a <time datetime>,
+a <meta> tag or a dated byline) and a pattern for mock draft mentions. Pages
+are fed to an incremental html.parser as they download, and parsing (and the
+download) stops at the first date found after a mock mention, so a page is
+never held or walked in full.
+
+Selectors support a tag name, .class and [attr], [attr=value] or
+[attr*=value] conditions, e.g. "meta[property=article:published_time]" or
+"span.timestamp". A matched element's date is read from its datetime or
+content attribute, or else from its text.
+"""
+
+import codecs
+import datetime
+import re
+from html.parser import HTMLParser
+
+DEFAULT_PROFILE = {
+    "date_selectors": [
+        "time[datetime]",
+        "meta[property=article:published_time]",
+        "meta[itemprop=datePublished]",
+    ],
+    # Dates in the visible text (e.g. a "March 18, 2026" byline) count too
+    "text_dates": True,
+    "mock_pattern": r"\bmock\b",
+}
+
+# Extraction profiles by MOCK_REGISTRY "source"; fields missing from a profile
+# fall back to DEFAULT_PROFILE
+SOURCE_PROFILES = {
+    "NFL.com": {
+        "date_selectors": ["time[datetime]", "div.nfl-c-article__dates", "meta[property=article:published_time]"],
+    },
+    "ESPN": {
+        "date_selectors": ["span.timestamp", "time[datetime]", "meta[name=DC.date.issued]"],
+    },
+    "The Ringer": {
+        "date_selectors": ["time[datetime]", "meta[property=article:published_time]"],
+    },
+    "The Athletic": {
+        "date_selectors": ["time[datetime]", "meta[property=article:published_time]"],
+    },
+    "PFF": {
+        "date_selectors": ["time[datetime]", "span[class*=date]", "meta[property=article:published_time]"],
+    },
+    "CBS Sports": {
+        "date_selectors": ["time[datetime]", "div[class*=ArticleDate]", "meta[property=article:published_time]"],
+    },
+}
+
+MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [
+            ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+            ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+            ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+DATE_PATTERNS = [
+    # 2026-03-18, also the start of an ISO timestamp
+    (re.compile(r"\b(\d{4})-(\d{2})-(\d{2})"), lambda m: (m[1], m[2], m[3])),
+    # March 18, 2026 / Mar. 18, 2026
+    (
+        re.compile(r"\b(" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\.?\s+(\d{1,2}),?\s+(\d{4})\b", re.IGNORECASE),
+        lambda m: (m[3], MONTHS[m[1].lower()], m[2]),
+    ),
+    # 3/18/2026
+    (re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b"), lambda m: (m[3], m[1], m[2])),
+]
+
+CHUNK_SIZE = 16 * 1024
+# Text kept from the previous data block, so patterns split across blocks still match
+_TAIL = 64
+
+
+def get_profile(source):
+    """Returns the extraction profile of a MOCK_REGISTRY source."""
+    return {**DEFAULT_PROFILE, **SOURCE_PROFILES.get(source, {})}
+
+
+def parse_date(text, after=0):
+    """
+    Returns the first date in text (ISO, "March 18, 2026" or "3/18/2026"), or
+    None. Dates that end at or before index after are ignored.
+    """
+    best_start, best_date = len(text), None
+    for pattern, fields in DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            if match.end() <= after:
+                continue
+            try:
+                date = datetime.date(*(int(field) for field in fields(match)))
+            except ValueError:
+                continue
+            if match.start() < best_start:
+                best_start, best_date = match.start(), date
+            break
+    return best_date
+
+
+def parse_selector(selector):
+    """Parses a selector into (tag or None, [(attr, op, value)]); class is matched as an attribute."""
+    match = re.fullmatch(r"([a-zA-Z][\w-]*)?((?:\.[\w-]+|\[[^\]]+\])*)", selector.strip())
+    if match is None:
+        raise ValueError(f"Unsupported selector '{selector}'")
+    conditions = []
+    for part in re.findall(r"\.[\w-]+|\[[^\]]+\]", match[2]):
+        if part.startswith("."):
+            conditions.append(("class", "~=", part[1:]))
+            continue
+        attr, op, value = re.fullmatch(r"\[([\w:.-]+)(?:([*~]?=)(.*))?\]", part).groups()
+        conditions.append((attr.lower(), op, value.strip("\"'") if value is not None else None))
+    return (match[1].lower() if match[1] else None), conditions
+
+
+def _matches(selector, tag, attrs):
+    name, conditions = selector
+    if name is not None and name != tag:
+        return False
+    for attr, op, value in conditions:
+        actual = attrs.get(attr)
+        if actual is None:
+            return False
+        if op == "=" and actual != value:
+            return False
+        if op == "*=" and value not in actual:
+            return False
+        if op == "~=" and value not in actual.split():
+            return False
+    return True
+
+
+class MockDateParser(HTMLParser):
+    """
+    Incremental parser that records the first mock mention and the first date
+    after it (falling back to the last date before it), then sets done.
+    """
+
+    def __init__(self, profile):
+        super().__init__()
+        self.selectors = [parse_selector(selector) for selector in profile["date_selectors"]]
+        self.text_dates = profile["text_dates"]
+        self.mock_pattern = re.compile(profile["mock_pattern"], re.IGNORECASE)
+        self.has_mock = False
+        self.date = None
+        self.done = False
+        self._date_before_mock = None
+        self._capture = None  # (tag, [text]) of a selected element whose text holds the date
+        self._skip = 0  # Depth inside <script>/<style>
+        self._tail = ""
+
+    def _found_date(self, date):
+        if date is None:
+            return
+        if self.has_mock:
+            self.date = date
+            self.done = True
+        else:
+            self._date_before_mock = date
+
+    def _end_text_run(self):
+        # Text of separate elements must not run together in the tail (e.g. "draftMarch")
+        if self._tail and not self._tail[-1].isspace():
+            self._tail += " "
+
+    def handle_starttag(self, tag, attrs):
+        self._end_text_run()
+        if self.done:
+            return
+        if tag in ("script", "style"):
+            self._skip += 1
+            return
+        attrs = {name: value or "" for name, value in attrs}
+        if tag == "meta" and self.mock_pattern.search(attrs.get("content", "")):
+            self.has_mock = True
+        for selector in self.selectors:
+            if _matches(selector, tag, attrs):
+                value = attrs.get("datetime") or attrs.get("content")
+                if value:
+                    self._found_date(parse_date(value))
+                elif self._capture is None:
+                    self._capture = (tag, [])
+                break
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in ("script", "style"):
+            self._skip = max(self._skip - 1, 0)
+
+    def handle_endtag(self, tag):
+        self._end_text_run()
+        if tag in ("script", "style"):
+            self._skip = max(self._skip - 1, 0)
+            return
+        # An article's <head> metadata (title and published time) describes the page
+        if tag == "head" and self.has_mock and self._date_before_mock is not None:
+            self.date = self._date_before_mock
+            self.done = True
+            return
+        if self._capture is not None and self._capture[0] == tag:
+            text = " ".join(self._capture[1])
+            self._capture = None
+            if not self.done:
+                self._found_date(parse_date(text))
+
+    def handle_data(self, data):
+        if self.done or self._skip:
+            return
+        if self._capture is not None:
+            self._capture[1].append(data)
+        tail = self._tail
+        text = tail + data
+        self._tail = text[-_TAIL:]
+        if not self.has_mock and self.mock_pattern.search(text):
+            self.has_mock = True
+        if self.text_dates and self._capture is None:
+            # Dates lying entirely in the tail were read with the previous block
+            self._found_date(parse_date(text, after=len(tail)))
+
+    def result(self):
+        """The extracted {"has_mock", "mock_date"} (an ISO date or None)."""
+        date = self.date or (self._date_before_mock if self.has_mock else None)
+        return {"has_mock": self.has_mock, "mock_date": date.isoformat() if date else None}
+
+
+def extract_stream(chunks, profile=None, encoding=None):
+    """
+    Feeds page chunks (bytes or str) to a MockDateParser until it is done.
+    Stops consuming chunks at that point and returns the parser's result.
+    """
+    parser = MockDateParser(profile or DEFAULT_PROFILE)
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        if parser.done:
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+    return parser.result()
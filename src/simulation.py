@@ -0,0 +1,748 @@
+"""
+Monte Carlo game simulation engine.
+
+Plays out many iterations of a game at once. The state of every iteration
+(score, clock, possession, down, distance and field position) is held in NumPy
+arrays, and each step advances all unfinished iterations by one play with
+outcomes sampled from historical play-by-play.
+
+The game model is deliberately simple: kickoffs are touchbacks, fourth-down
+decisions follow fixed rules and there is no overtime (ties stand).
+
+Random draws come from a counter-based generator keyed on (seed, iteration
+index, step), so every iteration has its own stream: any single iteration of a
+batch can be replayed in isolation without storing play logs.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .cli import positive_int
+from .transition_tables import (
+    STATE_CELLS,
+    TIME_EDGES,
+    TURNOVER_OUTCOME,
+    YARDS_EDGES,
+    load_table,
+    state_cells,
+)
+
+# Play-by-play fields the transition model is built from
+SIM_COLUMNS = [
+    "game_id",
+    "play_type",
+    "posteam",
+    "qtr",
+    "down",
+    "ydstogo",
+    "yardline_100",
+    "yards_gained",
+    "interception",
+    "fumble_lost",
+    "field_goal_result",
+    "kick_distance",
+    "return_yards",
+    "game_seconds_remaining",
+]
+
+GAME_SECONDS = 3600
+HALF_SECONDS = 1800
+MAX_PLAYS = 400  # Safety bound on simulation steps per game
+
+KICKOFF_YARDLINE = 75  # Receiving team starts at its own 25 (touchback)
+SAFETY_KICK_YARDLINE = 65  # Team that scored a safety receives the free kick at its 35
+PUNT_TOUCHBACK_YARDLINE = 80
+FIELD_GOAL_SNAP_YARDS = 17  # Line of scrimmage to goal posts plus the holder's spot
+MISSED_FIELD_GOAL_SPOT_YARDS = 7
+MAX_FIELD_GOAL_DISTANCE = 55
+KICK_SECONDS = 5
+EXTRA_POINT_RATE = 0.94
+LATE_GAME_SECONDS = 300  # Trailing teams go for it on fourth down inside the last 5 minutes
+
+DEFAULT_PLAY_SECONDS = 30
+MAX_PLAY_SECONDS = 60
+DEFAULT_PUNT_DISTANCE = 45
+# League-average make rates for field goals of <30, 30-39, 40-49 and 50+ yards,
+# used when the historical sample has too few attempts at that distance.
+DEFAULT_FIELD_GOAL_RATES = np.array([0.97, 0.92, 0.82, 0.65])
+MIN_FIELD_GOAL_ATTEMPTS = 10
+MIN_TABLE_CELL_PLAYS = 20  # Fewer historical plays than this falls back to a coarser state
+
+MAX_SCORE = 99  # Scores above this are clipped in histograms
+HOME, AWAY = 0, 1
+
+# Iterations per shard of a batch. Every iteration draws from its own counter-based
+# stream, so results are identical for any shard size or worker count.
+SHARD_SIZE = 10_000
+DRAWS_PER_STEP = 3  # Play outcome, kick outcome and extra point
+
+_WORKER_INPUTS = None  # (model, opening_receiver) of a pool worker process
+
+
+def _column(plays, name, dtype=float):
+    if name not in plays.columns:
+        return np.full(len(plays), np.nan if dtype is float else None, dtype=dtype)
+    return np.asarray(plays[name], dtype=dtype)
+
+
+def _seconds_to_next_play(plays):
+    """Clock time consumed by each play: the drop in game time to the next play."""
+    remaining = _column(plays, "game_seconds_remaining")
+    following = np.full_like(remaining, np.nan)
+    following[:-1] = remaining[1:]
+
+    if "game_id" in plays.columns:
+        game_ids = _column(plays, "game_id", object)
+        following[:-1][game_ids[:-1] != game_ids[1:]] = np.nan
+
+    seconds = remaining - following
+    seconds[~np.isfinite(seconds) | (seconds < 0)] = np.nan
+    return np.minimum(seconds, MAX_PLAY_SECONDS)
+
+
+def build_transition_model(plays, home_team, away_team):
+    """
+    Builds the sampling pools of the simulator from historical plays (pandas or
+    Polars, chronologically ordered within each game, SIM_COLUMNS).
+
+    Run and pass outcomes (yards gained, turnover, clock used) are pooled per
+    offense and down; a team without plays of its own falls back to every team's
+    plays. Punt distances and field goal make rates are pooled league-wide.
+    """
+    play_type = _column(plays, "play_type", object)
+    down = _column(plays, "down")
+    posteam = _column(plays, "posteam", object)
+    yards = np.nan_to_num(_column(plays, "yards_gained")).astype(np.int32)
+    turnover = (
+        np.nan_to_num(_column(plays, "interception"))
+        + np.nan_to_num(_column(plays, "fumble_lost"))
+    ) > 0
+
+    seconds = _seconds_to_next_play(plays)
+    scrimmage = ((play_type == "run") | (play_type == "pass")) & ~np.isnan(down)
+    if not scrimmage.any():
+        raise ValueError("No run or pass plays to build a transition model from.")
+
+    typical_seconds = DEFAULT_PLAY_SECONDS
+    if np.isfinite(seconds[scrimmage]).any():
+        typical_seconds = np.nanmedian(seconds[scrimmage])
+    seconds = np.where(np.isnan(seconds), typical_seconds, seconds)
+
+    # Pools are stored back to back; starts/counts index them by [offense, down]
+    pools = []
+    starts = np.zeros((2, 5), dtype=np.int64)
+    counts = np.zeros((2, 5), dtype=np.int64)
+    offset = 0
+    for offense, team in ((HOME, home_team), (AWAY, away_team)):
+        team_plays = scrimmage & (posteam == team)
+        if not team_plays.any():
+            team_plays = scrimmage
+
+        for d in range(1, 5):
+            rows = np.flatnonzero(team_plays & (down == d))
+            if len(rows) == 0:
+                rows = np.flatnonzero(team_plays)
+            starts[offense, d] = offset
+            counts[offense, d] = len(rows)
+            pools.append(rows)
+            offset += len(rows)
+    # Down 0 never occurs; point it at the first-down pool to keep indexing total
+    starts[:, 0], counts[:, 0] = starts[:, 1], counts[:, 1]
+
+    rows = np.concatenate(pools)
+
+    kick_distance = _column(plays, "kick_distance")
+    punts = (play_type == "punt") & np.isfinite(kick_distance)
+    punt_distances = (
+        kick_distance[punts] - np.nan_to_num(_column(plays, "return_yards")[punts])
+    ).astype(np.int32)
+    if len(punt_distances) == 0:
+        punt_distances = np.array([DEFAULT_PUNT_DISTANCE], dtype=np.int32)
+
+    field_goals = (play_type == "field_goal") & np.isfinite(kick_distance)
+    buckets = np.clip((kick_distance[field_goals] - 20) // 10, 0, 3).astype(int)
+    made = _column(plays, "field_goal_result", object)[field_goals] == "made"
+    attempts = np.bincount(buckets, minlength=4)
+    makes = np.bincount(buckets, weights=made, minlength=4)
+    field_goal_rates = np.where(
+        attempts >= MIN_FIELD_GOAL_ATTEMPTS,
+        makes / np.maximum(attempts, 1),
+        DEFAULT_FIELD_GOAL_RATES,
+    )
+
+    return {
+        "teams": (home_team, away_team),
+        "yards": yards[rows],
+        "turnover": turnover[rows],
+        "seconds": seconds[rows],
+        "starts": starts,
+        "counts": counts,
+        "punt_distances": punt_distances,
+        "field_goal_rates": field_goal_rates,
+    }
+
+
+def get_opening_receiver(plays, home_team, away_team):
+    """Returns HOME or AWAY: the team with the first possession of the historical game."""
+    for team in _column(plays, "posteam", object):
+        if team == home_team:
+            return HOME
+        if team == away_team:
+            return AWAY
+    return AWAY
+
+
+def new_game_state(n, opening_receiver):
+    """Returns the state arrays of n games at the opening kickoff."""
+    return {
+        "offense": np.full(n, opening_receiver, dtype=np.int64),
+        "second_half_receiver": 1 - opening_receiver,
+        "yardline": np.full(n, KICKOFF_YARDLINE, dtype=np.int64),
+        "down": np.ones(n, dtype=np.int64),
+        "togo": np.full(n, 10, dtype=np.int64),
+        "clock": np.full(n, GAME_SECONDS, dtype=np.float64),
+        "scores": np.zeros((2, n), dtype=np.int64),
+        "plays": np.zeros(n, dtype=np.int64),
+    }
+
+
+def with_transition_table(model, table):
+    """
+    Returns a copy of a model whose run/pass outcomes are sampled from a
+    prebuilt transition table (see transition_tables) conditioned on down,
+    distance, field position, score differential and time, instead of the
+    per-team pools. Kicking keeps using the model's historical pools.
+
+    Sparse states fall back to the distribution over all score and time
+    buckets of the same down, distance and field position, then of the down.
+    """
+    counts = np.asarray(table["counts"], dtype=np.float64)
+    by_situation = counts.sum(axis=(3, 4), keepdims=True)
+    by_down = counts.sum(axis=(1, 2, 3, 4), keepdims=True)
+
+    distribution = np.where(
+        counts.sum(axis=-1, keepdims=True) >= MIN_TABLE_CELL_PLAYS,
+        counts,
+        np.where(by_situation.sum(axis=-1, keepdims=True) >= MIN_TABLE_CELL_PLAYS, by_situation, by_down),
+    )
+    totals = distribution.sum(axis=-1, keepdims=True)
+    if (totals == 0).any():
+        raise ValueError("The transition table has no plays for some downs.")
+
+    cdf = np.cumsum(distribution, axis=-1) / totals
+
+    # Yards of an outcome bin: the historical mean, or the bin's lower edge if never seen
+    lower_edges = np.array([YARDS_EDGES[0] - 1] + YARDS_EDGES + [0], dtype=np.float64)
+    outcome_yards = np.where(
+        table["outcome_plays"] > 0,
+        table["outcome_yards_sum"] / np.maximum(table["outcome_plays"], 1),
+        lower_edges,
+    )
+    time_seconds = np.where(
+        table["time_plays"] > 0,
+        table["time_seconds_sum"] / np.maximum(table["time_plays"], 1),
+        DEFAULT_PLAY_SECONDS,
+    )
+
+    return {
+        **model,
+        "kind": "table",
+        "cdf": cdf.reshape(STATE_CELLS, -1),
+        "outcome_yards": np.round(outcome_yards).astype(np.int64),
+        "time_seconds": time_seconds,
+    }
+
+
+def _sample_scrimmage(model, state, score_diff, uniforms):
+    """Returns the yards gained, turnover flag and clock used of a run/pass per game."""
+    offense, down = state["offense"], state["down"]
+
+    if model.get("kind") == "table":
+        cells = state_cells(down, state["togo"], state["yardline"], score_diff, state["clock"])
+        outcome = np.minimum((model["cdf"][cells] <= uniforms[:, None]).sum(axis=1), TURNOVER_OUTCOME)
+        seconds = model["time_seconds"][np.digitize(state["clock"], TIME_EDGES)]
+        return model["outcome_yards"][outcome], outcome == TURNOVER_OUTCOME, seconds
+
+    # Pools of the offense's historical plays on this down
+    pick = model["starts"][offense, down] + (uniforms * model["counts"][offense, down]).astype(np.int64)
+    return model["yards"][pick], model["turnover"][pick], model["seconds"][pick]
+
+
+def step_games(model, state, uniforms):
+    """
+    Advances every unfinished game in state by one play, in place.
+    uniforms is an (n, 3) array of U[0, 1) draws: the play outcome, the kick
+    outcome and the extra point. Returns the sampled yardages and a dict of
+    boolean event masks. Games never interact, so each one's outcome depends
+    only on its own state and draws.
+    """
+    offense, yardline, down, togo = state["offense"], state["yardline"], state["down"], state["togo"]
+    clock, scores = state["clock"], state["scores"]
+    games = np.arange(len(clock))
+
+    active = clock > 0
+    defense = 1 - offense
+    deficit = scores[defense, games] - scores[offense, games]
+    late = clock < LATE_GAME_SECONDS
+
+    # Fourth-down decisions: kick in range unless a field goal cannot catch up late,
+    # go for it on short yardage near midfield or when trailing late, otherwise punt
+    fourth = active & (down == 4)
+    fg_distance = yardline + FIELD_GOAL_SNAP_YARDS
+    field_goal = fourth & (fg_distance <= MAX_FIELD_GOAL_DISTANCE) & ~(late & (deficit > 3))
+    go_for_it = fourth & ~field_goal & (((togo <= 1) & (yardline <= 60)) | (late & (deficit > 0)))
+    punt = fourth & ~field_goal & ~go_for_it
+    scrimmage = active & ~field_goal & ~punt
+
+    # Sample a historical run/pass outcome for every game's situation
+    gained, lost, play_seconds = _sample_scrimmage(model, state, -deficit, uniforms[:, 0])
+    new_yardline = yardline - gained
+
+    touchdown = scrimmage & ~lost & (new_yardline <= 0)
+    safety = scrimmage & ~lost & (new_yardline >= 100)
+    turnover = scrimmage & lost
+    advanced = scrimmage & ~lost & ~touchdown & ~safety
+    first_down = advanced & (gained >= togo)
+    turnover_on_downs = advanced & ~first_down & (down == 4)
+    next_down = advanced & ~first_down & ~turnover_on_downs
+
+    made = field_goal & (
+        uniforms[:, 1] < model["field_goal_rates"][np.clip((fg_distance - 20) // 10, 0, 3)]
+    )
+    missed = field_goal & ~made
+
+    punt_distances = model["punt_distances"]
+    punt_distance = punt_distances[(uniforms[:, 1] * len(punt_distances)).astype(np.int64)]
+    punted_to = yardline - punt_distance
+
+    # Scoring
+    points = np.where(touchdown, 6 + (uniforms[:, 2] < EXTRA_POINT_RATE), 0) + np.where(made, 3, 0)
+    scores[offense, games] += points
+    scores[defense, games] += np.where(safety, 2, 0)
+
+    # Field position after the play, from the point of view of the next offense
+    spot = np.clip(new_yardline, 1, 99)
+    yardline[:] = np.select(
+        [touchdown | made, safety, turnover | turnover_on_downs, missed, punt, advanced],
+        [
+            KICKOFF_YARDLINE,
+            SAFETY_KICK_YARDLINE,
+            100 - spot,
+            np.minimum(PUNT_TOUCHBACK_YARDLINE, 100 - yardline - MISSED_FIELD_GOAL_SPOT_YARDS),
+            np.where(punted_to <= 0, PUNT_TOUCHBACK_YARDLINE, 100 - punted_to),
+            new_yardline,
+        ],
+        yardline,
+    )
+
+    change = touchdown | made | safety | turnover | turnover_on_downs | missed | punt
+    offense[change] = 1 - offense[change]
+    togo[next_down] -= gained[next_down]
+    down[next_down] += 1
+    reset = change | first_down
+    down[reset] = 1
+    togo[reset] = np.minimum(10, yardline[reset])
+
+    # Game clock, with the second-half kickoff when the clock crosses halftime
+    elapsed = np.where(scrimmage, play_seconds, KICK_SECONDS)
+    new_clock = np.where(active, clock - elapsed, clock)
+    halftime = active & (clock > HALF_SECONDS) & (new_clock <= HALF_SECONDS)
+    new_clock[halftime] = HALF_SECONDS
+    offense[halftime] = state["second_half_receiver"]
+    yardline[halftime] = KICKOFF_YARDLINE
+    down[halftime] = 1
+    togo[halftime] = 10
+    clock[:] = new_clock
+    state["plays"] += active
+
+    return {
+        "gained": gained,
+        "kick_distance": fg_distance,
+        "punt_distance": punt_distance,
+        "active": active,
+        "scrimmage": scrimmage,
+        "field_goal": field_goal,
+        "made": made,
+        "punt": punt,
+        "touchdown": touchdown,
+        "safety": safety,
+        "turnover": turnover,
+        "turnover_on_downs": turnover_on_downs,
+        "halftime": halftime,
+    }
+
+
+def _mix64(x):
+    """SplitMix64 finalizer: a bijective avalanche mix of uint64 values."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def simulation_key(seed):
+    """Derives the 64-bit key of the counter-based generator from a seed."""
+    return np.random.SeedSequence(seed).generate_state(1, dtype=np.uint64)[0]
+
+
+def resolve_seed(seed):
+    """Returns the seed itself, or fresh entropy to use for the whole run if None."""
+    return seed if seed is not None else np.random.SeedSequence().entropy
+
+
+def counter_uniforms(key, iterations, step):
+    """
+    Returns an (len(iterations), DRAWS_PER_STEP) array of U[0, 1) draws that
+    depend only on the key, each iteration index and the step number.
+    """
+    stream = _mix64(np.asarray(iterations, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15) ^ key)
+    counters = np.uint64(step * DRAWS_PER_STEP) + np.arange(DRAWS_PER_STEP, dtype=np.uint64)
+    bits = _mix64(stream[:, None] + counters[None, :] * np.uint64(0xD1B54A32D192ED03))
+    # Top 53 bits as a double in [0, 1)
+    return (bits >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def simulate_games(model, opening_receiver, n, seed=None, first_iteration=0):
+    """
+    Simulates n full games at once: iterations first_iteration to
+    first_iteration + n - 1 of the run identified by seed (an int; pass the
+    result of resolve_seed to share a random seed across calls).
+    Returns a dict with the teams and the final home_scores, away_scores and
+    play counts of every iteration.
+    """
+    key = simulation_key(resolve_seed(seed))
+    iterations = np.arange(first_iteration, first_iteration + n, dtype=np.uint64)
+    state = new_game_state(n, opening_receiver)
+
+    for step in range(MAX_PLAYS):
+        if not (state["clock"] > 0).any():
+            break
+        step_games(model, state, counter_uniforms(key, iterations, step))
+
+    home_team, away_team = model["teams"]
+    return {
+        "home_team": home_team,
+        "away_team": away_team,
+        "home_scores": state["scores"][HOME],
+        "away_scores": state["scores"][AWAY],
+        "plays": state["plays"],
+    }
+
+
+def _format_yardline(yardline, offense_team, defense_team):
+    if yardline == 50:
+        return "50"
+    if yardline > 50:
+        return f"{offense_team} {100 - yardline}"
+    return f"{defense_team} {yardline}"
+
+
+def _describe_play(events, offense_team, defense_team):
+    """Describes iteration 0's play from the event masks returned by step_games."""
+    gained = int(events["gained"][0])
+    if events["field_goal"][0]:
+        result = "is GOOD" if events["made"][0] else "is No Good"
+        return f"{offense_team} {int(events['kick_distance'][0])} yard field goal {result}."
+    if events["punt"][0]:
+        return f"{offense_team} punts {int(events['punt_distance'][0])} yards."
+
+    desc = f"{offense_team} gains {gained} yards." if gained >= 0 else f"{offense_team} loses {-gained} yards."
+    if events["touchdown"][0]:
+        desc += " TOUCHDOWN."
+    elif events["safety"][0]:
+        desc += f" SAFETY, {defense_team} scores 2."
+    elif events["turnover"][0]:
+        desc += f" TURNOVER, {defense_team} takes over."
+    elif events["turnover_on_downs"][0]:
+        desc += f" Turnover on downs, {defense_team} takes over."
+    return desc
+
+
+def replay_iteration(model, opening_receiver, seed, index):
+    """
+    Regenerates iteration `index` of the run identified by seed in isolation
+    and returns its play log as a list of play dicts (qtr, down, ydstogo, yrdln,
+    desc, ep, scores), as rendered by play_by_play.display_play_by_play.
+    """
+    key = simulation_key(seed)
+    iterations = np.array([index], dtype=np.uint64)
+    state = new_game_state(1, opening_receiver)
+    teams = model["teams"]
+    play_log = []
+
+    for step in range(MAX_PLAYS):
+        if not (state["clock"] > 0).any():
+            break
+
+        offense = int(state["offense"][0])
+        offense_team, defense_team = teams[offense], teams[1 - offense]
+        clock = float(state["clock"][0])
+        play = {
+            "qtr": min(4, 1 + int((GAME_SECONDS - clock) // 900)),
+            "down": int(state["down"][0]),
+            "ydstogo": int(state["togo"][0]),
+            "yrdln": _format_yardline(int(state["yardline"][0]), offense_team, defense_team),
+            "ep": None,
+        }
+
+        events = step_games(model, state, counter_uniforms(key, iterations, step))
+
+        play["desc"] = _describe_play(events, offense_team, defense_team)
+        if events["halftime"][0]:
+            play["desc"] += " End of first half."
+        play["home_score"] = int(state["scores"][HOME][0])
+        play["away_score"] = int(state["scores"][AWAY][0])
+        play_log.append(play)
+
+    return play_log
+
+
+def score_histograms(result):
+    """Aggregates simulated final scores into home, away and margin histograms."""
+    home = np.minimum(result["home_scores"], MAX_SCORE)
+    away = np.minimum(result["away_scores"], MAX_SCORE)
+    return {
+        "home": np.bincount(home, minlength=MAX_SCORE + 1),
+        "away": np.bincount(away, minlength=MAX_SCORE + 1),
+        # Index MAX_SCORE is a margin of 0 (home minus away)
+        "margin": np.bincount(home - away + MAX_SCORE, minlength=2 * MAX_SCORE + 1),
+    }
+
+
+def merge_histograms(total, histograms):
+    """Adds one set of score histograms into a running total (None to start)."""
+    if total is None:
+        return {key: counts.copy() for key, counts in histograms.items()}
+    for key, counts in histograms.items():
+        total[key] += counts
+    return total
+
+
+def get_shard_sizes(n, shard_size=SHARD_SIZE):
+    """Splits n iterations into fixed-size shards (the last one may be smaller)."""
+    sizes = [shard_size] * (n // shard_size)
+    if n % shard_size:
+        sizes.append(n % shard_size)
+    return sizes
+
+
+def _init_worker(model, opening_receiver):
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = (model, opening_receiver)
+
+
+def _run_shard(task):
+    """Simulates one shard in a worker and returns only its score histograms."""
+    first_iteration, size, seed = task
+    model, opening_receiver = _WORKER_INPUTS
+    result = simulate_games(model, opening_receiver, size, seed=seed, first_iteration=first_iteration)
+    return score_histograms(result)
+
+
+def run_simulation(model, opening_receiver, n, seed=None, workers=1, shard_size=SHARD_SIZE):
+    """
+    Simulates n games split into shards of consecutive iteration indices,
+    optionally across a pool of worker processes. Shards stream back score
+    histograms rather than per-game results, so memory stays flat as n grows.
+    Returns the merged histograms, bit-identical for any worker count.
+    Raises ValueError if n is less than 1.
+    """
+    if n < 1:
+        raise ValueError(f"Number of simulations must be at least 1, got {n}")
+    seed = resolve_seed(seed)
+    tasks = []
+    first_iteration = 0
+    for size in get_shard_sizes(n, shard_size):
+        tasks.append((first_iteration, size, seed))
+        first_iteration += size
+
+    totals = None
+    if workers <= 1:
+        _init_worker(model, opening_receiver)
+        for task in tasks:
+            totals = merge_histograms(totals, _run_shard(task))
+        return totals
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(model, opening_receiver)
+    ) as executor:
+        for histograms in executor.map(_run_shard, tasks):
+            totals = merge_histograms(totals, histograms)
+    return totals
+
+
+def _histogram_percentile(counts, q):
+    cumulative = np.cumsum(counts)
+    return int(np.searchsorted(cumulative, q / 100 * cumulative[-1]))
+
+
+def summarize_histograms(histograms, home_team, away_team):
+    """Win probabilities, average scores and margin percentiles from score histograms."""
+    margin = histograms["margin"]
+    iterations = int(margin.sum())
+    scores = np.arange(MAX_SCORE + 1)
+    return {
+        "home_team": home_team,
+        "away_team": away_team,
+        "iterations": iterations,
+        "home_win_prob": float(margin[MAX_SCORE + 1 :].sum() / iterations),
+        "away_win_prob": float(margin[:MAX_SCORE].sum() / iterations),
+        "tie_prob": float(margin[MAX_SCORE] / iterations),
+        "home_score_mean": float(scores @ histograms["home"] / iterations),
+        "away_score_mean": float(scores @ histograms["away"] / iterations),
+        "margin_percentiles": {
+            q: _histogram_percentile(margin, q) - MAX_SCORE for q in (5, 25, 50, 75, 95)
+        },
+    }
+
+
+def format_summary(summary):
+    """Returns a human-readable report of a simulation summary."""
+    home, away = summary["home_team"], summary["away_team"]
+    p = summary["margin_percentiles"]
+    return "\n".join(
+        [
+            f"--- Simulation: {away} at {home} ({summary['iterations']:,} iterations) ---",
+            f"Win probability: {home} {summary['home_win_prob']:.1%} | "
+            f"{away} {summary['away_win_prob']:.1%} | Tie {summary['tie_prob']:.1%}",
+            f"Average score:   {home} {summary['home_score_mean']:.1f} - "
+            f"{away} {summary['away_score_mean']:.1f}",
+            f"{home} margin:    5th {p[5]:+d} | 25th {p[25]:+d} | median {p[50]:+d} | "
+            f"75th {p[75]:+d} | 95th {p[95]:+d}",
+        ]
+    )
+
+
+def load_simulation_inputs(game_id, use_table=False):
+    """
+    Loads what a simulation of a historical game needs: its teams, the opening
+    receiver (from the game's own plays) and a transition model built from the
+    season's play-by-play, optionally sampling run/pass outcomes from the
+    prebuilt transition table. Returns None if the game cannot be loaded.
+    """
+    from . import pbp_store, schedule_index
+    from .score_over_time import load_plays_for_game
+
+    game = schedule_index.get_game(game_id)
+    if game is None:
+        print(f"Game ID {game_id} not found in schedule.")
+        return None
+
+    season = schedule_index.get_season_from_game_id(game_id)
+    game_plays = load_plays_for_game(game_id, season, columns=SIM_COLUMNS)
+    if game_plays.is_empty():
+        return None
+
+    home_team, away_team = game["home_team"], game["away_team"]
+    season_plays = pbp_store.load_season(season, columns=SIM_COLUMNS)
+    model = build_transition_model(season_plays, home_team, away_team)
+
+    if use_table:
+        table = load_table()
+        if table is None:
+            print("No transition table found. Build one with: python -m src.transition_tables <seasons>")
+            return None
+        model = with_transition_table(model, table)
+
+    return model, get_opening_receiver(game_plays, home_team, away_team)
+
+
+def simulate_game(
+    game_id,
+    iterations=100,
+    seed=None,
+    workers=1,
+    use_table=False,
+    inspect=None,
+    output_format="text",
+):
+    """
+    Simulates a historical game and prints the summary (text or JSON), plus the
+    replayed play-by-play of one iteration if inspect is given. workers=0 uses
+    every core. Returns False if the inputs are invalid or cannot be loaded.
+    """
+    if inspect is not None and not 0 <= inspect < iterations:
+        print(f"--inspect must be between 0 and {iterations - 1}.")
+        return False
+
+    inputs = load_simulation_inputs(game_id, use_table=use_table)
+    if inputs is None:
+        return False
+    model, opening_receiver = inputs
+
+    # Resolve the seed once so the batch and any replayed iteration share it
+    seed = resolve_seed(seed)
+    workers = workers or os.cpu_count()
+    histograms = run_simulation(model, opening_receiver, iterations, seed=seed, workers=workers)
+    summary = summarize_histograms(histograms, *model["teams"])
+    summary["seed"] = seed
+
+    if output_format == "json":
+        print(json.dumps(summary))
+    else:
+        print(format_summary(summary))
+        print(f"Seed: {seed}")
+
+    if inspect is not None:
+        from .play_by_play import display_play_by_play
+
+        print(f"\nIteration #{inspect}:")
+        display_play_by_play(replay_iteration(model, opening_receiver, seed, inspect))
+    return True
+
+
+def main():
+    """
+    Main function
+    """
+    parser = argparse.ArgumentParser(
+        description="Simulate a historical NFL game many times with a Monte Carlo engine."
+    )
+    parser.add_argument("game_id", type=str, help="The nflverse game ID (e.g., 2023_01_DET_KC).")
+    parser.add_argument(
+        "-n", "--iterations", type=positive_int, default=100, help="Number of simulations to run."
+    )
+    parser.add_argument("--seed", type=int, help="Random seed for reproducibility.")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to run shards on (0 uses every core).",
+    )
+    parser.add_argument(
+        "--transition-table",
+        action="store_true",
+        help="Sample run/pass outcomes from the prebuilt transition table.",
+    )
+    parser.add_argument(
+        "--inspect",
+        type=int,
+        metavar="INDEX",
+        help="Replay and display the play-by-play of a single iteration.",
+    )
+    parser.add_argument(
+        "-f", "--format", choices=["text", "json"], default="text", help="Output format."
+    )
+
+    args = parser.parse_args()
+
+    ok = simulate_game(
+        args.game_id,
+        iterations=args.iterations,
+        seed=args.seed,
+        workers=args.workers,
+        use_table=args.transition_table,
+        inspect=args.inspect,
+        output_format=args.format,
+    )
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
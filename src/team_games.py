@@ -1,29 +1,27 @@
 import argparse
-import nflreadpy
+
 import polars as pl
 
+from . import schedule_index, tracing
+from .utils import get_franchise_abbrs
+
+# Schedule fields returned by query_team_games, before the team-relative ones
+QUERY_COLUMNS = ["game_id", "season", "week", "home_team", "away_team", "home_score", "away_score"]
 
-def fetch_team_games(season, team_abbr):
+
+def fetch_team_games(season, team_abbr, last_season=None):
     """
-    Fetches NFL games for a specific team in a given season using nflreadpy.
+    Fetches NFL games for a specific team in a given season (or every season
+    from season through last_season) from the schedule index. Historical
+    abbreviations match the whole franchise, e.g. OAK also finds LV games.
     """
     try:
-        # Load schedules for the season
-        schedules = nflreadpy.load_schedules(seasons=[season])
-
-        # Filter for the team (either home or away)
-        team_games = schedules.filter(
-            (pl.col("home_team") == team_abbr) | (pl.col("away_team") == team_abbr)
-        )
-
-        if team_games.is_empty():
-            return []
-
-        # Sort by game_id to maintain chronological order
-        team_games = team_games.sort("game_id")
+        # Look up the franchise's games in the shared schedule index (sorted by game_id)
+        seasons = range(season, (last_season or season) + 1)
+        team_games = schedule_index.get_franchise_games(seasons, team_abbr)
 
         games = []
-        for row in team_games.to_dicts():
+        for row in team_games:
             home_team = row["home_team"]
             away_team = row["away_team"]
 
@@ -43,6 +41,113 @@ def fetch_team_games(season, team_abbr):
         return None
 
 
+def query_team_games(
+    team_abbr,
+    seasons,
+    weeks=None,
+    side=None,
+    result=None,
+    min_margin=None,
+    max_margin=None,
+    game_type=None,
+):
+    """
+    Queries a team's (franchise's) games across many seasons at once.
+
+    Runs as a lazy scan over the locally cached schedule Parquet files, so the
+    team, season, week and game type filters are pushed down into the reads.
+    Optional filters: weeks as an inclusive (first, last) range, side ("home" or
+    "away"), result ("W", "L" or "T") and min/max absolute score margin
+    (e.g. max_margin=8 for one-score games); unplayed games never match result
+    or margin filters.
+
+    Returns a Polars DataFrame sorted by game_id with QUERY_COLUMNS plus the
+    team-relative team, opponent, side, team_score, opponent_score, margin
+    (team minus opponent) and result columns.
+    """
+    abbrs = get_franchise_abbrs(team_abbr)
+    is_home = pl.col("home_team").is_in(abbrs)
+
+    games = schedule_index.scan_seasons(seasons).filter(
+        is_home | pl.col("away_team").is_in(abbrs)
+    )
+    if weeks is not None:
+        games = games.filter(pl.col("week").is_between(weeks[0], weeks[1]))
+    if game_type is not None:
+        games = games.filter(pl.col("game_type") == game_type)
+
+    team_score = pl.when(is_home).then(pl.col("home_score")).otherwise(pl.col("away_score"))
+    opponent_score = pl.when(is_home).then(pl.col("away_score")).otherwise(pl.col("home_score"))
+    games = games.select(
+        *QUERY_COLUMNS,
+        pl.when(is_home).then(pl.col("home_team")).otherwise(pl.col("away_team")).alias("team"),
+        pl.when(is_home).then(pl.col("away_team")).otherwise(pl.col("home_team")).alias("opponent"),
+        pl.when(is_home).then(pl.lit("home")).otherwise(pl.lit("away")).alias("side"),
+        team_score.alias("team_score"),
+        opponent_score.alias("opponent_score"),
+        (team_score - opponent_score).alias("margin"),
+    ).with_columns(
+        pl.when(pl.col("margin") > 0)
+        .then(pl.lit("W"))
+        .when(pl.col("margin") < 0)
+        .then(pl.lit("L"))
+        .when(pl.col("margin") == 0)
+        .then(pl.lit("T"))
+        .alias("result")
+    )
+
+    if side is not None:
+        games = games.filter(pl.col("side") == side)
+    if result is not None:
+        games = games.filter(pl.col("result") == result)
+    if min_margin is not None:
+        games = games.filter(pl.col("margin").abs() >= min_margin)
+    if max_margin is not None:
+        games = games.filter(pl.col("margin").abs() <= max_margin)
+
+    with tracing.span("filter", team=team_abbr):
+        results = games.sort("game_id").collect()
+        tracing.count("rows_matched", len(results))
+    return results
+
+
+def display_query_results(results, season_label, team_abbr, batch_size=64):
+    """
+    Prints query_team_games results as a table, streaming the frame in batches
+    of rows rather than building every line up front.
+    """
+    if results.is_empty():
+        print(f"No games found for {team_abbr} in {season_label}.")
+        return
+
+    print(f"Games for {team_abbr} in {season_label}:")
+    print(f"{'Game ID':<20} | {'Wk':>2} | {'Team':<4} | {'Opp':<4} | {'Side':<4} | {'Score':<7} | {'Res'}")
+    print("-" * 62)
+
+    for batch in results.iter_slices(n_rows=batch_size):
+        lines = []
+        for game in batch.iter_rows(named=True):
+            if game["team_score"] is not None and game["opponent_score"] is not None:
+                score = f"{int(game['team_score'])}-{int(game['opponent_score'])}"
+            else:
+                score = "N/A"
+            week = game["week"] if game["week"] is not None else ""
+            lines.append(
+                f"{game['game_id']:<20} | {week:>2} | {game['team']:<4} | {game['opponent']:<4} | "
+                f"{game['side']:<4} | {score:<7} | {game['result'] or ''}"
+            )
+        print("\n".join(lines))
+
+    print(f"{len(results)} games.")
+
+
+def get_season_label(season, last_season=None):
+    """Returns "2023" for a single season or "1999-2023" for a range."""
+    if last_season is None or last_season == season:
+        return str(season)
+    return f"{season}-{last_season}"
+
+
 def display_team_games(games, season, team_abbr):
     """
     Displays the game information to the console in a tabular format.
@@ -81,12 +186,18 @@ def main():
     parser.add_argument(
         "team", type=str, help="The 3-letter team abbreviation (e.g., KC)"
     )
+    parser.add_argument(
+        "last_season",
+        type=int,
+        nargs="?",
+        help="Optional last season, to list every season from season through it",
+    )
 
     args = parser.parse_args()
     team_abbr = args.team.upper()
 
-    games = fetch_team_games(args.season, team_abbr)
-    display_team_games(games, args.season, team_abbr)
+    games = fetch_team_games(args.season, team_abbr, args.last_season)
+    display_team_games(games, get_season_label(args.season, args.last_season), team_abbr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+"""
+Span timing for the hot paths, enabled by the --debug flag.
+
+Code wraps its stages in `with tracing.span("pbp.load"):` and reports work done
+with tracing.count("rows_scanned", n). While tracing is disabled (the default)
+span() returns a shared no-op context and count() returns immediately, so the
+instrumentation costs one function call per stage.
+
+When enabled, each finished span is written either as one JSON line (to stderr
+or a file) or, for a path ending in .json, collected into a Chrome trace file
+that chrome://tracing or https://ui.perfetto.dev can open.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+_TRACER = None  # The active _Tracer, or None while tracing is disabled
+
+
+class _NullSpan:
+    """The span handed out while tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.counters = {}
+        self.parent = None
+        self.start_ns = 0
+
+    def __enter__(self):
+        stack = self.tracer.stack()
+        self.parent = stack[-1] if stack else None
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        end_ns = time.perf_counter_ns()
+        stack = self.tracer.stack()
+        stack.pop()
+        # Work counted in a span also counts towards the spans enclosing it
+        if self.parent is not None:
+            for name, value in self.counters.items():
+                self.parent.counters[name] = self.parent.counters.get(name, 0) + value
+        self.tracer.record(self, end_ns, depth=len(stack), failed=exc_info[0] is not None)
+        return False
+
+
+class _Tracer:
+    def __init__(self, output_path=None):
+        self.output_path = output_path
+        self.chrome = bool(output_path) and output_path.endswith(".json")
+        self.origin_ns = time.perf_counter_ns()
+        self.events = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.out = None
+        if not self.chrome:
+            self.out = open(output_path, "w", encoding="utf-8") if output_path else sys.stderr
+
+    def stack(self):
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    def record(self, span, end_ns, depth, failed):
+        start_us = (span.start_ns - self.origin_ns) / 1000
+        duration_us = (end_ns - span.start_ns) / 1000
+        with self.lock:
+            if self.chrome:
+                self.events.append(
+                    {
+                        "name": span.name,
+                        "ph": "X",
+                        "ts": start_us,
+                        "dur": duration_us,
+                        "pid": os.getpid(),
+                        "tid": threading.get_ident(),
+                        "args": {**span.args, **span.counters},
+                    }
+                )
+                return
+
+            record = {
+                "span": span.name,
+                "start_ms": round(start_us / 1000, 3),
+                "duration_ms": round(duration_us / 1000, 3),
+                "depth": depth,
+            }
+            if span.args:
+                record["args"] = span.args
+            if span.counters:
+                record["counters"] = span.counters
+            if failed:
+                record["error"] = True
+            self.out.write(json.dumps(record, default=str) + "\n")
+
+    def close(self):
+        if self.chrome:
+            with open(self.output_path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, default=str)
+            print(f"Trace saved to {self.output_path}", file=sys.stderr)
+        elif self.out is not sys.stderr:
+            self.out.close()
+        else:
+            self.out.flush()
+
+
+def enable(output_path=None):
+    """
+    Starts recording spans: as JSON lines to stderr (or output_path), or as a
+    Chrome trace when output_path ends in .json. Restarts any active trace.
+    """
+    global _TRACER
+    disable()
+    _TRACER = _Tracer(output_path)
+
+
+def disable():
+    """Stops recording and writes out (or closes) the active trace, if any."""
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    if tracer is not None:
+        tracer.close()
+
+
+def enabled():
+    """Whether spans are being recorded; guards counters that cost work to compute."""
+    return _TRACER is not None
+
+
+def span(name, **args):
+    """
+    Returns a context manager timing the enclosed block as a span called name;
+    keyword arguments are recorded with it.
+    """
+    if _TRACER is None:
+        return _NULL_SPAN
+    return _Span(_TRACER, name, args)
+
+
+def count(name, value=1):
+    """Adds value to a counter (e.g. rows_scanned, bytes_loaded) of the innermost span."""
+    if _TRACER is None:
+        return
+    stack = _TRACER.stack()
+    if stack:
+        counters = stack[-1].counters
+        counters[name] = counters.get(name, 0) + value
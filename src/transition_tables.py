@@ -0,0 +1,262 @@
+"""
+Offline builder for the simulator's transition tables.
+
+Streams seasons of play-by-play from the local store and counts run/pass
+outcomes per game state (down, distance, field position, score differential
+and time bucket) into a compact table, saved as an .npy file the simulator
+memory-maps. A manifest records which games are counted, so rebuilding after a
+new week of data only aggregates the new games.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from . import pbp_store
+from .utils import get_cache_dir
+
+TABLE_VERSION = 1
+
+# Bucket edges, applied with np.digitize (a value equal to an edge falls in the upper bucket)
+DISTANCE_EDGES = [4, 7, 11]  # ydstogo: 1-3, 4-6, 7-10, 11+
+FIELD_EDGES = [11, 21, 41, 61, 81]  # yardline_100: 1-10, 11-20, 21-40, 41-60, 61-80, 81-99
+SCORE_EDGES = [-16, -8, 0, 1, 9, 17]  # offense minus defense: <=-17 ... >=17
+TIME_EDGES = [300, 900, 1800, 1920, 2700]  # game seconds remaining: last 5 min ... 1st quarter
+YARDS_EDGES = [-9, -4, 0, 1, 3, 5, 7, 10, 15, 20, 30]  # yards gained outcome bins
+
+N_YARDS_OUTCOMES = len(YARDS_EDGES) + 1
+TURNOVER_OUTCOME = N_YARDS_OUTCOMES  # Interceptions and lost fumbles
+TABLE_SHAPE = (
+    4,
+    len(DISTANCE_EDGES) + 1,
+    len(FIELD_EDGES) + 1,
+    len(SCORE_EDGES) + 1,
+    len(TIME_EDGES) + 1,
+    N_YARDS_OUTCOMES + 1,
+)
+STATE_CELLS = int(np.prod(TABLE_SHAPE[:-1]))
+
+TABLE_COLUMNS = [
+    "game_id",
+    "play_type",
+    "down",
+    "ydstogo",
+    "yardline_100",
+    "score_differential",
+    "game_seconds_remaining",
+    "yards_gained",
+    "interception",
+    "fumble_lost",
+]
+
+
+def get_table_dir():
+    """Returns the directory holding the transition table artifact."""
+    return get_cache_dir("transitions")
+
+
+def state_cells(down, togo, yardline, score_diff, seconds_remaining):
+    """Returns the flat state-cell index of each play (or simulated game) state."""
+    indices = (
+        np.clip(np.asarray(down, dtype=np.int64) - 1, 0, 3),
+        np.digitize(togo, DISTANCE_EDGES),
+        np.digitize(yardline, FIELD_EDGES),
+        np.digitize(score_diff, SCORE_EDGES),
+        np.digitize(seconds_remaining, TIME_EDGES),
+    )
+    return np.ravel_multi_index(indices, TABLE_SHAPE[:-1])
+
+
+def _empty_table():
+    return {
+        "counts": np.zeros(TABLE_SHAPE, dtype=np.uint32),
+        "outcome_yards_sum": np.zeros(N_YARDS_OUTCOMES + 1),
+        "outcome_plays": np.zeros(N_YARDS_OUTCOMES + 1, dtype=np.int64),
+        "time_seconds_sum": np.zeros(TABLE_SHAPE[4]),
+        "time_plays": np.zeros(TABLE_SHAPE[4], dtype=np.int64),
+        "game_ids": set(),
+    }
+
+
+def aggregate_plays(plays):
+    """
+    Counts the run/pass outcomes of a play frame (TABLE_COLUMNS, each game's
+    plays in order) into a new partial table.
+    """
+    table = _empty_table()
+    if plays.is_empty():
+        return table
+
+    def column(name, dtype=float):
+        return np.asarray(plays[name], dtype=dtype)
+
+    play_type = column("play_type", object)
+    down, togo, yardline = column("down"), column("ydstogo"), column("yardline_100")
+    score_diff, remaining = column("score_differential"), column("game_seconds_remaining")
+    game_ids = column("game_id", object)
+
+    # Clock used by a play: drop in game time to the next play of the same game
+    seconds = np.full_like(remaining, np.nan)
+    seconds[:-1] = remaining[:-1] - remaining[1:]
+    seconds[:-1][game_ids[:-1] != game_ids[1:]] = np.nan
+
+    scrimmage = ((play_type == "run") | (play_type == "pass")) & np.isfinite(
+        down + togo + yardline + score_diff + remaining
+    )
+    table["game_ids"] = set(np.unique(game_ids).tolist())
+    if not scrimmage.any():
+        return table
+
+    yards = np.nan_to_num(column("yards_gained"))[scrimmage]
+    turnover = (
+        np.nan_to_num(column("interception")) + np.nan_to_num(column("fumble_lost"))
+    )[scrimmage] > 0
+    outcomes = np.where(turnover, TURNOVER_OUTCOME, np.digitize(yards, YARDS_EDGES))
+
+    cells = state_cells(
+        down[scrimmage], togo[scrimmage], yardline[scrimmage], score_diff[scrimmage], remaining[scrimmage]
+    )
+    flat = cells * TABLE_SHAPE[-1] + outcomes
+    table["counts"] += np.bincount(flat, minlength=table["counts"].size).reshape(TABLE_SHAPE).astype(np.uint32)
+
+    table["outcome_yards_sum"] += np.bincount(outcomes, weights=np.where(turnover, 0, yards), minlength=N_YARDS_OUTCOMES + 1)
+    table["outcome_plays"] += np.bincount(outcomes, minlength=N_YARDS_OUTCOMES + 1)
+
+    timed = np.isfinite(seconds[scrimmage]) & (seconds[scrimmage] >= 0)
+    time_buckets = np.digitize(remaining[scrimmage][timed], TIME_EDGES)
+    table["time_seconds_sum"] += np.bincount(
+        time_buckets, weights=np.minimum(seconds[scrimmage][timed], 60), minlength=TABLE_SHAPE[4]
+    )
+    table["time_plays"] += np.bincount(time_buckets, minlength=TABLE_SHAPE[4])
+    return table
+
+
+def merge_tables(total, partial):
+    """Adds a partial table into a running total, in place."""
+    for key in ("counts", "outcome_yards_sum", "outcome_plays", "time_seconds_sum", "time_plays"):
+        total[key] += partial[key]
+    total["game_ids"] |= partial["game_ids"]
+    return total
+
+
+def _meta_path(table_dir):
+    return os.path.join(table_dir, "meta.json")
+
+
+def _counts_path(table_dir):
+    return os.path.join(table_dir, "counts.npy")
+
+
+def _bucket_spec():
+    return {
+        "distance": DISTANCE_EDGES,
+        "field": FIELD_EDGES,
+        "score": SCORE_EDGES,
+        "time": TIME_EDGES,
+        "yards": YARDS_EDGES,
+    }
+
+
+def save_table(table, table_dir=None):
+    """Writes the counts (.npy) and manifest (JSON) of a table atomically."""
+    table_dir = table_dir or get_table_dir()
+    tmp_path = _counts_path(table_dir) + ".tmp.npy"
+    np.save(tmp_path, table["counts"])
+    os.replace(tmp_path, _counts_path(table_dir))
+
+    meta = {
+        "version": TABLE_VERSION,
+        "buckets": _bucket_spec(),
+        "outcome_yards_sum": table["outcome_yards_sum"].tolist(),
+        "outcome_plays": table["outcome_plays"].tolist(),
+        "time_seconds_sum": table["time_seconds_sum"].tolist(),
+        "time_plays": table["time_plays"].tolist(),
+        "game_ids": sorted(table["game_ids"]),
+    }
+    tmp_path = _meta_path(table_dir) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, _meta_path(table_dir))
+
+
+def load_table(table_dir=None, mmap=True):
+    """
+    Loads a saved table, memory-mapping the counts by default. Returns None if
+    there is no table or it was built with a different version or bucketing.
+    """
+    table_dir = table_dir or get_table_dir()
+    if not (os.path.exists(_meta_path(table_dir)) and os.path.exists(_counts_path(table_dir))):
+        return None
+
+    with open(_meta_path(table_dir), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != TABLE_VERSION or meta.get("buckets") != _bucket_spec():
+        return None
+
+    return {
+        "counts": np.load(_counts_path(table_dir), mmap_mode="r" if mmap else None),
+        "outcome_yards_sum": np.array(meta["outcome_yards_sum"]),
+        "outcome_plays": np.array(meta["outcome_plays"], dtype=np.int64),
+        "time_seconds_sum": np.array(meta["time_seconds_sum"]),
+        "time_plays": np.array(meta["time_plays"], dtype=np.int64),
+        "game_ids": set(meta["game_ids"]),
+    }
+
+
+def build_tables(seasons, table_dir=None, refresh=False):
+    """
+    Updates the transition table with every stored game of the given seasons
+    that is not counted yet, one season at a time. Seasons whose ingest is
+    stale (see pbp_store.is_ingest_fresh) are re-ingested first to pick up
+    newly played games; refresh=True re-ingests every season.
+    Returns the number of newly counted games.
+    """
+    table = load_table(table_dir, mmap=False) or _empty_table()
+    # np.load without mmap may return a read-only array for some inputs
+    table["counts"] = np.array(table["counts"], dtype=np.uint32)
+
+    added = 0
+    for season in seasons:
+        if refresh or not pbp_store.is_ingest_fresh(season):
+            pbp_store.ingest_season(season)
+
+        new_paths = [
+            path
+            for game_id, path in pbp_store.list_game_paths(season).items()
+            if game_id not in table["game_ids"]
+        ]
+        if not new_paths:
+            continue
+
+        partial = aggregate_plays(pbp_store.read_games(new_paths, columns=TABLE_COLUMNS))
+        merge_tables(table, partial)
+        added += len(new_paths)
+
+    if added:
+        save_table(table, table_dir)
+    return added
+
+
+def main():
+    """
+    Main function
+    """
+    parser = argparse.ArgumentParser(
+        description="Build or incrementally update the simulator's transition tables."
+    )
+    parser.add_argument("seasons", type=int, nargs="+", help="Seasons to include (e.g., 2021 2022 2023).")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-ingest each season from nflreadpy first to pick up new games.",
+    )
+
+    args = parser.parse_args()
+    added = build_tables(args.seasons, refresh=args.refresh)
+    print(f"Added {added} new games to the transition table in {get_table_dir()}.")
+
+
+if __name__ == "__main__":
+    main()
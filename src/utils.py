@@ -1,29 +1,195 @@
-import nflreadpy
+import json
+import os
+import time
 
-_TEAM_COLORS_CACHE = None
+import numpy as np
 
-def get_team_colors_map():
+from .data_source import get_data_source
+
+# Root directory for local data caches; override with the SIDELINES_CACHE_DIR env var.
+CACHE_DIR_ENV = "SIDELINES_CACHE_DIR"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sidelines")
+
+# Team registry snapshot: bump the version when the stored fields change, and
+# refetch from nflreadpy once the snapshot is older than the TTL.
+TEAM_REGISTRY_VERSION = 1
+TEAM_REGISTRY_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Hex fallbacks for teams missing from the registry (get_distinct_colors needs hex)
+DEFAULT_HOME_COLORS = {"primary": "#0000FF", "secondary": "#FFFFFF"}
+DEFAULT_VISITOR_COLORS = {"primary": "#FF0000", "secondary": "#FFFFFF"}
+
+_TEAM_REGISTRY = None  # Process-wide copy of the loaded registry
+
+def get_cache_dir(*parts):
+    """
+    Returns the local cache directory (optionally joined with sub-path parts),
+    creating it if it does not exist yet.
+    """
+    path = os.path.join(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def get_team_registry_path():
+    """Returns the path of the on-disk team registry snapshot."""
+    return os.path.join(get_cache_dir("teams"), "registry.json")
+
+def _fetch_team_registry():
+    """Builds a registry from the data source's teams table: abbreviation -> team metadata."""
+    teams = {}
+    for row in get_data_source().load_teams().to_dicts():
+        teams[row["team_abbr"]] = {
+            "abbr": row["team_abbr"],
+            "name": row.get("team_name"),
+            "nickname": row.get("team_nick"),
+            "conference": row.get("team_conf"),
+            "division": row.get("team_division"),
+            "primary": row.get("team_color") or "#000000",
+            "secondary": row.get("team_color2") or "#FFFFFF",
+        }
+    return {"version": TEAM_REGISTRY_VERSION, "fetched_at": time.time(), "teams": teams}
+
+def _read_team_registry_snapshot():
+    """Returns the on-disk registry, or None if missing, unreadable or of another version."""
+    path = get_team_registry_path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            registry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if registry.get("version") != TEAM_REGISTRY_VERSION or not registry.get("teams"):
+        return None
+    return registry
+
+def _save_team_registry(registry):
+    path = get_team_registry_path()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(registry, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+def load_team_registry(refresh=False):
     """
-    Fetches official team colors using nflreadpy and returns a mapping.
-    Caches the result to avoid repeated API calls.
+    Returns the team registry ({"version", "fetched_at", "teams"}), where
+    "teams" maps each abbreviation to its name, nickname, conference, division
+    and primary/secondary colors.
+
+    The registry is read from the on-disk snapshot while it is younger than
+    TEAM_REGISTRY_TTL_SECONDS and refetched from nflreadpy otherwise (or when
+    refresh=True). If the fetch fails, the last good snapshot is used even if
+    stale; with no snapshot at all the registry is empty.
     """
-    global _TEAM_COLORS_CACHE
-    if _TEAM_COLORS_CACHE is not None:
-        return _TEAM_COLORS_CACHE
+    global _TEAM_REGISTRY
+    if _TEAM_REGISTRY is not None and not refresh:
+        return _TEAM_REGISTRY
+
+    snapshot = _read_team_registry_snapshot()
+    if snapshot is not None and not refresh:
+        age = time.time() - snapshot.get("fetched_at", 0)
+        if age < TEAM_REGISTRY_TTL_SECONDS:
+            _TEAM_REGISTRY = snapshot
+            return snapshot
 
     try:
-        teams_df = nflreadpy.load_teams()
-        mapping = {}
-        for row in teams_df.to_dicts():
-            mapping[row["team_abbr"]] = {
-                "primary": row["team_color"] if row["team_color"] else "#000000",
-                "secondary": row["team_color2"] if row["team_color2"] else "#FFFFFF",
-            }
-        _TEAM_COLORS_CACHE = mapping
-        return mapping
+        registry = _fetch_team_registry()
+        _save_team_registry(registry)
     except Exception as e:
-        print(f"Warning: Could not load team colors: {e}")
-        return {}
+        if snapshot is None:
+            print(f"Warning: Could not load team metadata: {e}")
+            return {"version": TEAM_REGISTRY_VERSION, "fetched_at": None, "teams": {}}
+        fetched = time.strftime("%Y-%m-%d", time.localtime(snapshot.get("fetched_at", 0)))
+        print(f"Warning: Could not refresh team metadata ({e}); using snapshot from {fetched}.")
+        registry = snapshot
+
+    _TEAM_REGISTRY = registry
+    return registry
+
+def get_team(team_abbr):
+    """
+    Returns a team's registry entry (name, colors, ...) or None if unknown.
+    Historical abbreviations resolve to their franchise's current entry.
+    """
+    teams = load_team_registry()["teams"]
+    return teams.get(team_abbr) or teams.get(get_franchise(team_abbr))
+
+def get_team_colors_map():
+    """
+    Returns a mapping of team abbreviation -> {"primary", "secondary"} colors
+    from the team registry, including every historical abbreviation (mapped to
+    its franchise's colors unless the registry has an entry of its own).
+    """
+    teams = load_team_registry()["teams"]
+    colors_map = {
+        abbr: {"primary": team["primary"], "secondary": team["secondary"]}
+        for abbr, team in teams.items()
+    }
+    for alias, franchise in FRANCHISE_ALIASES.items():
+        if alias not in colors_map and franchise in colors_map:
+            colors_map[alias] = colors_map[franchise]
+    return colors_map
+
+### FRANCHISES ###
+
+# Current abbreviation of every franchise; its position is the franchise ID.
+FRANCHISES = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
+    "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LA", "LAC", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+    "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+
+# Historical or alternate abbreviation -> current franchise abbreviation
+FRANCHISE_ALIASES = {
+    "SD": "LAC",  # San Diego Chargers (through 2016)
+    "STL": "LA",  # St. Louis Rams (through 2015)
+    "LAR": "LA",
+    "OAK": "LV",  # Oakland Raiders (through 2019)
+    "JAC": "JAX",
+    "ARZ": "ARI",
+    "BLT": "BAL",
+    "CLV": "CLE",
+    "HST": "HOU",
+    "WSH": "WAS",
+}
+
+# Lookup arrays compiled once: every known abbreviation (sorted, for
+# np.searchsorted) and the franchise ID at the same position.
+_FRANCHISE_IDS = {abbr: i for i, abbr in enumerate(FRANCHISES)}
+_ABBR_KEYS = np.array(
+    sorted(list(FRANCHISES) + list(FRANCHISE_ALIASES)), dtype=str
+)
+_ABBR_FRANCHISE_IDS = np.array(
+    [_FRANCHISE_IDS[FRANCHISE_ALIASES.get(abbr, abbr)] for abbr in _ABBR_KEYS],
+    dtype=np.int16,
+)
+
+def get_franchise(team_abbr):
+    """Returns the current abbreviation of a team's franchise (unknown ones unchanged)."""
+    return FRANCHISE_ALIASES.get(team_abbr, team_abbr)
+
+def get_franchise_abbrs(team_abbr):
+    """
+    Returns every abbreviation (current and historical) of a team's franchise,
+    e.g. ["LV", "OAK"] for either; unknown abbreviations return just themselves.
+    """
+    target = franchise_id(team_abbr)
+    if target < 0:
+        return [team_abbr]
+    return _ABBR_KEYS[_ABBR_FRANCHISE_IDS == target].tolist()
+
+def franchise_ids(team_abbrs):
+    """
+    Maps an array of team abbreviations (current or historical) to integer
+    franchise IDs in one vectorized lookup; unknown abbreviations map to -1.
+    """
+    abbrs = np.asarray(team_abbrs).astype(str)
+    positions = np.searchsorted(_ABBR_KEYS, abbrs)
+    positions = np.minimum(positions, len(_ABBR_KEYS) - 1)
+    return np.where(_ABBR_KEYS[positions] == abbrs, _ABBR_FRANCHISE_IDS[positions], -1)
+
+def franchise_id(team_abbr):
+    """Returns the franchise ID of a single abbreviation, or -1 if unknown."""
+    return int(franchise_ids([team_abbr])[0])
 
 def hex_to_rgb(hex_color):
     """
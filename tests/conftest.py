@@ -0,0 +1,37 @@
+import polars as pl
+import pytest
+
+from src import data_source, draft_consensus, schedule_index, utils
+from src.utils import CACHE_DIR_ENV
+
+_SCHEDULE = pl.DataFrame(
+    {
+        "game_id": ["2023_01_DET_KC", "2023_02_KC_JAX", "2023_02_ARI_NYG"],
+        "season": [2023, 2023, 2023],
+        "week": [1, 2, 2],
+        "home_team": ["KC", "JAX", "NYG"],
+        "away_team": ["DET", "KC", "ARI"],
+        "home_score": [20, 9, 31],
+        "away_score": [21, 17, 28],
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Points the local data caches at a per-test temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache_dir))
+    monkeypatch.setattr(utils, "_TEAM_REGISTRY", None)
+    monkeypatch.delenv(data_source.DATA_SOURCE_ENV, raising=False)
+    monkeypatch.setattr(data_source, "_DATA_SOURCE", None)
+    monkeypatch.setattr(draft_consensus, "_CONSENSUS", None)
+    schedule_index.clear_cache()
+    yield cache_dir
+    schedule_index.clear_cache()
+
+
+@pytest.fixture
+def schedule():
+    """A three-game 2023 schedule (two KC games)."""
+    return _SCHEDULE
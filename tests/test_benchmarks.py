@@ -0,0 +1,94 @@
+import json
+import time
+
+import numpy as np
+import pytest
+
+from benchmarks.fixtures import make_fixture
+from benchmarks.suite import (
+    CASES,
+    check_budgets,
+    compare_results,
+    main,
+    peak_rss_above_baseline,
+    run_suite,
+)
+
+
+def test_fixture_matches_schedule():
+    fixture = make_fixture("game")
+    plays, game = fixture["plays"], fixture["schedule"].row(0, named=True)
+
+    assert plays["game_id"].unique().to_list() == [game["game_id"]]
+    assert plays["total_home_score"][-1] == game["home_score"]
+    assert plays["total_away_score"][-1] == game["away_score"]
+    assert plays["game_seconds_remaining"].is_sorted(descending=True)
+
+
+def test_run_suite_game_size(isolated_cache_dir):
+    document = run_suite(sizes=["game"], repeat=1, quiet=True)
+
+    assert set(document["results"]) == {f"{name}/game" for name, (_, sizes) in CASES.items() if "game" in sizes}
+    for result in document["results"].values():
+        assert result["wall_median_s"] > 0
+        assert result["peak_rss_bytes"] >= 0
+    # The suite uses its own cache directory and leaves the caller's untouched
+    assert not isolated_cache_dir.exists()
+
+
+def test_compare_flags_regressions(tmp_path):
+    def document(seconds, peak):
+        return {
+            "commit": None,
+            "results": {"sort_plays/season": {"wall_median_s": seconds, "peak_rss_bytes": peak}},
+        }
+
+    base = document(0.100, 8_000_000)
+    assert compare_results(base, document(0.105, 8_000_000)) == []
+    # Changes below the noise floor are ignored even if relatively large
+    assert compare_results(document(0.0001, 1000), document(0.0005, 5000)) == []
+
+    regressions = compare_results(base, document(0.150, 12_000_000))
+    assert [(key, metric) for key, metric, *_ in regressions] == [
+        ("sort_plays/season", "wall_median_s"),
+        ("sort_plays/season", "peak_rss_bytes"),
+    ]
+    # Results recorded before peak_rss_bytes existed are compared on time only
+    old = {"commit": None, "results": {"sort_plays/season": {"wall_median_s": 0.100, "peak_bytes": 1}}}
+    assert compare_results(old, document(0.100, 12_000_000)) == []
+
+    base_path, head_path = tmp_path / "base.json", tmp_path / "head.json"
+    base_path.write_text(json.dumps(base))
+    head_path.write_text(json.dumps(document(0.150, 8_000_000)))
+    with pytest.raises(SystemExit) as excinfo:
+        main(["compare", str(base_path), str(head_path)])
+    assert excinfo.value.code == 1
+
+
+def test_check_budgets():
+    document = {
+        "commit": None,
+        "results": {
+            "derive_expected_scores/season": {"wall_median_s": 2.0, "peak_rss_bytes": 1},
+            "simulate_games/season": {"wall_median_s": 0.5, "peak_rss_bytes": 100 * 2**20},
+            "sort_plays/season": {"wall_median_s": 60.0},
+        },
+    }
+    assert check_budgets(document) == [
+        ("derive_expected_scores/season", "wall_median_s", 2.0, 1.0),
+        ("simulate_games/season", "peak_rss_bytes", 100 * 2**20, 32 * 2**20),
+    ]
+    assert check_budgets(document, {"sort_plays/season": {"wall_median_s": 100.0}}) == []
+
+
+def test_peak_rss_excludes_setup():
+    setup = np.ones(32 * 2**20 // 8)  # Raises ru_maxrss before the measured call
+
+    def allocate():
+        buffer = np.ones(32 * 2**20 // 8)
+        time.sleep(0.05)
+        return buffer.sum()
+
+    assert peak_rss_above_baseline(lambda: None) < 4 * 2**20
+    assert peak_rss_above_baseline(allocate) >= 24 * 2**20
+    del setup
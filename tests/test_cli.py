@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src import schedule_index
+from src.cli import main
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules `sidelines find` must not import when the schedule is cached locally
+# (its startup time is budgeted by the cli_find_import benchmark)
+HEAVY_MODULES = {"nflreadpy", "pandas", "matplotlib", "mplcursors"}
+# Runs `find` and prints the top-level modules it imported
+FIND_SCRIPT = """
+import json, sys
+from src.cli import main
+main(["find", "KC", "2023"])
+print(json.dumps(sorted({name.split(".")[0] for name in sys.modules})))
+"""
+
+
+@patch("nflreadpy.load_schedules")
+def test_find_text(mock_load_schedules, schedule, capsys):
+    mock_load_schedules.return_value = schedule
+    main(["find", "kc", "2023"])
+
+    out = capsys.readouterr().out
+    assert "Games for KC in 2023:" in out
+    assert "2023_01_DET_KC" in out and "2023_02_KC_JAX" in out
+    assert "2023_02_ARI_NYG" not in out
+
+
+@patch("nflreadpy.load_schedules")
+def test_find_json(mock_load_schedules, schedule, capsys):
+    mock_load_schedules.return_value = schedule
+    main(["find", "KC", "2023", "--format", "json"])
+
+    games = json.loads(capsys.readouterr().out)
+    assert [game["game_id"] for game in games] == ["2023_01_DET_KC", "2023_02_KC_JAX"]
+    assert games[1]["away_score"] == 17
+
+
+@patch("nflreadpy.load_schedules")
+def test_find_filters_csv(mock_load_schedules, schedule, capsys):
+    mock_load_schedules.return_value = schedule
+    main(["find", "KC", "2023", "--max-margin", "3", "--result", "L", "-f", "csv"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("game_id,season,week")
+    assert len(lines) == 2 and lines[1].startswith("2023_01_DET_KC,")
+    assert lines[1].endswith(",KC,DET,home,20,21,-1,L")
+
+
+def test_unsupported_format_exits():
+    with pytest.raises(SystemExit) as exc:
+        main(["find", "KC", "2023", "-f", "plot"])
+    assert exc.value.code == 1
+
+
+def test_find_startup_imports(isolated_cache_dir, schedule):
+    # A completed season's schedule in the local cache never needs nflreadpy
+    schedule.write_parquet(schedule_index.get_schedule_path(2023))
+
+    result = subprocess.run(
+        [sys.executable, "-c", FIND_SCRIPT],
+        cwd=REPO_ROOT,
+        env={**os.environ, "SIDELINES_CACHE_DIR": str(isolated_cache_dir)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    *output, modules = result.stdout.splitlines()
+    assert any("2023_02_KC_JAX" in line for line in output)
+    assert not set(json.loads(modules)) & HEAVY_MODULES
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from src import data_source, utils
+from src.data_source import (
+    FixtureDataSource,
+    NflreadpyDataSource,
+    get_data_source,
+    record_fixtures,
+    set_data_source,
+)
+from src.play_by_play import get_play_by_play
+from src.team_games import fetch_team_games
+
+SCHEDULE = pl.DataFrame(
+    {
+        "game_id": ["2023_01_DET_KC", "2023_02_KC_JAX"],
+        "season": [2023, 2023],
+        "week": [1, 2],
+        "home_team": ["KC", "JAX"],
+        "away_team": ["DET", "KC"],
+        "home_score": [20, 9],
+        "away_score": [21, 17],
+    }
+)
+PBP = pl.DataFrame(
+    {
+        "game_id": ["2023_01_DET_KC", "2023_01_DET_KC", "2023_02_KC_JAX"],
+        "qtr": [1.0, 1.0, 1.0],
+        "desc": ["Kickoff", "Run", "Pass"],
+    }
+)
+TEAMS = pl.DataFrame({"team_abbr": ["KC"], "team_name": ["Kansas City Chiefs"], "team_color": ["#E31837"]})
+
+
+@pytest.fixture
+def fixture_dir(tmp_path):
+    # Record through the nflreadpy backend, as `python -m src.data_source` does
+    with patch("nflreadpy.load_schedules", return_value=SCHEDULE), patch(
+        "nflreadpy.load_pbp", return_value=PBP
+    ), patch("nflreadpy.load_teams", return_value=TEAMS):
+        record_fixtures([2023], str(tmp_path / "fixtures"))
+    return str(tmp_path / "fixtures")
+
+
+def test_default_is_nflreadpy(monkeypatch):
+    assert isinstance(get_data_source(), NflreadpyDataSource)
+
+    monkeypatch.setenv(data_source.DATA_SOURCE_ENV, "fixtures")
+    set_data_source(None)
+    with pytest.raises(ValueError, match=data_source.FIXTURE_DIR_ENV):
+        get_data_source()
+
+
+@patch("nflreadpy.load_pbp", side_effect=AssertionError("network"))
+@patch("nflreadpy.load_schedules", side_effect=AssertionError("network"))
+@patch("nflreadpy.load_teams", side_effect=AssertionError("network"))
+def test_fixture_backend_serves_recordings(_teams, _schedules, _pbp, fixture_dir, monkeypatch):
+    monkeypatch.setenv(data_source.DATA_SOURCE_ENV, "fixtures")
+    monkeypatch.setenv(data_source.FIXTURE_DIR_ENV, fixture_dir)
+
+    # The unchanged production code paths now read the recorded snapshots
+    games = fetch_team_games(2023, "KC")
+    assert [game["game_id"] for game in games] == ["2023_01_DET_KC", "2023_02_KC_JAX"]
+    assert get_play_by_play("2023_01_DET_KC", quiet=True)["desc"].to_list() == ["Kickoff", "Run"]
+    assert utils.get_team("KC")["primary"] == "#E31837"
+
+
+def test_fixture_backend_missing_season(fixture_dir):
+    source = FixtureDataSource(fixture_dir)
+    assert source.load_schedules([2023]).equals(SCHEDULE)
+    with pytest.raises(FileNotFoundError, match="season 2022"):
+        source.load_pbp([2022, 2023])
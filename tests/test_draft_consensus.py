@@ -0,0 +1,128 @@
+import random
+import statistics
+
+import pandas as pd
+
+from src import draft_consensus
+from src.draft_consensus import (
+    CELL_COLUMNS,
+    ConsensusTable,
+    RunningMedian,
+    get_consensus_table,
+    ingest_mocks,
+)
+from src.mock_draft_data import DRAFT_DATA, get_draft_dataframe, load_draft_picks
+
+NEW_MOCK = {
+    "TEST_XX": {
+        "source": "Test",
+        "author": "Tester",
+        "version": "Mock 1.0",
+        "date": "2026-04-01",
+        "context": "Full Round",
+        "url": "https://example.com/mock",
+        "last_checked": "2026-04-02",
+    }
+}
+
+
+def regrouped_consensus():
+    """The consensus computed from scratch with pandas, as the heatmap used to."""
+    df = get_draft_dataframe().astype(
+        {"team": str, "player": str, "position": str, "default_team": str}
+    )
+    df["seq"] = range(len(df))
+    df = df.sort_values(["date", "seq"], ascending=False)
+    df["consensus_count"] = df.groupby(["pick", "team", "player"])["player"].transform("count")
+    df["expert_info"] = [
+        f"{author} ({date}){' - TRADE' if is_trade else ''}"
+        for author, date, is_trade in zip(df["author"], df["date"], df["is_trade"])
+    ]
+    df_agg = (
+        df.groupby(CELL_COLUMNS[:-1], sort=False, dropna=False)
+        .agg({"expert_info": lambda x: "<br>• " + "<br>• ".join(dict.fromkeys(x))})
+        .reset_index()
+        .sort_values(["pick", "team", "player"], ignore_index=True)
+    )
+    medians = df.groupby("player")["pick"].median()
+    x_order = sorted(medians.index, key=lambda player: (medians[player], player))
+    return df_agg, x_order
+
+
+def assert_matches_regrouped(table):
+    expected, x_order = regrouped_consensus()
+    pd.testing.assert_frame_equal(
+        table.to_frame()[CELL_COLUMNS], expected[CELL_COLUMNS], check_dtype=False
+    )
+    assert table.player_order() == x_order
+
+
+def test_running_median_matches_statistics():
+    rng = random.Random(7)
+    values = sorted(rng.randint(1, 40) for _ in range(25))
+    median = RunningMedian(values)
+    for _ in range(300):
+        if values and rng.random() < 0.45:
+            value = rng.choice(values)
+            values.remove(value)
+            median.remove(value)
+        else:
+            value = rng.randint(1, 40)
+            values.append(value)
+            median.add(value)
+        assert len(median) == len(values)
+        assert median.median() == (statistics.median(values) if values else None)
+
+
+def test_from_picks_matches_regrouping():
+    table = ConsensusTable.from_picks(load_draft_picks())
+
+    assert sum(len(cell["experts"]) for cell in table.cells.values()) == len(DRAFT_DATA)
+    assert_matches_regrouped(table)
+
+
+def test_ingest_updates_table_incrementally():
+    table = get_consensus_table()
+    ingest_mocks(NEW_MOCK, [(1, "LV", "Fernando Mendoza", "TEST_XX", "QB"), (3, "KC", "Trade Up", "TEST_XX", "EDGE")])
+
+    # Updated in place rather than rebuilt
+    assert draft_consensus._CONSENSUS is table
+    row = table.to_frame().query("pick == 1").iloc[0]
+    assert row["consensus_count"] == 11
+    assert row["expert_info"].startswith("<br>• Tester (2026-04-01)<br>• ")
+    assert_matches_regrouped(table)
+
+    # Replacing a mock takes its earlier picks out of the cells and medians
+    ingest_mocks(NEW_MOCK, [(40, "NYJ", "Player Forty", "TEST_XX", "WR")])
+    assert "Trade Up" not in table.medians
+    assert table.to_frame().query("pick == 1").iloc[0]["consensus_count"] == 10
+    assert table.player_order()[-1] == "Player Forty"
+    assert_matches_regrouped(table)
+
+
+def test_ingest_before_first_use():
+    ingest_mocks(NEW_MOCK, [(2, "NYJ", "David Bailey", "TEST_XX", "EDGE")])
+
+    assert draft_consensus._CONSENSUS is None
+    table = get_consensus_table()
+    assert_matches_regrouped(table)
+
+    # Replacing a mock the table was built from
+    ingest_mocks(NEW_MOCK, [(2, "NYJ", "Arvell Reese", "TEST_XX", "EDGE")])
+    assert table.to_frame().query("pick == 2 and player == 'David Bailey'").iloc[0]["consensus_count"] == 2
+    assert_matches_regrouped(table)
+    table.remove_mock("TEST_XX")
+    table.remove_mock("TEST_XX")
+    assert sum(len(cell["experts"]) for cell in table.cells.values()) == len(DRAFT_DATA)
+
+
+def test_ingest_replacing_builtin_mock_matches_rebuild():
+    table = get_consensus_table()
+    meta = {**NEW_MOCK["TEST_XX"], "author": "Daniel Jeremiah"}
+    ingest_mocks({"NFL_DJ": meta}, [(1, "LV", "Ty Simpson", "NFL_DJ", "QB")])
+
+    assert table.to_frame().query("pick == 1 and player == 'Fernando Mendoza'").iloc[0]["consensus_count"] == 9
+    assert_matches_regrouped(table)
+    rebuilt = ConsensusTable.from_picks(load_draft_picks())
+    pd.testing.assert_frame_equal(table.to_frame(), rebuilt.to_frame())
+    assert table.player_order() == rebuilt.player_order()
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+from src.expected_points import (
+    forward_fill,
+    pre_snap_scores,
+    derive_expected_scores,
+)
+
+
+def _reference_expected_scores(df, home_team, visitor_team):
+    """The original row-wise implementation from plot_scores."""
+    df = df.copy()
+    df["preSnapHomeScore"] = df["total_home_score"].shift(1).ffill().fillna(0).astype(int)
+    df["preSnapVisitorScore"] = df["total_away_score"].shift(1).ffill().fillna(0).astype(int)
+    df["possessionTeam"] = df["posteam"].ffill()
+    df["home_expected"] = df.apply(
+        lambda row: row["preSnapHomeScore"]
+        + (row["ep"] if row["possessionTeam"] == home_team else 0),
+        axis=1,
+    ).ffill()
+    df["visitor_expected"] = df.apply(
+        lambda row: row["preSnapVisitorScore"]
+        + (row["ep"] if row["possessionTeam"] == visitor_team else 0),
+        axis=1,
+    ).ffill()
+    return df
+
+
+def _random_plays(n, seed=0):
+    rng = np.random.default_rng(seed)
+    ep = rng.normal(1.5, 2.0, n)
+    ep[rng.random(n) < 0.1] = np.nan
+    posteam = rng.choice(np.array(["KC", "DET", None], dtype=object), n, p=[0.45, 0.45, 0.1])
+    posteam[0] = None
+    home = np.cumsum(rng.random(n) < 0.02) * 7.0
+    away = np.cumsum(rng.random(n) < 0.02) * 3.0
+    home[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame(
+        {"total_home_score": home, "total_away_score": away, "ep": ep, "posteam": posteam}
+    )
+
+
+def test_forward_fill():
+    filled = forward_fill(np.array([np.nan, 1.0, np.nan, 3.0, np.nan]))
+    assert np.isnan(filled[0])
+    assert filled[1:].tolist() == [1.0, 1.0, 3.0, 3.0]
+
+    teams = forward_fill(np.array([None, "KC", None, np.nan, "DET"], dtype=object))
+    assert teams.tolist() == [None, "KC", "KC", "KC", "DET"]
+
+
+def test_pre_snap_scores():
+    assert pre_snap_scores([0, 7, np.nan, 10]).tolist() == [0, 0, 7, 7]
+
+
+def _assert_matches_reference(df):
+    expected = _reference_expected_scores(df, "KC", "DET")
+    derived = derive_expected_scores(df, "KC", "DET")
+
+    for column in ["preSnapHomeScore", "preSnapVisitorScore"]:
+        np.testing.assert_array_equal(derived[column], expected[column].to_numpy())
+    for column in ["home_expected", "visitor_expected"]:
+        np.testing.assert_array_equal(
+            derived[column], expected[column].to_numpy(dtype=float)
+        )
+    assert list(derived["possessionTeam"][1:]) == list(expected["possessionTeam"][1:])
+
+
+def test_derive_expected_scores_matches_row_wise_reference():
+    _assert_matches_reference(_random_plays(2000))
+
+
+def test_derive_expected_scores_season_scale():
+    # Timed against its budget by the derive_expected_scores benchmark
+    _assert_matches_reference(_random_plays(50_000, seed=1))
@@ -0,0 +1,79 @@
+import json
+import subprocess
+import sys
+import numpy as np
+import pandas as pd
+import polars as pl
+from src.game_analysis import (
+    analyze_game,
+    analyze_games,
+    analysis_to_json,
+    find_lead_changes,
+    format_analysis,
+)
+
+
+def _game_plays(game_id="2023_01_DET_KC"):
+    return {
+        "game_id": [game_id] * 6,
+        "home_team": ["KC"] * 6,
+        "away_team": ["DET"] * 6,
+        "qtr": [1, 1, 2, 2, 3, 4],
+        "game_seconds_remaining": [3600, 3000, 2700, 2000, 1500, 100],
+        "total_home_score": [0, 7, 7, 7, 14, 14],
+        "total_away_score": [0, 0, 3, 10, 10, 17],
+        "ep": [1.0, 0.5, 2.0, 1.5, 3.0, 0.2],
+        "posteam": ["KC", "DET", "DET", "KC", "DET", None],
+    }
+
+
+def test_find_lead_changes_ignores_ties():
+    changes = find_lead_changes(np.array([0, 3, 3, 0, -4, -4, 7]))
+    assert [c["play_index"] for c in changes] == [4, 6]
+    assert [c["leader_sign"] for c in changes] == [-1, 1]
+
+
+def test_analyze_game_series_and_summaries():
+    analysis = analyze_game(pd.DataFrame(_game_plays()), "KC", "DET", 14, 17)
+
+    # DET won, so margins are DET-relative
+    assert analysis["leader"] == "DET"
+    series = analysis["series"]
+    assert series["net_actual"].tolist() == [0, 0, -7, -4, 3, -4]
+    assert series["game_seconds_elapsed"].tolist() == [0, 600, 900, 1600, 2100, 3500]
+    assert [c["leader"] for c in analysis["lead_changes"]] == ["DET", "KC"]
+
+    quarters = analysis["quarters"]
+    assert [q["quarter"] for q in quarters] == [1, 2, 3, 4]
+    assert [q["home_points"] for q in quarters] == [7, 0, 7, 0]
+    assert [q["visitor_points"] for q in quarters] == [0, 10, 0, 7]
+
+    data = json.loads(analysis_to_json(analysis))
+    assert data["series"]["net_actual"] == [0, 0, -7, -4, 3, -4]
+    assert "Lead changes: 2" in format_analysis(analysis)
+
+
+def test_analyze_games_many_games_from_one_frame():
+    plays = pl.concat(
+        [pl.DataFrame(_game_plays("2023_01_DET_KC")), pl.DataFrame(_game_plays("2023_01_ARI_WAS"))]
+    )
+    schedule_rows = {
+        "2023_01_ARI_WAS": {"home_team": "WAS", "away_team": "ARI", "home_score": 20, "away_score": 16}
+    }
+
+    analyses = analyze_games(plays, schedule_rows)
+
+    assert set(analyses) == {"2023_01_DET_KC", "2023_01_ARI_WAS"}
+    assert analyses["2023_01_DET_KC"]["leader"] == "DET"
+    assert analyses["2023_01_DET_KC"]["final_visitor_score"] == 17
+    assert analyses["2023_01_ARI_WAS"]["home_team"] == "WAS"
+    assert len(analyses["2023_01_ARI_WAS"]["series"]["net_actual"]) == 6
+
+
+def test_game_analysis_does_not_import_matplotlib():
+    code = (
+        "import sys, src.game_analysis; "
+        "print(any(m.split('.')[0] in ('matplotlib', 'mplcursors') for m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+from src.game_clock import (
+    game_seconds_elapsed,
+    get_overtime_seconds,
+    get_periods,
+    is_playoff,
+)
+
+
+def _ot_plays(game_id, season_type=None):
+    # Last play of Q4, then an OT kickoff and a play 4:00 into overtime
+    data = {
+        "game_id": [game_id] * 3,
+        "qtr": [4.0, 5.0, 5.0],
+        "quarter_seconds_remaining": [5.0, 600.0, 360.0],
+        "game_seconds_remaining": [5.0, 600.0, 360.0],
+    }
+    if season_type:
+        data["season_type"] = [season_type] * 3
+    return pl.DataFrame(data)
+
+
+def test_regular_season_overtime():
+    elapsed = game_seconds_elapsed(_ot_plays("2023_05_KC_MIN"))
+    # A 10-minute OT: its clock starts at 600, so 4:00 in is 3600 + 240
+    assert elapsed.tolist() == [3595.0, 3600.0, 3840.0]
+    assert get_periods(_ot_plays("2023_05_KC_MIN"))[-1] == ("OT", 3600.0, 4200.0)
+
+
+def test_playoff_and_pre_2017_overtime():
+    # 15-minute periods: in the playoffs (explicit or from season_type) and before 2017
+    plays = _ot_plays("2023_21_KC_BUF").with_columns(quarter_seconds_remaining=pl.lit(900.0))
+    assert game_seconds_elapsed(plays, playoff=True)[1] == 3600.0
+    assert get_overtime_seconds(_ot_plays("2023_21_KC_BUF", "POST")).tolist() == [900] * 3
+    assert get_overtime_seconds(_ot_plays("2012_03_NO_KC")).tolist() == [900] * 3
+
+    # Double overtime starts after a full 15-minute first OT
+    double_ot = pd.DataFrame({"qtr": [6.0], "quarter_seconds_remaining": [900.0]})
+    assert game_seconds_elapsed(double_ot, playoff=True).tolist() == [4500.0]
+    labels = [label for label, _, _ in get_periods(double_ot, playoff=True)]
+    assert labels == ["Q1", "Q2", "Q3", "Q4", "OT", "OT2"]
+
+
+def test_fallback_without_quarter_clock():
+    plays = pd.DataFrame(
+        {"qtr": [1.0, 3.0, np.nan], "game_seconds_remaining": [3150.0, 1000.0, 0.0]}
+    )
+    # Quarter clock recovered from the game clock; missing quarter uses 3600 - gsr
+    assert game_seconds_elapsed(plays).tolist() == [450.0, 2600.0, 3600.0]
+
+
+def test_is_playoff():
+    assert is_playoff("REG") is False
+    assert is_playoff("SB") is True
+    assert is_playoff(None) is None
@@ -0,0 +1,78 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import polars as pl
+
+from src import game_analysis, metrics_cache
+from src.game_analysis import analyze_game
+from src.metrics_cache import cached_analyze_game, evict, get_metrics_dir
+
+
+def _plays(last_ep=0.2):
+    return pl.DataFrame(
+        {
+            "qtr": [1, 1, 2, 2, 3, 4],
+            "game_seconds_remaining": [3600, 3000, 2700, 2000, 1500, 100],
+            "total_home_score": [0, 7, 7, 7, 14, 14],
+            "total_away_score": [0, 0, 3, 10, 10, 17],
+            "ep": [1.0, 0.5, None, 1.5, 3.0, last_ep],
+            "posteam": [None, "DET", "DET", "KC", "DET", None],
+            "desc": ["Kickoff", "Run", "Timeout", "Pass", "Sack", "End"],
+        }
+    )
+
+
+def _entries():
+    return sorted(name for name in os.listdir(get_metrics_dir()) if name.endswith(".npz"))
+
+
+def test_cached_analysis_round_trips():
+    expected = analyze_game(_plays(), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+
+    first = cached_analyze_game(_plays(), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+    with patch.object(metrics_cache, "analyze_game") as analyze:
+        cached = cached_analyze_game(_plays(), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+        analyze.assert_not_called()
+
+    assert len(_entries()) == 1
+    for analysis in (first, cached):
+        assert {k: v for k, v in analysis.items() if k != "series"} == {
+            k: v for k, v in expected.items() if k != "series"
+        }
+        assert analysis["series"].keys() == expected["series"].keys()
+        for name, values in expected["series"].items():
+            if values.dtype == object:
+                assert list(analysis["series"][name]) == list(values)
+            else:
+                np.testing.assert_array_equal(analysis["series"][name], values)
+
+
+def test_data_or_version_change_misses():
+    cached_analyze_game(_plays(), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+
+    # Non-analysis columns do not change the snapshot; analysis inputs do
+    cached_analyze_game(_plays().with_columns(pl.lit("x").alias("desc")), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+    assert len(_entries()) == 1
+    cached_analyze_game(_plays(last_ep=0.3), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+    assert len(_entries()) == 2
+
+    with patch.object(metrics_cache, "ANALYSIS_VERSION", game_analysis.ANALYSIS_VERSION + 1):
+        cached_analyze_game(_plays(), "KC", "DET", 14, 17, game_id="2023_01_DET_KC")
+    assert len(_entries()) == 3
+
+
+def test_lru_eviction_keeps_recently_used():
+    for i in range(3):
+        cached_analyze_game(_plays(), "KC", "DET", 14, 17, game_id=f"2023_0{i}_DET_KC")
+    paths = {name: os.path.join(get_metrics_dir(), name) for name in _entries()}
+    entry_size = max(os.path.getsize(path) for path in paths.values())
+
+    # Age all entries, then use game 0 again so it becomes the most recent
+    for age, path in enumerate(paths.values()):
+        os.utime(path, (1_000_000 + age, 1_000_000 + age))
+    cached_analyze_game(_plays(), "KC", "DET", 14, 17, game_id="2023_00_DET_KC")
+    recent = max(paths, key=lambda name: os.path.getmtime(paths[name]))
+
+    assert evict(max_bytes=entry_size) == 2
+    assert _entries() == [recent]
@@ -0,0 +1,77 @@
+import pandas as pd
+import polars as pl
+from src import mock_draft_data
+from src.mock_draft_data import (
+    DEFAULT_ORDER,
+    DRAFT_DATA,
+    MOCK_REGISTRY,
+    add_mocks,
+    get_draft_dataframe,
+    load_draft_picks,
+    load_mock_registry,
+)
+
+NEW_MOCK = {
+    "TEST_XX": {
+        "source": "Test",
+        "author": "Tester",
+        "version": "Mock 1.0",
+        "date": "2026-04-01",
+        "context": "Full Round",
+        "url": "https://example.com/mock",
+        "last_checked": "2026-04-02",
+    }
+}
+
+
+def test_builtin_draft_dataframe():
+    df = get_draft_dataframe()
+
+    assert len(df) == len(DRAFT_DATA)
+    assert isinstance(df["player"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["team"].dtype, pd.CategoricalDtype)
+    # Same trade flags as comparing each row against DEFAULT_ORDER
+    expected = [team != DEFAULT_ORDER.get(pick) for pick, team, *_ in DRAFT_DATA]
+    assert df["is_trade"].tolist() == expected
+    assert df["default_team"].astype(str).tolist() == [DEFAULT_ORDER[p] for p, *_ in DRAFT_DATA]
+    assert df["author"].iloc[0] == MOCK_REGISTRY[DRAFT_DATA[0][3]]["author"]
+
+
+def test_add_mocks_to_store():
+    picks = [(1, "LV", "Fernando Mendoza", "TEST_XX", "QB"), (40, "KC", "Player Forty", "TEST_XX", "WR")]
+    add_mocks(NEW_MOCK, picks)
+
+    stored = load_draft_picks().filter(pl.col("source_id") == "TEST_XX")
+    assert stored["player"].cast(pl.String).to_list() == ["Fernando Mendoza", "Player Forty"]
+    # Picks past the known draft order have no default owner and are never trades
+    assert stored["is_trade"].to_list() == [False, False]
+    assert stored["default_team"].cast(pl.String).to_list() == ["LV", None]
+    assert load_mock_registry()["TEST_XX"]["author"] == "Tester"
+
+    # Re-adding a mock replaces its earlier picks
+    add_mocks(NEW_MOCK, [(2, "KC", "Trade Up", "TEST_XX", "EDGE")])
+    df = get_draft_dataframe()
+    assert len(df) == len(DRAFT_DATA) + 1
+    row = df[df["source_id"] == "TEST_XX"].iloc[0]
+    assert row["player"] == "Trade Up" and bool(row["is_trade"])
+
+
+def test_stored_mock_replaces_builtin():
+    meta = {**MOCK_REGISTRY["NFL_DJ"], "version": "Mock 4.0", "date": "2026-04-10"}
+    add_mocks({"NFL_DJ": meta}, [(1, "LV", "Ty Simpson", "NFL_DJ", "QB")])
+
+    replaced = load_draft_picks().filter(pl.col("source_id") == "NFL_DJ")
+    assert replaced["player"].cast(pl.String).to_list() == ["Ty Simpson"]
+    assert replaced["version"].cast(pl.String).to_list() == ["Mock 4.0"]
+    builtin_rows = sum(source_id == "NFL_DJ" for *_, source_id, _ in DRAFT_DATA)
+    assert len(load_draft_picks()) == len(DRAFT_DATA) - builtin_rows + 1
+
+    registry = load_mock_registry()
+    assert sorted(registry) == sorted(MOCK_REGISTRY)
+    assert registry["NFL_DJ"]["date"] == "2026-04-10"
+
+
+def test_store_location(isolated_cache_dir):
+    add_mocks(NEW_MOCK, [(1, "LV", "Fernando Mendoza", "TEST_XX", "QB")])
+    assert mock_draft_data.get_draft_store_dir() == str(isolated_cache_dir / "drafts")
+    assert (isolated_cache_dir / "drafts" / "picks.parquet").exists()
@@ -0,0 +1,111 @@
+import datetime
+import json
+import os
+from unittest.mock import patch
+
+import polars as pl
+
+from src import pbp_store
+
+
+def _season_pbp():
+    return pl.DataFrame(
+        {
+            "game_id": ["2023_01_DET_KC", "2023_01_DET_KC", "2023_01_ARI_WAS"],
+            "qtr": [1, 1, 1],
+            "desc": ["Kickoff", "Run", "Pass"],
+        }
+    )
+
+
+@patch("nflreadpy.load_pbp")
+def test_ingest_season_partitions_by_game(mock_load_pbp):
+    mock_load_pbp.return_value = _season_pbp()
+
+    assert pbp_store.ingest_season(2023) == 2
+    assert pbp_store.has_game("2023_01_DET_KC", 2023)
+    assert pbp_store.has_game("2023_01_ARI_WAS", 2023)
+    assert not os.path.exists(pbp_store.get_game_path("2023_01_DET_KC", 2023) + ".tmp")
+
+
+@patch("nflreadpy.load_pbp")
+def test_load_game_ingests_season_once(mock_load_pbp):
+    mock_load_pbp.return_value = _season_pbp()
+
+    plays = pbp_store.load_game("2023_01_DET_KC", 2023)
+    assert plays["desc"].to_list() == ["Kickoff", "Run"]
+
+    # Other games of the season are now served from disk
+    plays = pbp_store.load_game("2023_01_ARI_WAS", 2023, columns=["desc"])
+    assert plays.columns == ["desc"]
+    assert plays["desc"].to_list() == ["Pass"]
+    mock_load_pbp.assert_called_once_with(seasons=[2023])
+
+
+@patch("nflreadpy.load_pbp")
+def test_load_game_missing(mock_load_pbp, capsys):
+    mock_load_pbp.return_value = pl.DataFrame({"game_id": []})
+
+    assert pbp_store.load_game("2023_01_DET_KC", 2023).is_empty()
+    assert "No plays found for season 2023" in capsys.readouterr().out
+
+
+@patch("nflreadpy.load_pbp")
+def test_load_season_reads_all_partitions(mock_load_pbp):
+    mock_load_pbp.return_value = _season_pbp()
+
+    plays = pbp_store.load_season(2023, columns=["game_id", "desc", "not_a_column"])
+    assert plays.columns == ["game_id", "desc"]
+    assert sorted(plays["desc"].to_list()) == ["Kickoff", "Pass", "Run"]
+
+    pbp_store.load_season(2023)
+    mock_load_pbp.assert_called_once_with(seasons=[2023])
+
+
+def _age_marker(season, seconds):
+    path = pbp_store.get_ingest_marker_path(season)
+    with open(path, encoding="utf-8") as f:
+        marker = json.load(f)
+    marker["fetched_at"] -= seconds
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(marker, f)
+
+
+@patch("nflreadpy.load_pbp")
+def test_missing_game_does_not_refetch_season(mock_load_pbp):
+    mock_load_pbp.return_value = _season_pbp()
+
+    for _ in range(3):
+        assert pbp_store.load_game("2023_18_NYJ_BUF", 2023).is_empty()
+    mock_load_pbp.assert_called_once_with(seasons=[2023])
+
+
+@patch("nflreadpy.load_pbp")
+def test_season_in_progress_is_refetched_after_ttl(mock_load_pbp):
+    season = datetime.date.today().year
+    game_id = f"{season}_01_DET_KC"
+    mock_load_pbp.return_value = pl.DataFrame({"game_id": [game_id], "desc": ["Kickoff"]})
+
+    assert pbp_store.load_game(f"{season}_02_KC_LV", season).is_empty()
+    assert pbp_store.load_season(season)["desc"].to_list() == ["Kickoff"]
+    assert pbp_store.load_game(f"{season}_02_KC_LV", season).is_empty()
+    assert mock_load_pbp.call_count == 1
+
+    # Once the ingest is stale, the next load picks up newly played games
+    _age_marker(season, pbp_store.PBP_TTL_SECONDS + 1)
+    mock_load_pbp.return_value = pl.DataFrame(
+        {"game_id": [game_id, f"{season}_02_KC_LV"], "desc": ["Kickoff", "Pass"]}
+    )
+    assert sorted(pbp_store.load_season(season)["desc"].to_list()) == ["Kickoff", "Pass"]
+    assert pbp_store.load_game(f"{season}_02_KC_LV", season)["desc"].to_list() == ["Pass"]
+    assert mock_load_pbp.call_count == 2
+
+
+@patch("nflreadpy.load_pbp")
+def test_finished_season_never_goes_stale(mock_load_pbp):
+    mock_load_pbp.return_value = _season_pbp()
+
+    pbp_store.load_season(2023)
+    _age_marker(2023, pbp_store.PBP_TTL_SECONDS + 1)
+    pbp_store.load_season(2023)
+    mock_load_pbp.assert_called_once_with(seasons=[2023])
@@ -1,7 +1,12 @@
+import io
+import json
+
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 import polars as pl
-from src.play_by_play import get_play_by_play, display_play_by_play
+from src.cli import main
+from src.play_by_play import get_play_by_play, display_play_by_play, format_play_lines, write_play_by_play
 
 def test_get_play_by_play_invalid_id():
     assert get_play_by_play("invalid_id") is None
@@ -44,9 +49,10 @@ def test_get_play_by_play_success(mock_load_schedules, mock_load_pbp):
     result = get_play_by_play(game_id)
     
     assert result is not None
+    assert isinstance(result, pl.DataFrame)
     assert len(result) == 2
-    assert result[0]["desc"] == "Play 1"
-    assert result[1]["ep"] == 1.2
+    assert result["desc"][0] == "Play 1"
+    assert result["ep"][1] == 1.2
 
 def test_display_play_by_play_empty(capsys):
     display_play_by_play([])
@@ -65,3 +71,72 @@ def test_display_play_by_play_with_data(capsys):
     assert "[  7.00] Q1 - (1 & 10 at KC 10) Touchdown" in captured.out
     assert "[  3.00] Q2 - (4 & 5 at DET 25) Field Goal" in captured.out
     assert "[   N/A] Q? - Unknown" in captured.out
+
+def test_display_play_by_play_with_frame(capsys):
+    data = pl.DataFrame({
+        "qtr": [1, None],
+        "desc": ["Touchdown", "Unknown"],
+        "ep": [7.0, None],
+        "down": [1, None],
+        "ydstogo": [10, None],
+        "yrdln": ["KC 10", None],
+    })
+    display_play_by_play(data)
+    captured = capsys.readouterr()
+    assert "[  7.00] Q1 - (1 & 10 at KC 10) Touchdown" in captured.out
+    assert "[   N/A] Q? - Unknown" in captured.out
+
+def test_write_play_by_play_streams_batches():
+    data = pl.DataFrame({
+        "qtr": [1, 1, 2],
+        "desc": ["Kickoff", "Run", "Pass"],
+        "ep": [-0.004, 1.005, None],
+        "down": [None, 1, 2],
+        "ydstogo": [None, 10, 7],
+        "yrdln": ["KC 35", "KC 25", None],
+    })
+
+    out = io.StringIO()
+    assert write_play_by_play(data, out, batch_size=2) == 3
+    assert out.getvalue().splitlines() == [
+        "[ -0.00] Q1 - (at KC 35) Kickoff",
+        "[  1.00] Q1 - (1 & 10 at KC 25) Run",
+        "[   N/A] Q2 - (2 & 7) Pass",
+    ]
+
+    out = io.StringIO()
+    write_play_by_play(data, out, "csv", batch_size=2)
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "qtr,desc,ep,down,ydstogo,yrdln"
+    assert len(lines) == 4  # One header across batches
+
+    out = io.StringIO()
+    write_play_by_play(data, out, "json", batch_size=2)
+    plays = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [play["desc"] for play in plays] == ["Kickoff", "Run", "Pass"]
+    assert plays[2]["ep"] is None
+
+
+def test_expected_points_text_matches_python_formatting():
+    rng = np.random.default_rng(3)
+    # Random values plus exact and near half-cent ties, which Polars' round() breaks differently
+    eps = np.concatenate([rng.normal(1.5, 2.5, 5000), np.arange(-2000, 2000) / 1000 + 0.005, [-0.0, 0.125, -8.125]])
+    lines = format_play_lines(pl.DataFrame({"ep": eps, "desc": "Play"}))
+    assert [line[1:7] for line in lines] == ["%6.2f" % ep for ep in eps]
+
+
+@patch("nflreadpy.load_pbp")
+def test_cli_view_exports_season(mock_load_pbp, tmp_path):
+    mock_load_pbp.return_value = pl.DataFrame({
+        "game_id": ["2023_01_DET_KC", "2023_01_DET_KC", "2023_02_KC_JAX"],
+        "qtr": [1.0, 1.0, 1.0],
+        "desc": ["Kickoff", "Run", "Kickoff"],
+        "ep": [0.5, 1.0, 0.5],
+    })
+    output_path = tmp_path / "plays.csv"
+
+    main(["view", "2023", "-f", "csv", "-o", str(output_path)])
+
+    lines = output_path.read_text().splitlines()
+    assert lines[0] == "game_id,qtr,ep,desc"
+    assert len(lines) == 4
@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+import polars as pl
+
+from src.draft_consensus import get_consensus_table
+from src.plot_mocks import create_draft_heatmap
+
+TEAMS = pl.DataFrame(
+    {
+        "team_abbr": ["LV", "NYJ"],
+        "team_name": ["Las Vegas Raiders", "New York Jets"],
+        "team_nick": ["Raiders", "Jets"],
+        "team_conf": ["AFC", "AFC"],
+        "team_division": ["AFC West", "AFC East"],
+        "team_color": ["#000000", "#125740"],
+        "team_color2": ["#A5ACAF", "#FFFFFF"],
+    }
+)
+DEFAULT_COLOR = "#555555"
+
+
+@patch("nflreadpy.load_teams", return_value=TEAMS)
+def test_heatmap_batches_cells_into_few_traces(mock_load_teams):
+    fig = create_draft_heatmap()
+    cells = get_consensus_table().to_frame()
+
+    # One trace per border style instead of one per cell
+    assert len(fig.data) == 2
+    assert sum(len(trace.x) for trace in fig.data) == len(cells)
+
+    points = {}
+    for trace in fig.data:
+        is_trade = trace.marker.line.dash == "dot"
+        assert ("(TRADE UP)" in trace.hovertemplate) == is_trade
+        colorscale = dict((round(stop * trace.marker.cmax), color) for stop, color in trace.marker.colorscale)
+        for i, (player, pick_label) in enumerate(zip(trace.x, trace.y)):
+            points[(pick_label, trace.customdata[i][3], player)] = (
+                is_trade,
+                trace.marker.size[i],
+                trace.marker.line.width[i],
+                colorscale[trace.marker.color[i]],
+                trace.text[i],
+                list(trace.customdata[i]),
+            )
+
+    colors = {"LV": "#000000", "NYJ": "#125740"}
+    for row in cells.itertuples():
+        point = points[(f"Pick #{row.pick}", row.team, row.player)]
+        assert point == (
+            row.is_trade,
+            row.consensus_count * 6 + 25,
+            4 if row.consensus_count >= 7 else 1.5,
+            colors.get(row.team, DEFAULT_COLOR),
+            str(row.consensus_count),
+            [row.consensus_count, row.expert_info, row.position, row.team, row.is_trade, row.default_team],
+        )
+
+    assert list(fig.layout.xaxis.categoryarray) == get_consensus_table().player_order()
+    assert fig.layout.yaxis.categoryarray[0] == "Pick #15"
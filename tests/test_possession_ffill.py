@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from src.expected_points import derive_expected_scores
 from src.score_over_time import plot_scores
 from unittest.mock import patch
 
@@ -25,16 +26,14 @@ def test_possession_team_ffill_logic():
     }
     df = pd.DataFrame(data)
     
-    # We want to verify that in the final processed DF used for plotting:
+    # Verify the derived series used for plotting:
     # 1. possessionTeam for rows 1 and 2 is 'KC' (via ffill)
     # 2. home_expected for rows 1 and 2 uses 'KC' and doesn't just add 0
-    
-    # We can't easily test internal state of plot_scores without refactoring it,
-    # but we can check if we can extract the logic or just fix it and run smoke tests.
-    
-    # Actually, the user wants us to FIX it in src/score_over_time.py.
-    # Let's see if we can assert on the DataFrame if we were to split the calculation logic.
-    pass
+    derived = derive_expected_scores(df, "KC", "DET")
+
+    assert list(derived["possessionTeam"]) == ["KC", "KC", "KC", "KC"]
+    assert list(derived["home_expected"]) == [1.0, 1.1, 1.2, 1.3]
+    assert list(derived["visitor_expected"]) == [0.0, 0.0, 0.0, 0.0]
 
 @patch("matplotlib.pyplot.show")
 def test_plot_scores_with_missing_possession(mock_show):
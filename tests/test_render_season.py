@@ -0,0 +1,88 @@
+import os
+from unittest.mock import patch
+
+import numpy as np
+import polars as pl
+
+from src.render_season import render_season, select_games
+
+SCHEDULE = pl.DataFrame(
+    {
+        "game_id": ["2023_01_DET_KC", "2023_02_KC_JAX", "2023_02_ARI_NYG", "2023_03_CHI_KC"],
+        "season": [2023, 2023, 2023, 2023],
+        "game_type": ["REG", "REG", "REG", "REG"],
+        "home_team": ["KC", "JAX", "NYG", "KC"],
+        "away_team": ["DET", "KC", "ARI", "CHI"],
+        "home_score": [20, 9, 31, None],
+        "away_score": [21, 17, 28, None],
+    }
+)
+
+TEAMS = pl.DataFrame(
+    {
+        "team_abbr": ["KC", "DET", "JAX", "ARI", "NYG", "CHI"],
+        "team_color": ["#E31837", "#0076B6", "#006778", "#97233F", "#0B2265", "#0B162A"],
+        "team_color2": ["#FFB612", "#B0B7BC", "#D7A22A", "#000000", "#A71930", "#C83803"],
+    }
+)
+
+
+def _season_plays(schedule, plays_per_game=40):
+    frames = []
+    for row in schedule.to_dicts():
+        n = plays_per_game
+        frames.append(
+            pl.DataFrame(
+                {
+                    "game_id": [row["game_id"]] * n,
+                    "play_id": np.arange(n, dtype=float),
+                    "home_team": [row["home_team"]] * n,
+                    "away_team": [row["away_team"]] * n,
+                    "qtr": np.repeat([1.0, 2.0, 3.0, 4.0], n // 4),
+                    "game_seconds_remaining": np.linspace(3600, 0, n),
+                    "ep": np.linspace(-1, 3, n),
+                    "posteam": [row["home_team"], row["away_team"]] * (n // 2),
+                    "total_home_score": np.repeat([0.0, 7.0, 10.0, 20.0], n // 4),
+                    "total_away_score": np.repeat([3.0, 3.0, 14.0, 21.0], n // 4),
+                }
+            )
+        )
+    return pl.concat(frames)
+
+
+@patch("nflreadpy.load_schedules")
+def test_select_games_skips_unplayed_and_filters_team(mock_load_schedules):
+    mock_load_schedules.return_value = SCHEDULE
+
+    assert [row["game_id"] for row in select_games(2023)] == [
+        "2023_01_DET_KC",
+        "2023_02_ARI_NYG",
+        "2023_02_KC_JAX",
+    ]
+    assert [row["game_id"] for row in select_games(2023, "KC")] == ["2023_01_DET_KC", "2023_02_KC_JAX"]
+    assert select_games(2023, game_type="POST") == []
+
+
+@patch("nflreadpy.load_teams")
+@patch("nflreadpy.load_pbp")
+@patch("nflreadpy.load_schedules")
+def test_render_season_writes_one_png_per_game(mock_load_schedules, mock_load_pbp, mock_load_teams, tmp_path):
+    mock_load_schedules.return_value = SCHEDULE
+    mock_load_pbp.return_value = _season_plays(SCHEDULE)
+    mock_load_teams.return_value = TEAMS
+    output_dir = tmp_path / "charts"
+
+    rendered = render_season(2023, str(output_dir), workers=2)
+
+    assert sorted(rendered) == ["2023_01_DET_KC", "2023_02_ARI_NYG", "2023_02_KC_JAX"]
+    for path in rendered.values():
+        assert os.path.getsize(path) > 0
+    # The season is loaded once for all games
+    mock_load_pbp.assert_called_once()
+    mock_load_teams.assert_called_once()
+
+    # Re-running for one team only renders that team's games that are missing
+    os.remove(rendered["2023_02_KC_JAX"])
+    assert list(render_season(2023, str(output_dir), team_abbr="KC", workers=1, skip_existing=True)) == [
+        "2023_02_KC_JAX"
+    ]
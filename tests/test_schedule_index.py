@@ -0,0 +1,100 @@
+import os
+import time
+from unittest.mock import patch
+
+import polars as pl
+
+from src import schedule_index
+
+
+def _schedule(home_score=None):
+    return pl.DataFrame(
+        {
+            "game_id": ["2023_02_KC_JAX", "2023_01_DET_KC"],
+            "season": [2023, 2023],
+            "home_team": ["JAX", "KC"],
+            "away_team": ["KC", "DET"],
+            "home_score": home_score if home_score is not None else [9, 20],
+        }
+    )
+
+
+@patch("nflreadpy.load_schedules")
+def test_get_game_and_team_lookups_share_one_load(mock_load_schedules):
+    mock_load_schedules.return_value = _schedule()
+
+    assert schedule_index.get_game("2023_01_DET_KC")["home_team"] == "KC"
+    assert schedule_index.get_game("2023_05_NOT_HERE") is None
+    assert schedule_index.get_game("invalid") is None
+
+    kc_games = schedule_index.get_team_games(2023, "KC")
+    assert [g["game_id"] for g in kc_games] == ["2023_01_DET_KC", "2023_02_KC_JAX"]
+    assert schedule_index.get_team_games(2023, "NON") == []
+
+    mock_load_schedules.assert_called_once_with(seasons=[2023])
+
+
+@patch("nflreadpy.load_schedules")
+def test_schedule_persisted_between_processes(mock_load_schedules):
+    mock_load_schedules.return_value = _schedule()
+    schedule_index.load_season(2023)
+
+    # A new process starts with an empty in-memory index but a warm disk cache
+    schedule_index.clear_cache()
+    assert schedule_index.get_game("2023_02_KC_JAX")["away_team"] == "KC"
+    assert mock_load_schedules.call_count == 1
+
+
+@patch("nflreadpy.load_schedules")
+def test_stale_incomplete_season_is_refetched(mock_load_schedules):
+    mock_load_schedules.return_value = _schedule(home_score=[None, 20])
+    schedule_index.load_season(2023)
+
+    path = schedule_index.get_schedule_path(2023)
+    stale = time.time() - schedule_index.SCHEDULE_TTL_SECONDS - 1
+    os.utime(path, (stale, stale))
+
+    schedule_index.clear_cache()
+    schedule_index.load_season(2023)
+    assert mock_load_schedules.call_count == 2
+
+
+@patch("nflreadpy.load_schedules")
+def test_load_seasons_fetches_missing_seasons_together(mock_load_schedules):
+    mock_load_schedules.return_value = pl.DataFrame(
+        {
+            "game_id": ["2022_01_BUF_LA", "2023_01_DET_KC"],
+            "season": [2022, 2023],
+            "home_team": ["LA", "KC"],
+            "away_team": ["BUF", "DET"],
+            "home_score": [10, 20],
+        }
+    )
+
+    combined = schedule_index.load_seasons([2023, 2022])
+    assert combined["game_id"].to_list() == ["2022_01_BUF_LA", "2023_01_DET_KC"]
+    assert schedule_index.get_team_games(2022, "BUF")[0]["game_id"] == "2022_01_BUF_LA"
+    mock_load_schedules.assert_called_once_with(seasons=[2022, 2023])
+
+
+@patch("nflreadpy.load_schedules")
+def test_franchise_games_are_lookups_across_abbreviations(mock_load_schedules):
+    mock_load_schedules.return_value = pl.DataFrame(
+        {
+            "game_id": ["2019_01_DEN_OAK", "2020_01_LV_CAR", "2020_02_NO_LV"],
+            "season": [2019, 2020, 2020],
+            "home_team": ["OAK", "CAR", "LV"],
+            "away_team": ["DEN", "LV", "NO"],
+            "home_score": [24, 30, 34],
+        }
+    )
+    schedule_index.load_seasons([2019, 2020])
+
+    # Indexed seasons are served from the (season, franchise) lists without recombining schedules
+    with patch("src.schedule_index.load_seasons", side_effect=AssertionError("reloaded")):
+        games = schedule_index.get_franchise_games([2020, 2019], "OAK")
+        assert [g["game_id"] for g in games] == ["2019_01_DEN_OAK", "2020_01_LV_CAR", "2020_02_NO_LV"]
+        assert schedule_index.get_franchise_games([2019, 2020], "LV") == games
+        assert [g["game_id"] for g in schedule_index.get_team_games(2019, "LV")] == ["2019_01_DEN_OAK"]
+        assert schedule_index.get_franchise_games([2019], "NON") == []
+    mock_load_schedules.assert_called_once_with(seasons=[2019, 2020])
@@ -9,7 +9,9 @@ from src.score_over_time import (
     load_game_info,
     get_sorted_plays,
     plot_scores,
+    to_plot_frame,
 )
+from src import pbp_store
 
 
 def test_get_season_from_game_id():
@@ -51,11 +53,11 @@ def test_get_game_id_and_metadata_invalid_format():
     assert metadata_df is None
 
 
-@patch("src.score_over_time.get_game_id_and_metadata")
+@patch("src.score_over_time.get_game_row")
 @patch("nflreadpy.load_pbp")
-def test_load_plays_for_game_success(mock_load_pbp, mock_get_metadata):
+def test_load_plays_for_game_success(mock_load_pbp, mock_get_game_row):
     game_id = "2023_01_DET_KC"
-    mock_get_metadata.return_value = (game_id, pd.DataFrame([{"game_id": game_id}]))
+    mock_get_game_row.return_value = {"game_id": game_id}
 
     mock_pbp_data = {
         "game_id": [game_id, "other_game"],
@@ -67,9 +69,12 @@ def test_load_plays_for_game_success(mock_load_pbp, mock_get_metadata):
 
     df = load_plays_for_game(game_id, 2023)
 
-    assert not df.empty
+    assert isinstance(df, pl.DataFrame)
+    assert not df.is_empty()
     assert len(df) == 1
-    assert df.iloc[0]["game_id"] == game_id
+    assert df["game_id"][0] == game_id
+    # Only the projected play columns are loaded
+    assert set(df.columns) <= set(pbp_store.PLAY_COLUMNS)
 
 
 def test_get_sorted_plays():
@@ -78,24 +83,48 @@ def test_get_sorted_plays():
     # Q1 Mid: 3150 remaining (7:30 left in Q1)
     # Q2 Start: 2700 remaining
     data = {"qtr": [2, 1, 1], "game_seconds_remaining": [2700, 3150, 3600]}
-    df = pd.DataFrame(data)
+    df = pl.DataFrame(data)
     sorted_df = get_sorted_plays(df)
 
     # Expected order: Q1 3600 (Start), Q1 3150 (Mid), Q2 2700 (Start)
     # Sort descending by game_seconds_remaining (highest remaining = earliest)
-    assert sorted_df.iloc[0]["qtr"] == 1
-    assert sorted_df.iloc[0]["game_seconds_remaining"] == 3600
-    assert sorted_df.iloc[1]["qtr"] == 1
-    assert sorted_df.iloc[1]["game_seconds_remaining"] == 3150
-    assert sorted_df.iloc[2]["qtr"] == 2
+    assert sorted_df["qtr"].to_list() == [1, 1, 2]
+    assert sorted_df["game_seconds_remaining"].to_list() == [3600, 3150, 2700]
 
     # Check game_seconds_elapsed
     # 3600 - 3600 = 0
     # 3600 - 3150 = 450
     # 3600 - 2700 = 900
-    assert sorted_df.iloc[0]["game_seconds_elapsed"] == 0
-    assert sorted_df.iloc[1]["game_seconds_elapsed"] == 450
-    assert sorted_df.iloc[2]["game_seconds_elapsed"] == 900
+    assert sorted_df["game_seconds_elapsed"].to_list() == [0, 450, 900]
+
+
+def test_get_sorted_plays_overtime():
+    # Out-of-order feed of a regular-season OT game; the two plays at 2:00 left
+    # in OT share a clock value and must keep their feed order
+    df = pl.DataFrame(
+        {
+            "game_id": ["2023_05_KC_MIN"] * 5,
+            "play_id": [40, 10, 20, 41, 30],
+            "qtr": [5, 4, 4, 5, 5],
+            "quarter_seconds_remaining": [120, 30, 0, 120, 600],
+            "game_seconds_remaining": [120, 30, 0, 120, 600],
+        }
+    )
+    sorted_df = get_sorted_plays(df)
+
+    assert sorted_df["play_id"].to_list() == [10, 20, 30, 40, 41]
+    assert sorted_df["game_seconds_elapsed"].to_list() == [3570, 3600, 3600, 4080, 4080]
+
+
+def test_to_plot_frame():
+    df = pl.DataFrame({"qtr": [1.0, 2.0], "posteam": ["KC", None]})
+    plot_df = to_plot_frame(df)
+
+    assert isinstance(plot_df, pd.DataFrame)
+    assert plot_df["qtr"].tolist() == [1.0, 2.0]
+    assert plot_df["posteam"].iloc[0] == "KC"
+    assert plot_df["posteam"].isna().iloc[1]
+    assert to_plot_frame(plot_df) is plot_df
 
 
 @patch("matplotlib.pyplot.show")
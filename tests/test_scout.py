@@ -0,0 +1,161 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src import scout
+from src.scout import format_status, scan_sources
+
+PAGE = (
+    "<html><body><article><h2>2026 NFL Mock Draft 3.0</h2>"
+    '<time datetime="2026-03-18T09:00:00Z">March 18</time></article></body></html>'
+)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves /<name> pages with an ETag, answering matching conditional GETs with a 304."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("If-None-Match")))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if self.path.startswith("/missing"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = f'"{server.version}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = PAGE.encode()
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.in_flight = server.max_in_flight = 0
+    server.delay = 0
+    server.version = 1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def registry_for(server, names):
+    host, port = server.server_address
+    return {
+        name: {"author": f"Author {name}", "date": "2026-03-01", "url": f"http://{host}:{port}/{name}"}
+        for name in names
+    }
+
+
+def test_unchanged_pages_cost_a_304_and_no_parse(stand_in):
+    registry = registry_for(stand_in, ["a", "b", "missing"])
+
+    first = scan_sources(registry)
+    assert [r["status"] for r in first] == ["changed", "changed", "link_error"]
+    assert first[0]["extracted"] == {"has_mock": True, "mock_date": "2026-03-18"}
+    assert first[0]["newer"]
+    assert format_status(first[0]) == "🚨 OUTDATED (newer mock 2026-03-18)"
+    assert format_status(first[2]) == "⚠️ Link Error (404)"
+
+    stand_in.requests.clear()
+    with patch("src.scout.extract_page", side_effect=AssertionError("parsed")) as extract:
+        second = scan_sources(registry)
+    assert [r["status"] for r in second] == ["unchanged", "unchanged", "link_error"]
+    assert second[0]["extracted"] == {"has_mock": True, "mock_date": "2026-03-18"}
+    assert format_status(second[0]) == "🚨 OUTDATED (newer mock 2026-03-18) (unchanged since last scan)"
+    extract.assert_not_called()
+    # Conditional GETs carry the cached validators
+    assert sorted(stand_in.requests) == [("/a", '"1"'), ("/b", '"1"'), ("/missing", None)]
+
+    # A changed page is fetched and read again
+    stand_in.version = 2
+    assert [r["status"] for r in scan_sources(registry)][:2] == ["changed", "changed"]
+
+
+def test_cache_version_bump_rereads_pages(stand_in, monkeypatch):
+    registry = registry_for(stand_in, ["a"])
+    scan_sources(registry)
+
+    monkeypatch.setattr(scout, "SCOUT_VERSION", scout.SCOUT_VERSION + 1)
+    stand_in.requests.clear()
+    assert scan_sources(registry)[0]["status"] == "changed"
+    assert stand_in.requests == [("/a", None)]
+
+
+def test_scan_is_concurrent_within_per_host_limit(stand_in):
+    stand_in.delay = 0.05
+    registry = registry_for(stand_in, [f"page{i}" for i in range(100)])
+
+    start = time.perf_counter()
+    results = scan_sources(registry, max_workers=16, per_host=4)
+    elapsed = time.perf_counter() - start
+
+    assert [r["source_id"] for r in results] == list(registry)
+    assert all(r["status"] == "changed" for r in results)
+    assert stand_in.max_in_flight <= 4
+    # 100 sequential requests would take at least 5 s
+    assert elapsed < 100 * stand_in.delay / 2
+
+
+def test_local_date_decides_newer(stand_in):
+    registry = registry_for(stand_in, ["a"])
+    registry["a"]["date"] = "2026-03-18"
+
+    result = scan_sources(registry)[0]
+    assert not result["newer"]
+    assert format_status(result) == "✅ Up to date (latest mock 2026-03-18)"
+
+
+def test_connection_errors_are_reported(stand_in):
+    registry = {"down": {"author": "Nobody", "date": "2026-03-01", "url": "http://127.0.0.1:9/down"}}
+
+    result = scan_sources(registry, timeout=2)[0]
+    assert result["status"] == "error"
+    assert format_status(result).startswith("❌ Error: ")
+
+
+def test_extraction_and_cache_errors_stay_per_source(stand_in):
+    registry = registry_for(stand_in, ["a", "b", "c"])
+
+    def extract(response, source=None):
+        if response.url.endswith("/b"):
+            raise ValueError("bad page")
+        return {"has_mock": True, "mock_date": "2026-03-18"}
+
+    real_write = scout._write_cached
+
+    def write(url, response, extracted):
+        if url.endswith("/c"):
+            raise OSError("disk full")
+        real_write(url, response, extracted)
+
+    with patch("src.scout.extract_page", side_effect=extract), patch("src.scout._write_cached", side_effect=write):
+        results = scan_sources(registry)
+    assert [r["status"] for r in results] == ["changed", "error", "error"]
+    assert [r["error"] for r in results] == [None, "bad page", "disk full"]
+    assert results[0]["newer"]
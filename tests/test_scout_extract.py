@@ -0,0 +1,103 @@
+import datetime
+
+import pytest
+
+from src.scout_extract import (
+    DEFAULT_PROFILE,
+    SOURCE_PROFILES,
+    extract_stream,
+    get_profile,
+    parse_date,
+    parse_selector,
+)
+
+
+def chunks_until(html, stop_marker, size=64):
+    """Yields html in small chunks, failing if the parser reads past stop_marker."""
+    stop = html.index(stop_marker)
+    for start in range(0, len(html), size):
+        if start > stop:
+            raise AssertionError("read past the extracted date")
+        yield html[start:start + size].encode()
+
+
+def test_parse_date_formats():
+    assert parse_date("2026-03-18T09:00:00Z") == datetime.date(2026, 3, 18)
+    assert parse_date("Updated Mar. 4, 2026 at 9am") == datetime.date(2026, 3, 4)
+    assert parse_date("Posted 3/24/2026") == datetime.date(2026, 3, 24)
+    # The earliest date in the text wins, and impossible dates are skipped
+    assert parse_date("2026-02-30 then April 1, 2026 or 2026-04-02") == datetime.date(2026, 4, 1)
+    assert parse_date("no date here") is None
+
+
+def test_parse_selector():
+    assert parse_selector("time[datetime]") == ("time", [("datetime", None, None)])
+    assert parse_selector("meta[property=article:published_time]") == (
+        "meta",
+        [("property", "=", "article:published_time")],
+    )
+    assert parse_selector("span.timestamp[class*=date]") == (
+        "span",
+        [("class", "~=", "timestamp"), ("class", "*=", "date")],
+    )
+    with pytest.raises(ValueError):
+        parse_selector("div > span")
+
+
+def test_profiles_fill_in_defaults():
+    profile = get_profile("ESPN")
+    assert profile["date_selectors"] == SOURCE_PROFILES["ESPN"]["date_selectors"]
+    assert profile["mock_pattern"] == DEFAULT_PROFILE["mock_pattern"]
+    assert get_profile("Unknown Outlet") == DEFAULT_PROFILE
+
+
+def test_stops_at_first_date_after_mock():
+    html = (
+        "<html><head><script>var mock = '2020-01-01';</script></head><body>"
+        '<nav>Latest: <time datetime="2026-02-01">Feb 1</time> Free agency grades</nav>'
+        "<article><h2>NFL Mock Draft 4.0</h2>"
+        '<span class="timestamp">March 27, 2026</span></article>'
+        + "<p>Older story, 2026-01-05, mock 1.0</p>" * 500
+        + "</body></html>"
+    )
+
+    result = extract_stream(chunks_until(html, "March 27"), get_profile("ESPN"))
+    assert result == {"has_mock": True, "mock_date": "2026-03-27"}
+
+
+def test_head_metadata_describes_the_page():
+    html = (
+        '<html><head><meta property="article:published_time" content="2026-03-16T12:00:00Z">'
+        '<meta property="og:title" content="Post-FA Mock Draft"></head>'
+        "<body>" + "<p>filler</p>" * 1000 + "</body></html>"
+    )
+
+    result = extract_stream(chunks_until(html, "<body>"), get_profile("PFF"))
+    assert result == {"has_mock": True, "mock_date": "2026-03-16"}
+
+
+def test_without_mock_or_date():
+    assert extract_stream([b"<p>Free agency tracker, March 3, 2026</p>"]) == {
+        "has_mock": False,
+        "mock_date": None,
+    }
+    assert extract_stream(["<p>Mock draft coming ", "soon</p>"]) == {
+        "has_mock": True,
+        "mock_date": None,
+    }
+
+
+def test_multibyte_characters_split_across_chunks():
+    html = "<h1>Mock draft — Señor</h1><p>March 5, 2026</p>".encode()
+    split = html.index("ñ".encode()) + 1
+    assert extract_stream([html[:split], html[split:]])["mock_date"] == "2026-03-05"
+
+
+def test_text_date_split_across_chunks():
+    html = "<p>Mock draft</p><p>Posted March 18, 2026</p>"
+    split = html.index("18,")
+    assert extract_stream([html[:split], html[split:]])["mock_date"] == "2026-03-18"
+    # A date already read in an earlier block is not found again in the carried-over text
+    html = "<p>March 2, 2026</p><p>Mock draft</p><p>Posted March 18, 2026</p>"
+    split = html.index("18,")
+    assert extract_stream([html[:split], html[split:]])["mock_date"] == "2026-03-18"
@@ -0,0 +1,180 @@
+import numpy as np
+import polars as pl
+import pytest
+from src.simulation import (
+    AWAY,
+    HOME,
+    MAX_SCORE,
+    build_transition_model,
+    get_opening_receiver,
+    score_histograms,
+    simulate_games,
+    summarize_histograms,
+    format_summary,
+    get_shard_sizes,
+    run_simulation,
+    counter_uniforms,
+    replay_iteration,
+    simulation_key,
+)
+from src.cli import main
+from src.play_by_play import display_play_by_play
+
+
+def _historical_plays(games=4, plays_per_game=130, seed=0):
+    rng = np.random.default_rng(seed)
+    n = games * plays_per_game
+    play_type = rng.choice(["run", "pass", "punt", "field_goal"], n, p=[0.45, 0.45, 0.06, 0.04])
+    return pl.DataFrame(
+        {
+            "game_id": np.repeat([f"2023_{g:02d}_DET_KC" for g in range(games)], plays_per_game),
+            "play_type": play_type,
+            "posteam": rng.choice(["KC", "DET", "JAX"], n),
+            "down": rng.integers(1, 5, n).astype(float),
+            "yards_gained": rng.integers(-3, 13, n).astype(float),
+            "interception": (rng.random(n) < 0.02).astype(float),
+            "fumble_lost": (rng.random(n) < 0.01).astype(float),
+            "kick_distance": np.where(play_type == "punt", 45.0, np.where(play_type == "field_goal", 40.0, np.nan)),
+            "field_goal_result": np.where(play_type == "field_goal", "made", None),
+            "game_seconds_remaining": np.tile(np.linspace(3600, 0, plays_per_game), games),
+        }
+    )
+
+
+def test_build_transition_model_pools_by_offense_and_down():
+    plays = _historical_plays()
+    model = build_transition_model(plays, "KC", "DET")
+
+    assert model["teams"] == ("KC", "DET")
+    assert (model["counts"][:, 1:] > 0).all()
+    # KC's third-down pool only holds KC third-down runs and passes
+    start, count = model["starts"][HOME, 3], model["counts"][HOME, 3]
+    expected = plays.filter(
+        pl.col("play_type").is_in(["run", "pass"]) & (pl.col("posteam") == "KC") & (pl.col("down") == 3)
+    )
+    assert count == len(expected)
+    assert sorted(model["yards"][start : start + count]) == sorted(expected["yards_gained"].cast(int))
+    assert model["field_goal_rates"][2] == 1.0
+    assert (model["seconds"] > 0).all()
+
+
+def test_build_transition_model_requires_scrimmage_plays():
+    with pytest.raises(ValueError):
+        build_transition_model(pl.DataFrame({"play_type": ["punt"], "down": [4.0]}), "KC", "DET")
+
+
+def test_get_opening_receiver():
+    plays = pl.DataFrame({"posteam": [None, "DET", "KC"]})
+    assert get_opening_receiver(plays, "KC", "DET") == AWAY
+    assert get_opening_receiver(plays, "DET", "KC") == HOME
+
+
+def test_simulate_games_is_reproducible_and_complete():
+    model = build_transition_model(_historical_plays(), "KC", "DET")
+
+    first = simulate_games(model, AWAY, 500, seed=7)
+    second = simulate_games(model, AWAY, 500, seed=7)
+    np.testing.assert_array_equal(first["home_scores"], second["home_scores"])
+    np.testing.assert_array_equal(first["away_scores"], second["away_scores"])
+
+    assert (first["home_scores"] >= 0).all() and (first["away_scores"] >= 0).all()
+    assert first["home_scores"].sum() + first["away_scores"].sum() > 0
+    assert (first["plays"] > 50).all()
+
+    summary = summarize_histograms(score_histograms(first), "KC", "DET")
+    assert summary["iterations"] == 500
+    assert summary["home_win_prob"] + summary["away_win_prob"] + summary["tie_prob"] == pytest.approx(1.0)
+    assert summary["home_score_mean"] == pytest.approx(first["home_scores"].mean())
+    assert summary["margin_percentiles"][50] == int(
+        np.percentile(first["home_scores"] - first["away_scores"], 50, method="inverted_cdf")
+    )
+    assert "Win probability: KC" in format_summary(summary)
+
+
+def test_score_histograms_clip_large_scores():
+    result = {"home_scores": np.array([3, 150]), "away_scores": np.array([0, 7])}
+    histograms = score_histograms(result)
+    assert histograms["home"][MAX_SCORE] == 1
+    assert histograms["margin"].sum() == 2
+
+
+def test_simulate_ten_thousand_games_in_one_batch():
+    # Timed against its budget by the simulate_games benchmark
+    model = build_transition_model(_historical_plays(), "KC", "DET")
+    result = simulate_games(model, HOME, 10_000, seed=1)
+    assert len(result["home_scores"]) == 10_000
+
+    # Each iteration's random stream depends only on its index, so the batch
+    # equals the same iterations simulated in two parts
+    first = simulate_games(model, HOME, 4_000, seed=1)
+    rest = simulate_games(model, HOME, 6_000, seed=1, first_iteration=4_000)
+    for column in ["home_scores", "away_scores", "plays"]:
+        np.testing.assert_array_equal(result[column], np.concatenate([first[column], rest[column]]))
+
+
+def test_get_shard_sizes():
+    assert get_shard_sizes(25, shard_size=10) == [10, 10, 5]
+    assert get_shard_sizes(20, shard_size=10) == [10, 10]
+    assert get_shard_sizes(0, shard_size=10) == []
+
+
+def test_run_simulation_identical_for_any_worker_count():
+    model = build_transition_model(_historical_plays(), "KC", "DET")
+
+    serial = run_simulation(model, AWAY, 2500, seed=11, workers=1, shard_size=1000)
+    parallel = run_simulation(model, AWAY, 2500, seed=11, workers=3, shard_size=1000)
+
+    assert serial["margin"].sum() == 2500
+    for key in ("home", "away", "margin"):
+        np.testing.assert_array_equal(serial[key], parallel[key])
+
+    # Shard boundaries do not matter either
+    unsharded = run_simulation(model, AWAY, 2500, seed=11, workers=1, shard_size=2500)
+    np.testing.assert_array_equal(serial["margin"], unsharded["margin"])
+
+    other_seed = run_simulation(model, AWAY, 2500, seed=12, workers=1, shard_size=1000)
+    assert not np.array_equal(serial["margin"], other_seed["margin"])
+
+
+def test_run_simulation_rejects_no_iterations():
+    model = build_transition_model(_historical_plays(), "KC", "DET")
+    for n in (0, -5):
+        with pytest.raises(ValueError):
+            run_simulation(model, AWAY, n, seed=1)
+
+
+def test_cli_iterations_must_be_positive(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["sim", "2023_01_DET_KC", "-n", "0"])
+    assert excinfo.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
+
+
+def test_counter_uniforms_streams_per_iteration():
+    key = simulation_key(5)
+    batch = counter_uniforms(key, np.arange(100), step=3)
+    assert batch.shape == (100, 3)
+    assert ((batch >= 0) & (batch < 1)).all()
+    np.testing.assert_array_equal(batch[42], counter_uniforms(key, [42], step=3)[0])
+    assert not np.array_equal(batch[42], counter_uniforms(key, [42], step=4)[0])
+    assert not np.array_equal(batch[42], counter_uniforms(simulation_key(6), [42], step=3)[0])
+
+
+def test_replay_iteration_matches_batch(capsys):
+    model = build_transition_model(_historical_plays(), "KC", "DET")
+    batch = simulate_games(model, AWAY, 100, seed=3)
+
+    for index in (0, 42, 99):
+        play_log = replay_iteration(model, AWAY, 3, index)
+        assert play_log[-1]["home_score"] == batch["home_scores"][index]
+        assert play_log[-1]["away_score"] == batch["away_scores"][index]
+        assert len(play_log) == batch["plays"][index]
+
+    # Iterations of a later shard replay identically as well
+    shard = simulate_games(model, AWAY, 10, seed=3, first_iteration=40)
+    assert shard["home_scores"][2] == batch["home_scores"][42]
+
+    display_play_by_play(play_log)
+    out = capsys.readouterr().out
+    assert "--- Play-by-Play Data ---" in out
+    assert "[   N/A] Q1 - (1 & 10 at " in out
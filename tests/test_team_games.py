@@ -1,7 +1,12 @@
 import pytest
 from unittest.mock import patch
 import polars as pl
-from src.team_games import fetch_team_games, display_team_games
+from src.team_games import (
+    display_query_results,
+    display_team_games,
+    fetch_team_games,
+    query_team_games,
+)
 
 @patch("nflreadpy.load_schedules")
 def test_fetch_team_games_success(mock_load_schedules):
@@ -49,3 +54,75 @@ def test_display_team_games_with_data(capsys):
     assert "Games for KC in 2023:" in captured.out
     assert "Game ID              | Home  | Away  | Score" in captured.out
     assert "2023_01_DET_KC       | KC    | DET   | KC 20 - DET 21" in captured.out
+
+@patch("nflreadpy.load_schedules")
+def test_fetch_team_games_across_franchise_history(mock_load_schedules):
+    mock_load_schedules.return_value = pl.DataFrame({
+        "game_id": ["2019_01_DEN_OAK", "2019_02_OAK_KC", "2020_01_LV_CAR", "2020_02_NO_LV", "2020_02_KC_LAC"],
+        "season": [2019, 2019, 2020, 2020, 2020],
+        "home_team": ["OAK", "KC", "CAR", "LV", "LAC"],
+        "away_team": ["DEN", "OAK", "LV", "NO", "KC"],
+        "home_score": [24, 28, 30, 34, 20],
+        "away_score": [16, 10, 34, 24, 23]
+    })
+
+    games = fetch_team_games(2019, "LV", 2020)
+
+    # Both seasons are fetched in one call and matched by franchise, not by abbreviation
+    mock_load_schedules.assert_called_once_with(seasons=[2019, 2020])
+    assert [game["game_id"] for game in games] == [
+        "2019_01_DEN_OAK", "2019_02_OAK_KC", "2020_01_LV_CAR", "2020_02_NO_LV"
+    ]
+    assert [game["game_id"] for game in fetch_team_games(2020, "OAK")] == ["2020_01_LV_CAR", "2020_02_NO_LV"]
+
+@patch("nflreadpy.load_schedules")
+def test_query_team_games_filters_across_seasons(mock_load_schedules):
+    def load_schedules(seasons):
+        return pl.DataFrame({
+            "game_id": [f"{s}_{w:02d}_{a}_{h}" for s in seasons for w, a, h in [(1, "DEN", "KC"), (2, "KC", "LAC"), (3, "SD", "KC"), (4, "NE", "NYJ")]],
+            "season": [s for s in seasons for _ in range(4)],
+            "week": [w for _ in seasons for w in range(1, 5)],
+            "home_team": [h for _ in seasons for h in ["KC", "LAC", "KC", "NYJ"]],
+            "away_team": [a for _ in seasons for a in ["DEN", "KC", "SD", "NE"]],
+            "home_score": [x for _ in seasons for x in [27, 20, 30, 10]],
+            "away_score": [x for _ in seasons for x in [24, 20, 10, 3]],
+        })
+    mock_load_schedules.side_effect = load_schedules
+
+    # All KC one-score games since 2010
+    one_score = query_team_games("KC", range(2010, 2025), max_margin=8)
+    assert mock_load_schedules.call_count == 1
+    assert len(one_score) == 2 * 15
+    assert set(one_score["result"]) == {"W", "T"}
+
+    road = query_team_games("KC", [2023], side="away")
+    assert road["game_id"].to_list() == ["2023_02_KC_LAC"]
+    assert road.row(0, named=True)["opponent"] == "LAC"
+
+    blowouts = query_team_games("LAC", range(2015, 2018), weeks=(3, 4), min_margin=14, result="L")
+    assert blowouts["game_id"].to_list() == ["2015_03_SD_KC", "2016_03_SD_KC", "2017_03_SD_KC"]
+    assert blowouts["margin"].to_list() == [-20, -20, -20]
+
+    # Later queries are served from the cached Parquet files
+    query_team_games("KC", range(2010, 2025), result="W")
+    assert mock_load_schedules.call_count == 1
+
+
+def test_display_query_results_streams_rows(capsys):
+    results = pl.DataFrame({
+        "game_id": [f"2023_{w:02d}_DET_KC" for w in range(1, 6)],
+        "week": list(range(1, 6)),
+        "team": ["KC"] * 5,
+        "opponent": ["DET"] * 5,
+        "side": ["home"] * 5,
+        "team_score": [20, 21, 22, 23, None],
+        "opponent_score": [21, 20, 22, 10, None],
+        "result": ["L", "W", "T", "W", None],
+    })
+    display_query_results(results, "2023", "KC", batch_size=2)
+
+    out = capsys.readouterr().out
+    assert "Games for KC in 2023:" in out
+    assert "2023_04_DET_KC       |  4 | KC   | DET  | home | 23-10   | W" in out
+    assert "2023_05_DET_KC       |  5 | KC   | DET  | home | N/A" in out
+    assert "5 games." in out
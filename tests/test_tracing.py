@@ -0,0 +1,58 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src import tracing
+from src.cli import main
+
+
+@pytest.fixture(autouse=True)
+def tracing_disabled():
+    tracing.disable()
+    yield
+    tracing.disable()
+
+
+def test_disabled_is_no_op():
+    assert not tracing.enabled()
+    with tracing.span("pbp.load") as span:
+        tracing.count("rows_scanned", 10)
+    # One shared context object, nothing recorded
+    assert span is tracing.span("other")
+
+
+def test_json_lines_with_nested_counters(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracing.enable(str(path))
+    with tracing.span("view", game_id="2023_01_DET_KC"):
+        with tracing.span("pbp.load"):
+            tracing.count("rows_scanned", 150)
+            tracing.count("bytes_loaded", 4096)
+        with tracing.span("figure.build"):
+            tracing.count("rows_scanned", 50)
+    tracing.disable()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    # Spans are written as they finish, children before their parent
+    assert [r["span"] for r in records] == ["pbp.load", "figure.build", "view"]
+    assert records[0]["depth"] == 1 and records[2]["depth"] == 0
+    assert records[0]["counters"] == {"rows_scanned": 150, "bytes_loaded": 4096}
+    assert records[2]["counters"] == {"rows_scanned": 200, "bytes_loaded": 4096}
+    assert records[2]["args"] == {"game_id": "2023_01_DET_KC"}
+    assert records[2]["duration_ms"] >= records[0]["duration_ms"]
+
+
+@patch("nflreadpy.load_schedules")
+def test_cli_chrome_trace(mock_load_schedules, schedule, tmp_path, capsys):
+    mock_load_schedules.return_value = schedule
+    path = tmp_path / "trace.json"
+    main(["find", "KC", "2023", "--trace", str(path)])
+
+    assert "Games for KC in 2023:" in capsys.readouterr().out
+    events = {event["name"]: event for event in json.loads(path.read_text())["traceEvents"]}
+    assert {"find", "schedule.load", "schedule.fetch", "filter"} <= set(events)
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events.values())
+    assert events["schedule.fetch"]["args"]["rows_scanned"] == len(schedule)
+    assert events["filter"]["args"]["rows_matched"] == 2
+    assert not tracing.enabled()
@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import numpy as np
+import polars as pl
+
+from src import transition_tables
+from src.transition_tables import (
+    TABLE_SHAPE,
+    TURNOVER_OUTCOME,
+    aggregate_plays,
+    build_tables,
+    load_table,
+    state_cells,
+)
+from src.simulation import (
+    AWAY,
+    build_transition_model,
+    replay_iteration,
+    simulate_games,
+    with_transition_table,
+)
+
+
+def _season_plays(games, plays_per_game=150, seed=0):
+    rng = np.random.default_rng(seed)
+    n = len(games) * plays_per_game
+    return pl.DataFrame(
+        {
+            "game_id": np.repeat(games, plays_per_game),
+            "play_type": rng.choice(["run", "pass", "punt", None], n, p=[0.45, 0.45, 0.05, 0.05]),
+            "posteam": rng.choice(["KC", "DET"], n),
+            "down": rng.integers(1, 5, n).astype(float),
+            "ydstogo": rng.integers(1, 15, n).astype(float),
+            "yardline_100": rng.integers(1, 100, n).astype(float),
+            "score_differential": rng.integers(-21, 22, n).astype(float),
+            "game_seconds_remaining": np.tile(np.linspace(3600, 0, plays_per_game), len(games)),
+            "yards_gained": rng.integers(-5, 20, n).astype(float),
+            "interception": (rng.random(n) < 0.03).astype(float),
+            "fumble_lost": np.zeros(n),
+        }
+    )
+
+
+def test_state_cells_buckets():
+    cells = state_cells([1, 4], [3, 11], [10, 99], [-17, 17], [3600, 0])
+    assert np.unravel_index(cells[0], TABLE_SHAPE[:-1]) == (0, 0, 0, 0, 5)
+    assert np.unravel_index(cells[1], TABLE_SHAPE[:-1]) == (3, 3, 5, 6, 0)
+
+
+def test_aggregate_plays_counts_scrimmage_outcomes():
+    plays = _season_plays(["2023_01_DET_KC"])
+    table = aggregate_plays(plays)
+
+    scrimmage = plays.filter(pl.col("play_type").is_in(["run", "pass"]))
+    assert table["counts"].sum() == len(scrimmage)
+    assert table["counts"][..., TURNOVER_OUTCOME].sum() == scrimmage["interception"].sum()
+    assert table["outcome_plays"].sum() == len(scrimmage)
+    assert table["game_ids"] == {"2023_01_DET_KC"}
+
+
+@patch("nflreadpy.load_pbp")
+def test_build_tables_is_incremental(mock_load_pbp, tmp_path):
+    first_week = _season_plays(["2023_01_DET_KC", "2023_01_ARI_WAS"])
+    mock_load_pbp.return_value = first_week
+    assert build_tables([2023]) == 2
+
+    table = load_table()
+    assert isinstance(table["counts"], np.memmap)
+    assert table["game_ids"] == {"2023_01_DET_KC", "2023_01_ARI_WAS"}
+
+    # A new week adds one game; only that game is aggregated
+    second_week = pl.concat([first_week, _season_plays(["2023_02_KC_JAX"], seed=1)])
+    mock_load_pbp.return_value = second_week
+    assert build_tables([2023]) == 0  # Nothing new without refreshing the store
+    with patch.object(transition_tables, "aggregate_plays", wraps=aggregate_plays) as aggregate:
+        assert build_tables([2023], refresh=True) == 1
+        assert aggregate.call_args[0][0]["game_id"].unique().to_list() == ["2023_02_KC_JAX"]
+
+    np.testing.assert_array_equal(load_table()["counts"], aggregate_plays(second_week)["counts"])
+
+
+def test_table_model_simulates_and_replays():
+    plays = _season_plays([f"2023_{week:02d}_DET_KC" for week in range(1, 30)])
+    model = with_transition_table(build_transition_model(plays, "KC", "DET"), aggregate_plays(plays))
+
+    batch = simulate_games(model, AWAY, 200, seed=4)
+    assert (batch["home_scores"] + batch["away_scores"] > 0).any()
+
+    play_log = replay_iteration(model, AWAY, 4, 17)
+    assert play_log[-1]["home_score"] == batch["home_scores"][17]
+    assert play_log[-1]["away_score"] == batch["away_scores"][17]
@@ -0,0 +1,126 @@
+import json
+import time
+from unittest.mock import patch
+
+import polars as pl
+
+from src import utils
+from src.utils import (
+    DEFAULT_HOME_COLORS,
+    DEFAULT_VISITOR_COLORS,
+    franchise_id,
+    franchise_ids,
+    get_distinct_colors,
+    get_franchise,
+    get_team,
+    get_team_colors_map,
+    get_team_registry_path,
+    load_team_registry,
+)
+
+TEAMS = pl.DataFrame(
+    {
+        "team_abbr": ["KC", "DET"],
+        "team_name": ["Kansas City Chiefs", "Detroit Lions"],
+        "team_nick": ["Chiefs", "Lions"],
+        "team_conf": ["AFC", "NFC"],
+        "team_division": ["AFC West", "NFC North"],
+        "team_color": ["#E31837", "#0076B6"],
+        "team_color2": ["#FFB612", None],
+    }
+)
+
+
+def _new_process(monkeypatch):
+    """Drops the in-process registry, as a freshly started process would have."""
+    monkeypatch.setattr(utils, "_TEAM_REGISTRY", None)
+
+
+def _age_snapshot(seconds):
+    path = get_team_registry_path()
+    with open(path, encoding="utf-8") as f:
+        registry = json.load(f)
+    registry["fetched_at"] -= seconds
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(registry, f)
+
+
+@patch("nflreadpy.load_teams")
+def test_registry_is_fetched_once_and_reused_from_disk(mock_load_teams, monkeypatch):
+    mock_load_teams.return_value = TEAMS
+
+    assert get_team("KC")["name"] == "Kansas City Chiefs"
+    assert get_team_colors_map()["DET"] == {"primary": "#0076B6", "secondary": "#FFFFFF"}
+
+    _new_process(monkeypatch)
+    assert get_team("DET")["division"] == "NFC North"
+    mock_load_teams.assert_called_once()
+
+
+@patch("nflreadpy.load_teams")
+def test_stale_registry_is_refetched(mock_load_teams, monkeypatch):
+    mock_load_teams.return_value = TEAMS
+    load_team_registry()
+    _age_snapshot(utils.TEAM_REGISTRY_TTL_SECONDS + 1)
+
+    _new_process(monkeypatch)
+    registry = load_team_registry()
+
+    assert mock_load_teams.call_count == 2
+    assert time.time() - registry["fetched_at"] < 60
+
+
+@patch("nflreadpy.load_teams")
+def test_offline_falls_back_to_last_snapshot(mock_load_teams, monkeypatch, capsys):
+    mock_load_teams.return_value = TEAMS
+    load_team_registry()
+    _age_snapshot(utils.TEAM_REGISTRY_TTL_SECONDS + 1)
+
+    _new_process(monkeypatch)
+    mock_load_teams.side_effect = ConnectionError("offline")
+
+    assert get_team_colors_map()["KC"]["primary"] == "#E31837"
+    assert "using snapshot from" in capsys.readouterr().out
+
+
+@patch("nflreadpy.load_teams")
+def test_registry_version_change_forces_refetch(mock_load_teams, monkeypatch):
+    mock_load_teams.return_value = TEAMS
+    load_team_registry()
+
+    _new_process(monkeypatch)
+    monkeypatch.setattr(utils, "TEAM_REGISTRY_VERSION", utils.TEAM_REGISTRY_VERSION + 1)
+    assert load_team_registry()["version"] == utils.TEAM_REGISTRY_VERSION
+    assert mock_load_teams.call_count == 2
+
+
+@patch("nflreadpy.load_teams")
+def test_offline_without_snapshot_returns_empty(mock_load_teams):
+    mock_load_teams.side_effect = ConnectionError("offline")
+    assert get_team_colors_map() == {}
+    assert get_team("KC") is None
+
+
+def test_default_colors_are_distinct_hex():
+    assert get_distinct_colors(DEFAULT_HOME_COLORS, DEFAULT_VISITOR_COLORS) == ("#0000FF", "#FF0000")
+
+
+def test_franchise_ids_resolve_historical_abbreviations():
+    ids = franchise_ids(["SD", "LAC", "OAK", "LV", "STL", "LAR", "LA", "NON", None])
+
+    assert ids[0] == ids[1] == franchise_id("LAC")
+    assert ids[2] == ids[3]
+    assert ids[4] == ids[5] == ids[6]
+    assert list(ids[7:]) == [-1, -1]
+    assert get_franchise("OAK") == "LV"
+    assert get_franchise("KC") == "KC"
+
+
+@patch("nflreadpy.load_teams")
+def test_colors_resolve_through_franchise(mock_load_teams):
+    mock_load_teams.return_value = pl.DataFrame(
+        {"team_abbr": ["LV"], "team_color": ["#000000"], "team_color2": ["#A5ACAF"]}
+    )
+
+    assert get_team_colors_map()["OAK"] == {"primary": "#000000", "secondary": "#A5ACAF"}
+    assert get_team("OAK")["abbr"] == "LV"